@@ -35,109 +35,53 @@ __version__ = "2.0.0"
 # 为了优化启动时间，我们使用延迟导入策略
 # 只在实际使用时才导入重量级模块
 
-def __getattr__(name):
-    """延迟导入支持，优化启动性能"""
-    # 配置模块 - 轻量级，立即导入
-    if name == 'settings':
-        from rag5.config import settings
-        return settings
-    elif name == 'config':  # 向后兼容
-        from rag5.config import settings
-        return settings
-
-    # 核心代理模块 - 延迟导入
-    elif name == 'SimpleRAGAgent':
-        from rag5.core import SimpleRAGAgent
-        return SimpleRAGAgent
-    elif name == 'ask':
-        from rag5.core import ask
-        return ask
-    elif name == 'AgentInitializer':
-        from rag5.core import AgentInitializer
-        return AgentInitializer
-    elif name == 'MessageProcessor':
-        from rag5.core import MessageProcessor
-        return MessageProcessor
-    elif name == 'ConversationHistory':
-        from rag5.core import ConversationHistory
-        return ConversationHistory
-    elif name == 'ErrorHandler':
-        from rag5.core import ErrorHandler
-        return ErrorHandler
-    elif name == 'RetryHandler':
-        from rag5.core import RetryHandler
-        return RetryHandler
-    elif name == 'SYSTEM_PROMPT':
-        from rag5.core import SYSTEM_PROMPT
-        return SYSTEM_PROMPT
-    elif name == 'SEARCH_TOOL_DESCRIPTION':
-        from rag5.core import SEARCH_TOOL_DESCRIPTION
-        return SEARCH_TOOL_DESCRIPTION
-
-    # 工具模块 - 延迟导入
-    elif name == 'tool_registry':
-        from rag5.tools import tool_registry
-        return tool_registry
-    elif name == 'get_tools':
-        from rag5.tools import get_tools
-        return get_tools
-    elif name == 'search_knowledge_base':
-        from rag5.tools import search_knowledge_base
-        return search_knowledge_base
-    elif name == 'get_search_tool':
-        from rag5.tools import get_search_tool
-        return get_search_tool
-    elif name == 'OllamaEmbeddingsManager':
-        from rag5.tools import OllamaEmbeddingsManager
-        return OllamaEmbeddingsManager
-    elif name == 'QdrantManager':
-        from rag5.tools import QdrantManager
-        return QdrantManager
-    elif name == 'ConnectionManager':
-        from rag5.tools import ConnectionManager
-        return ConnectionManager
-
-    # 数据摄取模块 - 延迟导入
-    elif name == 'IngestionPipeline':
-        from rag5.ingestion import IngestionPipeline
-        return IngestionPipeline
-    elif name == 'IngestionResult':
-        from rag5.ingestion import IngestionResult
-        return IngestionResult
-    elif name == 'BaseLoader':
-        from rag5.ingestion import BaseLoader
-        return BaseLoader
-    elif name == 'TextLoader':
-        from rag5.ingestion import TextLoader
-        return TextLoader
-    elif name == 'PDFLoader':
-        from rag5.ingestion import PDFLoader
-        return PDFLoader
-    elif name == 'MarkdownLoader':
-        from rag5.ingestion import MarkdownLoader
-        return MarkdownLoader
-    elif name == 'RecursiveSplitter':
-        from rag5.ingestion import RecursiveSplitter
-        return RecursiveSplitter
-    elif name == 'BatchVectorizer':
-        from rag5.ingestion import BatchVectorizer
-        return BatchVectorizer
-    elif name == 'VectorUploader':
-        from rag5.ingestion import VectorUploader
-        return VectorUploader
-    elif name == 'UploadResult':
-        from rag5.ingestion import UploadResult
-        return UploadResult
-
-    # 便捷函数 - 延迟导入
-    elif name == 'ingest_directory':
-        return ingest_directory
-    elif name == 'ingest_file':
-        return ingest_file
-    elif name == 'ingest':  # 向后兼容
-        return ingest_directory
-
-    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
+from rag5._lazy import lazy_importer
+
+# 延迟导入表：属性名 -> (模块路径, 模块中的属性名)
+_LAZY = {
+    # 配置模块
+    'settings': ('rag5.config', 'settings'),
+    'config': ('rag5.config', 'settings'),  # 向后兼容
+
+    # 核心代理模块
+    'SimpleRAGAgent': ('rag5.core', 'SimpleRAGAgent'),
+    'ask': ('rag5.core', 'ask'),
+    'AgentInitializer': ('rag5.core', 'AgentInitializer'),
+    'MessageProcessor': ('rag5.core', 'MessageProcessor'),
+    'ConversationHistory': ('rag5.core', 'ConversationHistory'),
+    'ErrorHandler': ('rag5.core', 'ErrorHandler'),
+    'RetryHandler': ('rag5.core', 'RetryHandler'),
+    'SYSTEM_PROMPT': ('rag5.core', 'SYSTEM_PROMPT'),
+    'SEARCH_TOOL_DESCRIPTION': ('rag5.core', 'SEARCH_TOOL_DESCRIPTION'),
+
+    # 工具模块
+    'tool_registry': ('rag5.tools', 'tool_registry'),
+    'get_tools': ('rag5.tools', 'get_tools'),
+    'search_knowledge_base': ('rag5.tools', 'search_knowledge_base'),
+    'get_search_tool': ('rag5.tools', 'get_search_tool'),
+    'OllamaEmbeddingsManager': ('rag5.tools', 'OllamaEmbeddingsManager'),
+    'QdrantManager': ('rag5.tools', 'QdrantManager'),
+    'ConnectionManager': ('rag5.tools', 'ConnectionManager'),
+
+    # 数据摄取模块
+    'IngestionPipeline': ('rag5.ingestion', 'IngestionPipeline'),
+    'IngestionResult': ('rag5.ingestion', 'IngestionResult'),
+    'BaseLoader': ('rag5.ingestion', 'BaseLoader'),
+    'TextLoader': ('rag5.ingestion', 'TextLoader'),
+    'PDFLoader': ('rag5.ingestion', 'PDFLoader'),
+    'MarkdownLoader': ('rag5.ingestion', 'MarkdownLoader'),
+    'RecursiveSplitter': ('rag5.ingestion', 'RecursiveSplitter'),
+    'BatchVectorizer': ('rag5.ingestion', 'BatchVectorizer'),
+    'VectorUploader': ('rag5.ingestion', 'VectorUploader'),
+    'UploadResult': ('rag5.ingestion', 'UploadResult'),
+
+    # 便捷函数
+    'ingest': ('rag5', 'ingest_directory'),  # 向后兼容
+}
+
+
+__getattr__, __dir__ = lazy_importer(globals(), _LAZY)
+
 
 # ============================================================================
 # 便捷函数
@@ -0,0 +1,48 @@
+"""
+包级延迟导入
+
+为包的 __init__ 生成模块级 __getattr__ / __dir__：导出的组件在首次
+访问时才导入，仅导入包或其中某个子模块时不必加载整条依赖链。
+"""
+
+import importlib
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_importer(
+    namespace: Dict[str, Any],
+    lazy: Dict[str, Tuple[str, str]]
+) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    生成支持延迟导入的模块级 __getattr__ 和 __dir__
+
+    参数:
+        namespace: 包的模块命名空间，即包 __init__ 中的 globals()
+        lazy: 延迟导入表，属性名 -> (模块路径, 模块中的属性名)
+
+    返回:
+        (__getattr__, __dir__)
+
+    示例:
+        >>> _LAZY = {'settings': ('rag5.config', 'settings')}
+        >>> __getattr__, __dir__ = lazy_importer(globals(), _LAZY)
+    """
+    module_name = namespace['__name__']
+
+    def __getattr__(name: str) -> Any:
+        """延迟导入支持，优化启动性能"""
+        try:
+            module_path, attr_name = lazy[name]
+        except KeyError:
+            raise AttributeError(f"module '{module_name}' has no attribute '{name}'") from None
+
+        value = getattr(importlib.import_module(module_path), attr_name)
+        # 缓存到模块命名空间，后续访问不再经过 __getattr__
+        namespace[name] = value
+        return value
+
+    def __dir__() -> List[str]:
+        """包含尚未导入的延迟属性，使 dir() 和自动补全能看到全部导出"""
+        return sorted({*namespace, *lazy})
+
+    return __getattr__, __dir__
@@ -27,11 +27,14 @@
     custom_settings = Settings(env_file='.env.test')
 """
 
-from rag5.config.settings import settings, Settings
+from rag5.config.settings import Settings
 from rag5.config.loader import ConfigLoader
-from rag5.config.validator import ConfigValidator
 from rag5.config import defaults
 
+# 导入子模块时包属性 settings 会被绑定为 rag5.config.settings 模块本身，
+# 移除该绑定，使 settings 经由 __getattr__ 解析为延迟创建的配置单例
+del globals()['settings']
+
 __all__ = [
     # 主要接口
     'settings',      # 全局配置单例（推荐使用）
@@ -42,3 +45,21 @@ __all__ = [
     'ConfigValidator',
     'defaults',
 ]
+
+
+def __getattr__(name):
+    """
+    延迟解析 settings 与 ConfigValidator
+
+    settings 在首次访问时才创建；ConfigValidator 在首次访问时才导入，
+    只读取配置的进程无需加载验证器模块。
+    """
+    if name == 'settings':
+        from rag5.config.settings import settings
+        globals()[name] = settings
+        return settings
+    if name == 'ConfigValidator':
+        from rag5.config.validator import ConfigValidator
+        globals()[name] = ConfigValidator
+        return ConfigValidator
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
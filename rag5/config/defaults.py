@@ -4,6 +4,8 @@
 定义所有配置项的默认值。
 """
 
+from types import MappingProxyType
+
 # ============================================================================
 # Ollama 配置默认值
 # ============================================================================
@@ -26,6 +28,12 @@ DEFAULT_OLLAMA_TIMEOUT = 180
 # Ollama 批次大小
 DEFAULT_OLLAMA_BATCH_SIZE = 10
 
+# 异步嵌入时同时发往 Ollama 的最大批次数（应与服务端 OLLAMA_NUM_PARALLEL 一致）
+DEFAULT_OLLAMA_NUM_PARALLEL = 1
+
+# 查询向量 LRU 缓存的最大条目数（0 表示禁用缓存）
+DEFAULT_EMBEDDING_CACHE_SIZE = 10_000
+
 # 嵌入后端类型（"ollama" 或 "lmstudio"）
 DEFAULT_EMBEDDING_BACKEND = "ollama"
 
@@ -49,6 +57,15 @@ DEFAULT_COLLECTION_NAME = "knowledge_base"
 # 向量维度（bge-m3 模型生成 1024 维向量）
 DEFAULT_VECTOR_DIM = 1024
 
+# 是否优先使用 gRPC 协议连接 Qdrant（需要开放 6334 端口）
+DEFAULT_QDRANT_PREFER_GRPC = False
+
+# Qdrant gRPC 端口
+DEFAULT_QDRANT_GRPC_PORT = 6334
+
+# Qdrant 请求超时时间（秒）
+DEFAULT_QDRANT_TIMEOUT = 30
+
 
 # ============================================================================
 # 检索参数默认值
@@ -121,6 +138,9 @@ DEFAULT_MAX_QUERY_LENGTH = 2000
 # 批处理大小
 DEFAULT_BATCH_SIZE = 100
 
+# 同一轮 LLM 输出中并发执行的最大工具调用数
+DEFAULT_TOOL_CONCURRENCY_LIMIT = 4
+
 
 # ============================================================================
 # 日志配置默认值
@@ -282,6 +302,17 @@ DEFAULT_KB_VECTOR_WEIGHT = 0.5
 DEFAULT_KB_ENABLE_RERANK = False
 DEFAULT_KB_RERANK_MODEL = ""
 
+# 默认向量量化方式（"none", "int8", "binary"）
+DEFAULT_KB_QUANTIZATION = "int8"
+
+# 默认向量存储类型（"float32", "float16"）
+DEFAULT_KB_VECTOR_DATATYPE = "float16"
+
+# 默认 HNSW 索引参数
+DEFAULT_KB_HNSW_M = 16
+DEFAULT_KB_HNSW_EF_CONSTRUCT = 128
+DEFAULT_KB_HNSW_EF_SEARCH = 64
+
 # 知识库名称长度限制
 DEFAULT_KB_NAME_MIN_LENGTH = 2
 DEFAULT_KB_NAME_MAX_LENGTH = 64
@@ -297,119 +328,140 @@ DEFAULT_KB_FILE_PROCESSING_TIMEOUT = 300
 # 配置项说明
 # ============================================================================
 
-CONFIG_DESCRIPTIONS = {
-    # Ollama 配置
-    "OLLAMA_HOST": "Ollama 服务地址，格式为 http://host:port",
-    "LLM_MODEL": "大语言模型名称，如 qwen2.5:7b, llama2:7b 等",
-    "EMBED_MODEL": "嵌入模型名称，如 bge-m3, nomic-embed-text 等",
-    "LLM_TIMEOUT": "LLM 请求超时时间（秒）",
-
-    # Qdrant 配置
-    "QDRANT_URL": "Qdrant 向量数据库地址，格式为 http://host:port",
-    "COLLECTION_NAME": "向量集合名称，用于存储文档向量",
-    "VECTOR_DIM": "向量维度，必须与嵌入模型输出维度一致",
-
-    # 检索参数
-    "TOP_K": "检索返回的最大结果数，建议 3-10",
-    "SIMILARITY_THRESHOLD": "相似度阈值，0-1 之间，建议 0.3-0.7",
-    "ENABLE_HYBRID_SEARCH": "是否启用混合搜索（向量+关键词）",
-    "VECTOR_SEARCH_WEIGHT": "混合搜索中向量搜索的权重，0-1 之间",
-    "KEYWORD_SEARCH_WEIGHT": "混合搜索中关键词搜索的权重，0-1 之间",
-    "MIN_SIMILARITY_THRESHOLD": "自适应搜索的最小阈值",
-    "TARGET_RESULTS": "自适应搜索的目标结果数",
-
-    # 分块参数
-    "CHUNK_SIZE": "文档分块大小（字符数），建议 300-1000",
-    "CHUNK_OVERLAP": "分块重叠大小（字符数），建议为 CHUNK_SIZE 的 10-20%",
-    "RESPECT_SENTENCE_BOUNDARY": "是否尊重句子边界（避免在句子中间切分）",
-    "ENABLE_CHINESE_SPLITTER": "是否启用中文优化分块",
-
-    # 请求限制
-    "MAX_QUERY_LENGTH": "最大查询长度（字符数），防止过长查询",
-    "BATCH_SIZE": "批处理大小，用于批量向量化和上传",
-
-    # 日志配置
-    "LOG_LEVEL": "日志级别（DEBUG, INFO, WARNING, ERROR, CRITICAL）",
-    "LOG_FILE": "日志文件路径",
-    "ENABLE_QUERY_LOGGING": "是否启用查询日志",
-    "ENABLE_INGESTION_LOGGING": "是否启用摄取日志",
-    "ENABLE_CONSOLE_LOGGING": "是否同时输出到控制台",
-
-    # 增强日志配置
-    "ENABLE_LLM_LOGGING": "是否启用 LLM 交互日志",
-    "ENABLE_REFLECTION_LOGGING": "是否启用 Agent 反思日志",
-    "ENABLE_CONTEXT_LOGGING": "是否启用对话上下文日志",
-    "LLM_LOG_FILE": "LLM 交互日志文件路径",
-    "REFLECTION_LOG_FILE": "Agent 反思日志文件路径",
-    "CONTEXT_LOG_FILE": "对话上下文日志文件路径",
-    "LOG_PROMPTS": "是否记录 LLM 提示词",
-    "LOG_RESPONSES": "是否记录 LLM 响应",
-    "REDACT_SENSITIVE": "是否对敏感数据进行脱敏处理（已弃用）",
-    "REDACT_PROMPTS": "是否对 LLM 提示词进行脱敏处理",
-    "REDACT_RESPONSES": "是否对 LLM 响应进行脱敏处理",
-    "MAX_LOG_ENTRY_SIZE": "单条日志条目的最大大小（字节）",
-    "ASYNC_LOGGING": "是否启用异步日志写入",
-    "LOG_BUFFER_SIZE": "日志缓冲区大小（条目数）",
-    "ENABLE_LOG_ROTATION": "是否启用日志轮转",
-    "LOG_ROTATION_TYPE": "日志轮转方式（size 或 time）",
-    "LOG_MAX_BYTES": "基于大小的轮转：单个日志文件的最大大小（字节）",
-    "LOG_ROTATION_WHEN": "基于时间的轮转：轮转间隔",
-    "LOG_BACKUP_COUNT": "保留的轮转日志文件数量",
-    "LOG_COMPRESS_ROTATED": "是否自动压缩轮转的日志文件",
-
-    # 统一流程日志配置
-    "ENABLE_FLOW_LOGGING": "是否启用统一流程日志",
-    "FLOW_LOG_FILE": "统一流程日志文件路径",
-    "FLOW_DETAIL_LEVEL": "流程日志详细级别（minimal, normal, verbose）",
-    "FLOW_MAX_CONTENT_LENGTH": "流程日志内容最大长度（字符数）",
-    "FLOW_ASYNC_LOGGING": "是否对流程日志启用异步写入",
-    "KEEP_SEPARATE_LOGS": "是否保留独立的日志文件（向后兼容）",
-    "FLOW_ROTATION_ENABLED": "是否启用流程日志轮转",
-    "FLOW_ROTATION_TYPE": "流程日志轮转方式（size 或 time）",
-    "FLOW_MAX_BYTES": "基于大小的轮转：单个流程日志文件的最大大小（字节）",
-    "FLOW_ROTATION_WHEN": "基于时间的轮转：轮转间隔",
-    "FLOW_BACKUP_COUNT": "保留的流程日志轮转文件数量",
-    "FLOW_COMPRESS_ROTATED": "是否自动压缩轮转的流程日志文件",
-
-    # 知识库管理配置
-    "KB_DATABASE_PATH": "知识库数据库文件路径",
-    "FILE_STORAGE_PATH": "文件存储根目录路径",
-    "SUPPORTED_FILE_FORMATS": "支持的文件格式列表",
-    "MAX_FILE_SIZE": "单个文件的最大大小（字节）",
-    "KB_CHUNK_SIZE": "知识库默认分块大小（字符数）",
-    "KB_CHUNK_OVERLAP": "知识库默认分块重叠大小（字符数）",
-    "KB_PARSER_TYPE": "知识库默认解析器类型（sentence, recursive, semantic）",
-    "KB_SEPARATOR": "知识库默认分隔符",
-    "KB_RETRIEVAL_MODE": "知识库默认检索模式（vector, fulltext, hybrid）",
-    "KB_TOP_K": "知识库默认检索返回的最大结果数",
-    "KB_SIMILARITY_THRESHOLD": "知识库默认相似度阈值（0-1）",
-    "KB_VECTOR_WEIGHT": "知识库混合检索中向量搜索的权重（0-1）",
-    "KB_ENABLE_RERANK": "知识库是否默认启用重排序",
-    "KB_RERANK_MODEL": "知识库默认重排序模型名称",
-    "KB_NAME_MIN_LENGTH": "知识库名称最小长度",
-    "KB_NAME_MAX_LENGTH": "知识库名称最大长度",
-    "KB_FILE_BATCH_SIZE": "文件处理批次大小",
-    "KB_FILE_PROCESSING_TIMEOUT": "文件处理超时时间（秒）",
-}
+def _build_config_descriptions() -> MappingProxyType:
+    """构建只读的配置项说明表（首次访问 CONFIG_DESCRIPTIONS 时调用）"""
+    return MappingProxyType({
+        # Ollama 配置
+        "OLLAMA_HOST": "Ollama 服务地址，格式为 http://host:port",
+        "LLM_MODEL": "大语言模型名称，如 qwen2.5:7b, llama2:7b 等",
+        "EMBED_MODEL": "嵌入模型名称，如 bge-m3, nomic-embed-text 等",
+        "LLM_TIMEOUT": "LLM 请求超时时间（秒）",
+        "OLLAMA_NUM_PARALLEL": "异步嵌入时同时发往 Ollama 的最大批次数，应与服务端 OLLAMA_NUM_PARALLEL 一致",
+
+        # Qdrant 配置
+        "QDRANT_URL": "Qdrant 向量数据库地址，格式为 http://host:port",
+        "COLLECTION_NAME": "向量集合名称，用于存储文档向量",
+        "VECTOR_DIM": "向量维度，必须与嵌入模型输出维度一致",
+        "QDRANT_PREFER_GRPC": "是否优先使用 gRPC 协议连接 Qdrant（需要开放 6334 端口）",
+        "QDRANT_GRPC_PORT": "Qdrant gRPC 端口",
+        "QDRANT_TIMEOUT": "Qdrant 请求超时时间（秒）",
+
+        # 检索参数
+        "TOP_K": "检索返回的最大结果数，建议 3-10",
+        "SIMILARITY_THRESHOLD": "相似度阈值，0-1 之间，建议 0.3-0.7",
+        "ENABLE_HYBRID_SEARCH": "是否启用混合搜索（向量+关键词）",
+        "VECTOR_SEARCH_WEIGHT": "混合搜索中向量搜索的权重，0-1 之间",
+        "KEYWORD_SEARCH_WEIGHT": "混合搜索中关键词搜索的权重，0-1 之间",
+        "MIN_SIMILARITY_THRESHOLD": "自适应搜索的最小阈值",
+        "TARGET_RESULTS": "自适应搜索的目标结果数",
+
+        # 分块参数
+        "CHUNK_SIZE": "文档分块大小（字符数），建议 300-1000",
+        "CHUNK_OVERLAP": "分块重叠大小（字符数），建议为 CHUNK_SIZE 的 10-20%",
+        "RESPECT_SENTENCE_BOUNDARY": "是否尊重句子边界（避免在句子中间切分）",
+        "ENABLE_CHINESE_SPLITTER": "是否启用中文优化分块",
+
+        # 请求限制
+        "MAX_QUERY_LENGTH": "最大查询长度（字符数），防止过长查询",
+        "BATCH_SIZE": "批处理大小，用于批量向量化和上传",
+        "TOOL_CONCURRENCY_LIMIT": "同一轮 LLM 输出中并发执行的最大工具调用数",
+
+        # 日志配置
+        "LOG_LEVEL": "日志级别（DEBUG, INFO, WARNING, ERROR, CRITICAL）",
+        "LOG_FILE": "日志文件路径",
+        "ENABLE_QUERY_LOGGING": "是否启用查询日志",
+        "ENABLE_INGESTION_LOGGING": "是否启用摄取日志",
+        "ENABLE_CONSOLE_LOGGING": "是否同时输出到控制台",
+
+        # 增强日志配置
+        "ENABLE_LLM_LOGGING": "是否启用 LLM 交互日志",
+        "ENABLE_REFLECTION_LOGGING": "是否启用 Agent 反思日志",
+        "ENABLE_CONTEXT_LOGGING": "是否启用对话上下文日志",
+        "LLM_LOG_FILE": "LLM 交互日志文件路径",
+        "REFLECTION_LOG_FILE": "Agent 反思日志文件路径",
+        "CONTEXT_LOG_FILE": "对话上下文日志文件路径",
+        "LOG_PROMPTS": "是否记录 LLM 提示词",
+        "LOG_RESPONSES": "是否记录 LLM 响应",
+        "REDACT_SENSITIVE": "是否对敏感数据进行脱敏处理（已弃用）",
+        "REDACT_PROMPTS": "是否对 LLM 提示词进行脱敏处理",
+        "REDACT_RESPONSES": "是否对 LLM 响应进行脱敏处理",
+        "MAX_LOG_ENTRY_SIZE": "单条日志条目的最大大小（字节）",
+        "ASYNC_LOGGING": "是否启用异步日志写入",
+        "LOG_BUFFER_SIZE": "日志缓冲区大小（条目数）",
+        "ENABLE_LOG_ROTATION": "是否启用日志轮转",
+        "LOG_ROTATION_TYPE": "日志轮转方式（size 或 time）",
+        "LOG_MAX_BYTES": "基于大小的轮转：单个日志文件的最大大小（字节）",
+        "LOG_ROTATION_WHEN": "基于时间的轮转：轮转间隔",
+        "LOG_BACKUP_COUNT": "保留的轮转日志文件数量",
+        "LOG_COMPRESS_ROTATED": "是否自动压缩轮转的日志文件",
+
+        # 统一流程日志配置
+        "ENABLE_FLOW_LOGGING": "是否启用统一流程日志",
+        "FLOW_LOG_FILE": "统一流程日志文件路径",
+        "FLOW_DETAIL_LEVEL": "流程日志详细级别（minimal, normal, verbose）",
+        "FLOW_MAX_CONTENT_LENGTH": "流程日志内容最大长度（字符数）",
+        "FLOW_ASYNC_LOGGING": "是否对流程日志启用异步写入",
+        "KEEP_SEPARATE_LOGS": "是否保留独立的日志文件（向后兼容）",
+        "FLOW_ROTATION_ENABLED": "是否启用流程日志轮转",
+        "FLOW_ROTATION_TYPE": "流程日志轮转方式（size 或 time）",
+        "FLOW_MAX_BYTES": "基于大小的轮转：单个流程日志文件的最大大小（字节）",
+        "FLOW_ROTATION_WHEN": "基于时间的轮转：轮转间隔",
+        "FLOW_BACKUP_COUNT": "保留的流程日志轮转文件数量",
+        "FLOW_COMPRESS_ROTATED": "是否自动压缩轮转的流程日志文件",
+
+        # 知识库管理配置
+        "KB_DATABASE_PATH": "知识库数据库文件路径",
+        "FILE_STORAGE_PATH": "文件存储根目录路径",
+        "SUPPORTED_FILE_FORMATS": "支持的文件格式列表",
+        "MAX_FILE_SIZE": "单个文件的最大大小（字节）",
+        "KB_CHUNK_SIZE": "知识库默认分块大小（字符数）",
+        "KB_CHUNK_OVERLAP": "知识库默认分块重叠大小（字符数）",
+        "KB_PARSER_TYPE": "知识库默认解析器类型（sentence, recursive, semantic）",
+        "KB_SEPARATOR": "知识库默认分隔符",
+        "KB_RETRIEVAL_MODE": "知识库默认检索模式（vector, fulltext, hybrid）",
+        "KB_TOP_K": "知识库默认检索返回的最大结果数",
+        "KB_SIMILARITY_THRESHOLD": "知识库默认相似度阈值（0-1）",
+        "KB_VECTOR_WEIGHT": "知识库混合检索中向量搜索的权重（0-1）",
+        "KB_ENABLE_RERANK": "知识库是否默认启用重排序",
+        "KB_RERANK_MODEL": "知识库默认重排序模型名称",
+        "KB_NAME_MIN_LENGTH": "知识库名称最小长度",
+        "KB_NAME_MAX_LENGTH": "知识库名称最大长度",
+        "KB_FILE_BATCH_SIZE": "文件处理批次大小",
+        "KB_FILE_PROCESSING_TIMEOUT": "文件处理超时时间（秒）",
+    })
+
+
+def __getattr__(name):
+    """延迟构建 CONFIG_DESCRIPTIONS，避免每次导入配置模块都分配这张大表"""
+    if name == 'CONFIG_DESCRIPTIONS':
+        value = _build_config_descriptions()
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
 
 
 # ============================================================================
 # 配置项分组
 # ============================================================================
 
+# 分组内容在运行期不会修改，使用元组而非列表
 CONFIG_GROUPS = {
-    "ollama": [
+    "ollama": (
         "OLLAMA_HOST",
         "LLM_MODEL",
         "EMBED_MODEL",
         "LLM_TIMEOUT",
-    ],
-    "qdrant": [
+        "OLLAMA_NUM_PARALLEL",
+    ),
+    "qdrant": (
         "QDRANT_URL",
         "COLLECTION_NAME",
         "VECTOR_DIM",
-    ],
-    "retrieval": [
+        "QDRANT_PREFER_GRPC",
+        "QDRANT_GRPC_PORT",
+        "QDRANT_TIMEOUT",
+    ),
+    "retrieval": (
         "TOP_K",
         "SIMILARITY_THRESHOLD",
         "ENABLE_HYBRID_SEARCH",
@@ -417,25 +469,26 @@ CONFIG_GROUPS = {
         "KEYWORD_SEARCH_WEIGHT",
         "MIN_SIMILARITY_THRESHOLD",
         "TARGET_RESULTS",
-    ],
-    "chunking": [
+    ),
+    "chunking": (
         "CHUNK_SIZE",
         "CHUNK_OVERLAP",
         "RESPECT_SENTENCE_BOUNDARY",
         "ENABLE_CHINESE_SPLITTER",
-    ],
-    "limits": [
+    ),
+    "limits": (
         "MAX_QUERY_LENGTH",
         "BATCH_SIZE",
-    ],
-    "logging": [
+        "TOOL_CONCURRENCY_LIMIT",
+    ),
+    "logging": (
         "LOG_LEVEL",
         "LOG_FILE",
         "ENABLE_QUERY_LOGGING",
         "ENABLE_INGESTION_LOGGING",
         "ENABLE_CONSOLE_LOGGING",
-    ],
-    "enhanced_logging": [
+    ),
+    "enhanced_logging": (
         "ENABLE_LLM_LOGGING",
         "ENABLE_REFLECTION_LOGGING",
         "ENABLE_CONTEXT_LOGGING",
@@ -456,8 +509,8 @@ CONFIG_GROUPS = {
         "LOG_ROTATION_WHEN",
         "LOG_BACKUP_COUNT",
         "LOG_COMPRESS_ROTATED",
-    ],
-    "flow_logging": [
+    ),
+    "flow_logging": (
         "ENABLE_FLOW_LOGGING",
         "FLOW_LOG_FILE",
         "FLOW_DETAIL_LEVEL",
@@ -470,8 +523,8 @@ CONFIG_GROUPS = {
         "FLOW_ROTATION_WHEN",
         "FLOW_BACKUP_COUNT",
         "FLOW_COMPRESS_ROTATED",
-    ],
-    "knowledge_base": [
+    ),
+    "knowledge_base": (
         "KB_DATABASE_PATH",
         "FILE_STORAGE_PATH",
         "SUPPORTED_FILE_FORMATS",
@@ -490,5 +543,5 @@ CONFIG_GROUPS = {
         "KB_NAME_MAX_LENGTH",
         "KB_FILE_BATCH_SIZE",
         "KB_FILE_PROCESSING_TIMEOUT",
-    ],
+    ),
 }
@@ -5,12 +5,41 @@
 """
 
 import os
+import re
+import sys
 import logging
-from typing import Dict, Optional
+from typing import Dict, Iterable, Optional, Tuple
 from pathlib import Path
 
 logger = logging.getLogger(__name__)
 
+# 读取 .env 文件时使用的缓冲区大小
+_READ_BUFFER_SIZE = 1 << 20
+
+# 布尔配置中视为真的取值（小写），其余取值均为假
+_TRUTHY = frozenset({'true', '1', 'yes', 'on', 'y', 't'})
+
+# .env 行匹配：第 1、2 组为键值对，第 3 组为缺少 '=' 的格式错误行；
+# 空行和注释行不产生匹配。行首与 '=' 后的空白由正则吸收，各组只需去除右侧空白
+_ENV_LINE_RE = re.compile(
+    r'^[ \t]*(?:([^\s#=][^=\n]*)=[ \t]*([^\n]*)|([^\s#][^\n]*))',
+    re.MULTILINE
+)
+
+
+def _environ_snapshot() -> Dict[str, str]:
+    """复制 os.environ，并驻留键名以加快后续以字面量键查找时的比较"""
+    intern = sys.intern
+    return {intern(key): value for key, value in os.environ.items()}
+
+
+def _propagate_to_os_environ(env_vars: Dict[str, str]) -> None:
+    """将配置写入 os.environ，值未变化的键跳过，避免多余的 putenv 调用"""
+    environ = os.environ
+    for key, value in env_vars.items():
+        if environ.get(key) != value:
+            environ[key] = value
+
 
 class ConfigLoader:
     """
@@ -18,22 +47,43 @@ class ConfigLoader:
 
     从环境变量和 .env 文件加载配置值。
 
+    构造时对 os.environ 做一次快照，并与 .env 中的配置合并为普通字典，
+    之后的读取直接查这个字典，不再经过 os.environ 的编解码包装。
+    进程运行期间修改了 os.environ 时，需调用 invalidate() 重建快照。
+
     示例:
         >>> loader = ConfigLoader()
         >>> loader.load_env_file('.env')
         >>> host = loader.get_env('OLLAMA_HOST', 'http://localhost:11434')
     """
 
+    # 已解析的 .env 文件：解析后的路径 -> (mtime_ns, 文件大小, 配置项)
+    # 在所有实例间共享，同一文件未修改时只解析一次
+    _parsed_files: Dict[str, Tuple[int, int, Dict[str, str]]] = {}
+
     def __init__(self):
         """初始化配置加载器"""
         self._env_cache: Dict[str, str] = {}
+        self._merged: Dict[str, str] = _environ_snapshot()
 
-    def load_env_file(self, path: str = '.env') -> Dict[str, str]:
+    def load_env_file(
+        self,
+        path: str = '.env',
+        propagate_to_os_environ: bool = False
+    ) -> Dict[str, str]:
         """
         从 .env 文件加载环境变量
 
+        同一文件在未被修改（mtime 与大小不变）时只解析一次，
+        重复调用直接复用首次的解析结果。
+
+        加载的配置只保存在加载器内部的字典中，get_env 系列方法即可读取；
+        需要让子进程或直接读取 os.environ 的第三方库看到这些配置时，
+        传入 propagate_to_os_environ=True。
+
         参数:
             path: .env 文件路径，默认为当前目录下的 .env
+            propagate_to_os_environ: 是否同时写入 os.environ（.env 文件优先）
 
         返回:
             加载的环境变量字典
@@ -47,51 +97,103 @@ class ConfigLoader:
         env_path = Path(path)
 
         if not env_path.exists():
-            logger.warning(f".env 文件不存在: {path}")
+            logger.warning(".env 文件不存在: %s", path)
+            return env_vars
+
+        stat = env_path.stat()
+        resolved = str(env_path.resolve())
+        parsed = ConfigLoader._parsed_files.get(resolved)
+        if parsed is not None and parsed[:2] == (stat.st_mtime_ns, stat.st_size):
+            env_vars = dict(parsed[2])
+            self._env_cache.update(env_vars)
+            self._merged.update(env_vars)
+            if propagate_to_os_environ:
+                _propagate_to_os_environ(env_vars)
+            logger.debug("%s 未修改，复用已解析的 %d 个配置项", path, len(env_vars))
             return env_vars
 
         try:
-            with open(env_path, 'r', encoding='utf-8') as f:
-                for line_num, line in enumerate(f, 1):
-                    # 去除空白字符
-                    line = line.strip()
-
-                    # 跳过空行和注释
-                    if not line or line.startswith('#'):
-                        continue
-
-                    # 解析键值对
-                    if '=' in line:
-                        key, value = line.split('=', 1)
-                        key = key.strip()
-                        value = value.strip()
-
-                        # 移除值两端的引号
-                        if value.startswith('"') and value.endswith('"'):
-                            value = value[1:-1]
-                        elif value.startswith("'") and value.endswith("'"):
-                            value = value[1:-1]
-
-                        env_vars[key] = value
-                        # 同时设置到环境变量中（.env 文件优先）
-                        os.environ[key] = value
-                    else:
-                        logger.warning(f".env 文件第 {line_num} 行格式错误: {line}")
+            # 以 1 MiB 缓冲一次读入整个文件并整体解码，由编译好的正则在 C 层逐行匹配
+            with open(env_path, 'rb', buffering=_READ_BUFFER_SIZE) as f:
+                data = f.read().decode('utf-8')
+            if '\r' in data:
+                data = data.replace('\r\n', '\n').replace('\r', '\n')
+
+            # 行号只在遇到格式错误时才计算，从上一个错误位置增量计数
+            line_num = 1
+            counted_to = 0
+            for match in _ENV_LINE_RE.finditer(data):
+                key, value, invalid = match.groups()
+
+                if invalid is not None:
+                    start = match.start()
+                    line_num += data.count('\n', counted_to, start)
+                    counted_to = start
+                    logger.warning(".env 文件第 %d 行格式错误: %s", line_num, invalid.rstrip())
+                    continue
+
+                # 驻留键名，使其与代码中的字符串字面量键按身份比较即可命中
+                key = sys.intern(key.rstrip())
+                value = value.rstrip()
+
+                # 移除值两端成对的引号
+                if len(value) >= 2 and value[0] == value[-1] and value[0] in ('"', "'"):
+                    value = value[1:-1]
+                else:
+                    # 未加引号的值支持行内注释（# 前需有空白）
+                    comment = value.find(' #')
+                    if comment != -1:
+                        value = value[:comment].rstrip()
+
+                env_vars[key] = value
+
+            if propagate_to_os_environ:
+                _propagate_to_os_environ(env_vars)
 
             self._env_cache.update(env_vars)
-            logger.info(f"成功从 {path} 加载 {len(env_vars)} 个配置项")
+            self._merged.update(env_vars)
+            ConfigLoader._parsed_files[resolved] = (
+                stat.st_mtime_ns, stat.st_size, dict(env_vars)
+            )
+            logger.info("成功从 %s 加载 %d 个配置项", path, len(env_vars))
 
         except Exception as e:
-            logger.error(f"加载 .env 文件失败: {e}")
+            logger.error("加载 .env 文件失败: %s", e)
             raise
 
         return env_vars
 
+    def invalidate(self) -> None:
+        """
+        重建环境变量快照
+
+        在进程运行期间修改了 os.environ 后调用，使后续读取能看到新值。
+        已从 .env 文件加载的配置仍然优先。
+        """
+        self._merged = _environ_snapshot()
+        self._merged.update(self._env_cache)
+
+    def snapshot(self, keys: Optional[Iterable[str]] = None) -> Dict[str, str]:
+        """
+        获取环境变量快照（已合并 .env 配置）的副本
+
+        参数:
+            keys: 只保留这些键，默认返回全部
+
+        返回:
+            环境变量字典
+        """
+        merged = self._merged
+        if keys is None:
+            return dict(merged)
+        # 键视图与目标键集合求交集在 C 层完成，只对命中的键取值
+        return {key: merged[key] for key in merged.keys() & keys}
+
     def get_env(self, key: str, default: Optional[str] = None) -> str:
         """
         获取环境变量值
 
-        首先从系统环境变量中查找，如果不存在则使用默认值。
+        从环境变量快照（已合并 .env 配置）中查找，如果不存在则使用默认值。
 
         参数:
             key: 环境变量名称
@@ -104,14 +206,15 @@ class ConfigLoader:
             >>> loader = ConfigLoader()
             >>> host = loader.get_env('OLLAMA_HOST', 'http://localhost:11434')
         """
-        value = os.environ.get(key)
+        value = self._merged.get(key)
 
         if value is None:
             if default is not None:
-                logger.debug(f"环境变量 {key} 未设置，使用默认值: {default}")
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug("环境变量 %s 未设置，使用默认值: %s", key, default)
                 return default
             else:
-                logger.warning(f"环境变量 {key} 未设置且无默认值")
+                logger.warning("环境变量 %s 未设置且无默认值", key)
                 return ""
 
         return value
@@ -134,7 +237,9 @@ class ConfigLoader:
         try:
             return int(value)
         except ValueError:
-            logger.warning(f"环境变量 {key} 的值 '{value}' 不是有效的整数，使用默认值: {default}")
+            logger.warning(
+                "环境变量 %s 的值 '%s' 不是有效的整数，使用默认值: %s", key, value, default
+            )
             return default
 
     def get_env_float(self, key: str, default: float) -> float:
@@ -155,7 +260,9 @@ class ConfigLoader:
         try:
             return float(value)
         except ValueError:
-            logger.warning(f"环境变量 {key} 的值 '{value}' 不是有效的浮点数，使用默认值: {default}")
+            logger.warning(
+                "环境变量 %s 的值 '%s' 不是有效的浮点数，使用默认值: %s", key, value, default
+            )
             return default
 
     def get_env_bool(self, key: str, default: bool) -> bool:
@@ -173,4 +280,4 @@ class ConfigLoader:
         if not value:
             return default
 
-        return value.lower() in ('true', '1', 'yes', 'on')
+        return value.lower() in _TRUTHY
@@ -4,12 +4,14 @@
 提供统一的配置访问接口，整合配置加载、验证和默认值。
 """
 
+import os
+import sys
 import logging
-from typing import List, Optional
-from pathlib import Path
+import threading
+from types import MappingProxyType
+from typing import Any, Dict, List, Mapping, Optional, Tuple
 
-from rag5.config.loader import ConfigLoader
-from rag5.config.validator import ConfigValidator
+from rag5.config.loader import ConfigLoader, _TRUTHY
 from rag5.config.defaults import (
     DEFAULT_OLLAMA_HOST,
     DEFAULT_LLM_MODEL,
@@ -17,12 +19,16 @@ from rag5.config.defaults import (
     DEFAULT_LLM_TIMEOUT,
     DEFAULT_OLLAMA_TIMEOUT,
     DEFAULT_OLLAMA_BATCH_SIZE,
+    DEFAULT_OLLAMA_NUM_PARALLEL,
     DEFAULT_EMBEDDING_BACKEND,
     DEFAULT_LM_STUDIO_HOST,
     DEFAULT_LM_STUDIO_MODEL,
     DEFAULT_QDRANT_URL,
     DEFAULT_COLLECTION_NAME,
     DEFAULT_VECTOR_DIM,
+    DEFAULT_QDRANT_PREFER_GRPC,
+    DEFAULT_QDRANT_GRPC_PORT,
+    DEFAULT_QDRANT_TIMEOUT,
     DEFAULT_TOP_K,
     DEFAULT_SIMILARITY_THRESHOLD,
     DEFAULT_ENABLE_HYBRID_SEARCH,
@@ -37,6 +43,7 @@ from rag5.config.defaults import (
     DEFAULT_SEPARATORS,
     DEFAULT_MAX_QUERY_LENGTH,
     DEFAULT_BATCH_SIZE,
+    DEFAULT_TOOL_CONCURRENCY_LIMIT,
     DEFAULT_LOG_LEVEL,
     DEFAULT_LOG_FILE,
     DEFAULT_ENABLE_QUERY_LOGGING,
@@ -79,12 +86,83 @@ from rag5.config.defaults import (
 logger = logging.getLogger(__name__)
 
 
+# 项目根目录，作为查找 .env 文件的最后一个候选位置
+_PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# 配置验证失败时附带输出的示例配置
+_VALIDATION_HINT = """
+
+请检查您的 .env 文件。示例配置:
+  OLLAMA_HOST=http://localhost:11434
+  LLM_MODEL=qwen2.5:7b
+  EMBED_MODEL=bge-m3
+  QDRANT_URL=http://localhost:6333
+  COLLECTION_NAME=knowledge_base
+  TOP_K=5
+  SIMILARITY_THRESHOLD=0.3
+  ENABLE_HYBRID_SEARCH=false
+  CHUNK_SIZE=500
+  CHUNK_OVERLAP=50
+  RESPECT_SENTENCE_BOUNDARY=true
+  ENABLE_CHINESE_SPLITTER=true
+  LOG_LEVEL=INFO
+  LOG_FILE=logs/rag_app.log
+  ENABLE_QUERY_LOGGING=true"""
+
+
+# 已找到的 .env 文件：(当前目录, env_file) -> 绝对路径。
+# 相对路径的查找结果取决于当前目录，因此当前目录也是键的一部分；
+# 未找到的结果不缓存，之后创建的 .env 文件仍能被发现
+_ENV_PATH_CACHE: Dict[Tuple[str, str], str] = {}
+
+
+def _resolve_env_path(env_file: str) -> Optional[str]:
+    """
+    定位 .env 文件
+
+    相对路径依次在当前目录、工作目录和项目根目录下查找。
+    找到的结果按当前目录和 env_file 缓存，重复构造 Settings 时只需确认
+    文件仍然存在，不再逐个探测候选路径。
+
+    参数:
+        env_file: .env 文件路径
+
+    返回:
+        找到的文件的绝对路径，不存在时返回 None
+    """
+    if os.path.isabs(env_file):
+        return env_file if os.path.exists(env_file) else None
+
+    cache_key = (os.getcwd(), env_file)
+    cached = _ENV_PATH_CACHE.get(cache_key)
+    if cached is not None and os.path.exists(cached):
+        return cached
+
+    # 依次尝试当前目录、工作目录、项目根目录
+    candidates = (
+        env_file,
+        os.path.join(cache_key[0], env_file),
+        os.path.join(_PROJECT_ROOT, env_file),
+    )
+    for candidate in candidates:
+        if os.path.exists(candidate):
+            path = os.path.abspath(candidate)
+            _ENV_PATH_CACHE[cache_key] = path
+            return path
+
+    _ENV_PATH_CACHE.pop(cache_key, None)
+    return None
+
+
 class Settings:
     """
     配置访问接口类
 
     提供统一的配置访问接口，自动加载环境变量、应用默认值并验证配置。
 
+    配置值在首次访问时读取并缓存在实例上，之后的访问不再经过加载器。
+    运行期间修改了环境变量时，调用 invalidate() 使缓存失效。
+
     示例:
         >>> from rag5.config import settings
         >>> print(settings.ollama_host)
@@ -92,6 +170,271 @@ class Settings:
         >>> settings.validate()
     """
 
+    # 由 _PROP_SPECS 生成的配置属性：属性名 -> (环境变量名, 默认值, 类型, 说明)
+    # 每项对应一个槽位，首次读取时由 __getattr__ 计算并写入
+    _PROP_SPECS = {
+        # Ollama 配置
+        'ollama_host': ('OLLAMA_HOST', DEFAULT_OLLAMA_HOST, str, 'Ollama 服务地址'),
+        'llm_model': ('LLM_MODEL', DEFAULT_LLM_MODEL, str, '大语言模型名称'),
+        'embed_model': ('EMBED_MODEL', DEFAULT_EMBED_MODEL, str, '嵌入模型名称'),
+        'llm_timeout': ('LLM_TIMEOUT', DEFAULT_LLM_TIMEOUT, int, 'LLM 请求超时时间（秒）'),
+        'ollama_timeout': ('OLLAMA_TIMEOUT', DEFAULT_OLLAMA_TIMEOUT, int, 'Ollama 嵌入请求超时时间（秒）'),
+        'ollama_batch_size': ('OLLAMA_BATCH_SIZE', DEFAULT_OLLAMA_BATCH_SIZE, int, 'Ollama 批次大小'),
+        'ollama_num_parallel': ('OLLAMA_NUM_PARALLEL', DEFAULT_OLLAMA_NUM_PARALLEL, int, '异步嵌入时同时发往 Ollama 的最大批次数'),
+        'embedding_backend': ('EMBEDDING_BACKEND', DEFAULT_EMBEDDING_BACKEND, str, '嵌入后端类型（ollama 或 lmstudio）'),
+        'lm_studio_host': ('LM_STUDIO_HOST', DEFAULT_LM_STUDIO_HOST, str, 'LM Studio 服务地址'),
+        'lm_studio_model': ('LM_STUDIO_MODEL', DEFAULT_LM_STUDIO_MODEL, str, 'LM Studio 嵌入模型名称'),
+
+        # Qdrant 配置
+        'qdrant_url': ('QDRANT_URL', DEFAULT_QDRANT_URL, str, 'Qdrant 向量数据库地址'),
+        'collection_name': ('COLLECTION_NAME', DEFAULT_COLLECTION_NAME, str, '向量集合名称'),
+        'vector_dim': ('VECTOR_DIM', DEFAULT_VECTOR_DIM, int, '向量维度'),
+        'qdrant_prefer_grpc': ('QDRANT_PREFER_GRPC', DEFAULT_QDRANT_PREFER_GRPC, bool, '是否优先使用 gRPC 协议连接 Qdrant'),
+        'qdrant_grpc_port': ('QDRANT_GRPC_PORT', DEFAULT_QDRANT_GRPC_PORT, int, 'Qdrant gRPC 端口'),
+        'qdrant_timeout': ('QDRANT_TIMEOUT', DEFAULT_QDRANT_TIMEOUT, int, 'Qdrant 请求超时时间（秒）'),
+
+        # 检索参数
+        'top_k': ('TOP_K', DEFAULT_TOP_K, int, '检索返回的最大结果数'),
+        'similarity_threshold': ('SIMILARITY_THRESHOLD', DEFAULT_SIMILARITY_THRESHOLD, float, '相似度阈值'),
+        'enable_hybrid_search': ('ENABLE_HYBRID_SEARCH', DEFAULT_ENABLE_HYBRID_SEARCH, bool, '是否启用混合搜索（向量+关键词）'),
+        'vector_search_weight': ('VECTOR_SEARCH_WEIGHT', DEFAULT_VECTOR_SEARCH_WEIGHT, float, '混合搜索中向量搜索的权重'),
+        'keyword_search_weight': ('KEYWORD_SEARCH_WEIGHT', DEFAULT_KEYWORD_SEARCH_WEIGHT, float, '混合搜索中关键词搜索的权重'),
+        'min_similarity_threshold': ('MIN_SIMILARITY_THRESHOLD', DEFAULT_MIN_SIMILARITY_THRESHOLD, float, '自适应搜索的最小阈值'),
+        'target_results': ('TARGET_RESULTS', DEFAULT_TARGET_RESULTS, int, '自适应搜索的目标结果数'),
+
+        # 分块参数
+        'chunk_size': ('CHUNK_SIZE', DEFAULT_CHUNK_SIZE, int, '文档分块大小（字符数）'),
+        'chunk_overlap': ('CHUNK_OVERLAP', DEFAULT_CHUNK_OVERLAP, int, '分块重叠大小（字符数）'),
+        'respect_sentence_boundary': ('RESPECT_SENTENCE_BOUNDARY', DEFAULT_RESPECT_SENTENCE_BOUNDARY, bool, '是否尊重句子边界（避免在句子中间切分）'),
+        'enable_chinese_splitter': ('ENABLE_CHINESE_SPLITTER', DEFAULT_ENABLE_CHINESE_SPLITTER, bool, '是否启用中文优化分块'),
+
+        # 请求限制
+        'max_query_length': ('MAX_QUERY_LENGTH', DEFAULT_MAX_QUERY_LENGTH, int, '最大查询长度（字符数）'),
+        'batch_size': ('BATCH_SIZE', DEFAULT_BATCH_SIZE, int, '批处理大小'),
+        'tool_concurrency_limit': ('TOOL_CONCURRENCY_LIMIT', DEFAULT_TOOL_CONCURRENCY_LIMIT, int, '并发执行的最大工具调用数'),
+
+        # 日志配置
+        'log_level': ('LOG_LEVEL', DEFAULT_LOG_LEVEL, str, '日志级别（DEBUG, INFO, WARNING, ERROR, CRITICAL）'),
+        'log_file': ('LOG_FILE', DEFAULT_LOG_FILE, str, '日志文件路径'),
+        'enable_query_logging': ('ENABLE_QUERY_LOGGING', DEFAULT_ENABLE_QUERY_LOGGING, bool, '是否启用查询日志'),
+        'enable_ingestion_logging': ('ENABLE_INGESTION_LOGGING', DEFAULT_ENABLE_INGESTION_LOGGING, bool, '是否启用摄取日志'),
+        'enable_console_logging': ('ENABLE_CONSOLE_LOGGING', DEFAULT_ENABLE_CONSOLE_LOGGING, bool, '是否同时输出到控制台'),
+
+        # 增强日志配置（Enhanced LLM Logging）
+        'enable_llm_logging': ('ENABLE_LLM_LOGGING', DEFAULT_ENABLE_LLM_LOGGING, bool, '是否启用 LLM 交互日志'),
+        'enable_reflection_logging': ('ENABLE_REFLECTION_LOGGING', DEFAULT_ENABLE_REFLECTION_LOGGING, bool, '是否启用 Agent 反思日志'),
+        'enable_context_logging': ('ENABLE_CONTEXT_LOGGING', DEFAULT_ENABLE_CONTEXT_LOGGING, bool, '是否启用对话上下文日志'),
+        'llm_log_file': ('LLM_LOG_FILE', DEFAULT_LLM_LOG_FILE, str, 'LLM 交互日志文件路径'),
+        'reflection_log_file': ('REFLECTION_LOG_FILE', DEFAULT_REFLECTION_LOG_FILE, str, 'Agent 反思日志文件路径'),
+        'context_log_file': ('CONTEXT_LOG_FILE', DEFAULT_CONTEXT_LOG_FILE, str, '对话上下文日志文件路径'),
+        'log_prompts': ('LOG_PROMPTS', DEFAULT_LOG_PROMPTS, bool, '是否记录 LLM 提示词'),
+        'log_responses': ('LOG_RESPONSES', DEFAULT_LOG_RESPONSES, bool, '是否记录 LLM 响应'),
+        'redact_sensitive': ('REDACT_SENSITIVE', DEFAULT_REDACT_SENSITIVE, bool, '是否对敏感数据进行脱敏处理（已弃用，使用 redact_prompts 和 redact_responses）'),
+        'redact_prompts': ('REDACT_PROMPTS', DEFAULT_REDACT_PROMPTS, bool, '是否对 LLM 提示词进行脱敏处理'),
+        'redact_responses': ('REDACT_RESPONSES', DEFAULT_REDACT_RESPONSES, bool, '是否对 LLM 响应进行脱敏处理'),
+        'max_log_entry_size': ('MAX_LOG_ENTRY_SIZE', DEFAULT_MAX_LOG_ENTRY_SIZE, int, '单条日志条目的最大大小（字节）'),
+        'async_logging': ('ASYNC_LOGGING', DEFAULT_ASYNC_LOGGING, bool, '是否启用异步日志写入'),
+        'log_buffer_size': ('LOG_BUFFER_SIZE', DEFAULT_LOG_BUFFER_SIZE, int, '日志缓冲区大小（条目数）'),
+        'enable_log_rotation': ('ENABLE_LOG_ROTATION', DEFAULT_ENABLE_LOG_ROTATION, bool, '是否启用日志轮转'),
+        'log_rotation_type': ('LOG_ROTATION_TYPE', DEFAULT_LOG_ROTATION_TYPE, str, '日志轮转方式（size 或 time）'),
+        'log_max_bytes': ('LOG_MAX_BYTES', DEFAULT_LOG_MAX_BYTES, int, '基于大小的轮转：单个日志文件的最大大小（字节）'),
+        'log_rotation_when': ('LOG_ROTATION_WHEN', DEFAULT_LOG_ROTATION_WHEN, str, '基于时间的轮转：轮转间隔'),
+        'log_backup_count': ('LOG_BACKUP_COUNT', DEFAULT_LOG_BACKUP_COUNT, int, '保留的轮转日志文件数量'),
+        'log_compress_rotated': ('LOG_COMPRESS_ROTATED', DEFAULT_LOG_COMPRESS_ROTATED, bool, '是否自动压缩轮转的日志文件'),
+
+        # 统一流程日志配置（Unified Flow Logging）
+        'enable_flow_logging': ('ENABLE_FLOW_LOGGING', DEFAULT_ENABLE_FLOW_LOGGING, bool, '是否启用统一流程日志'),
+        'flow_log_file': ('FLOW_LOG_FILE', DEFAULT_FLOW_LOG_FILE, str, '统一流程日志文件路径'),
+        'flow_max_content_length': ('FLOW_MAX_CONTENT_LENGTH', DEFAULT_FLOW_MAX_CONTENT_LENGTH, int, '流程日志内容最大长度（字符数）'),
+        'flow_async_logging': ('FLOW_ASYNC_LOGGING', DEFAULT_FLOW_ASYNC_LOGGING, bool, '是否对流程日志启用异步写入'),
+        'keep_separate_logs': ('KEEP_SEPARATE_LOGS', DEFAULT_KEEP_SEPARATE_LOGS, bool, '是否保留独立的日志文件（向后兼容）'),
+        'flow_rotation_enabled': ('FLOW_ROTATION_ENABLED', DEFAULT_FLOW_ROTATION_ENABLED, bool, '是否启用流程日志轮转'),
+        'flow_max_bytes': ('FLOW_MAX_BYTES', DEFAULT_FLOW_MAX_BYTES, int, '基于大小的轮转：单个流程日志文件的最大大小（字节）'),
+        'flow_rotation_when': ('FLOW_ROTATION_WHEN', DEFAULT_FLOW_ROTATION_WHEN, str, '基于时间的轮转：轮转间隔'),
+        'flow_backup_count': ('FLOW_BACKUP_COUNT', DEFAULT_FLOW_BACKUP_COUNT, int, '保留的流程日志轮转文件数量'),
+        'flow_compress_rotated': ('FLOW_COMPRESS_ROTATED', DEFAULT_FLOW_COMPRESS_ROTATED, bool, '是否自动压缩轮转的流程日志文件'),
+    }
+
+    # 内部状态和配置值都存放在固定槽位中，实例没有 __dict__。
+    # 配置值的槽位在首次读取前为空，读取落空时由 __getattr__ 通过
+    # _SLOT_LOADERS 计算并写入槽位，之后的读取直接命中槽位描述符
+    __slots__ = {
+        '_loader': 'ConfigLoader 实例',
+        '_validator': '配置验证器，首次验证时创建',
+        '_validated': '当前配置是否已验证通过',
+        '_env_snapshot': 'Settings 读取的环境变量快照',
+        **{name: spec[3] for name, spec in _PROP_SPECS.items()},
+        'flow_detail_level': '流程日志详细级别（minimal, normal, verbose）',
+        'flow_rotation_type': '流程日志轮转方式（size 或 time）',
+        '_dict_backing': 'to_dict() 返回视图所依托的配置字典',
+    }
+
+    # 文档分隔符列表（不支持环境变量覆盖，直接作为类属性共享）
+    separators: List[str] = DEFAULT_SEPARATORS
+
+    # Settings 读取的全部环境变量名，统一驻留：快照字典以这些对象为键，
+    # 属性读取时传入的同一对象按身份比较即可命中；
+    # 以 frozenset 公开，便于调用方与 os.environ 做集合运算
+    ENV_KEYS: frozenset = frozenset(map(sys.intern, (
+        *(spec[0] for spec in _PROP_SPECS.values()),
+        'FLOW_DETAIL_LEVEL',
+        'FLOW_ROTATION_TYPE',
+    )))
+
+    # 流程日志枚举配置的有效取值
+    _VALID_FLOW_DETAIL_LEVELS = frozenset({'minimal', 'normal', 'verbose'})
+    _VALID_FLOW_DETAIL_LEVELS_STR = 'minimal, normal, verbose'
+    _VALID_FLOW_ROTATION_TYPES = frozenset({'size', 'time'})
+    _VALID_FLOW_ROTATION_TYPES_STR = 'size, time'
+
+    # validate() / to_dict() / print_config() 共用的配置字段
+    _FIELDS = (
+        'ollama_host',
+        'llm_model',
+        'embed_model',
+        'llm_timeout',
+        'ollama_num_parallel',
+        'qdrant_url',
+        'collection_name',
+        'vector_dim',
+        'qdrant_prefer_grpc',
+        'qdrant_grpc_port',
+        'qdrant_timeout',
+        'top_k',
+        'similarity_threshold',
+        'enable_hybrid_search',
+        'vector_search_weight',
+        'keyword_search_weight',
+        'min_similarity_threshold',
+        'target_results',
+        'chunk_size',
+        'chunk_overlap',
+        'respect_sentence_boundary',
+        'enable_chinese_splitter',
+        'max_query_length',
+        'batch_size',
+        'tool_concurrency_limit',
+        'log_level',
+        'log_file',
+        'enable_query_logging',
+        'enable_ingestion_logging',
+        'enable_console_logging',
+        'enable_llm_logging',
+        'enable_reflection_logging',
+        'enable_context_logging',
+        'llm_log_file',
+        'reflection_log_file',
+        'context_log_file',
+        'log_prompts',
+        'log_responses',
+        'redact_sensitive',
+        'redact_prompts',
+        'redact_responses',
+        'max_log_entry_size',
+        'async_logging',
+        'log_buffer_size',
+        'enable_log_rotation',
+        'log_rotation_type',
+        'log_max_bytes',
+        'log_rotation_when',
+        'log_backup_count',
+        'log_compress_rotated',
+        'enable_flow_logging',
+        'flow_log_file',
+        'flow_detail_level',
+        'flow_max_content_length',
+        'flow_async_logging',
+        'keep_separate_logs',
+        'flow_rotation_enabled',
+        'flow_rotation_type',
+        'flow_max_bytes',
+        'flow_rotation_when',
+        'flow_backup_count',
+        'flow_compress_rotated',
+    )
+
+    # print_config 的分组输出表：(分组标题, ((标签, 属性名, 后缀), ...))
+    _PRINT_SECTIONS = (
+        ("Ollama 配置", (
+            ("Host", "ollama_host", ""),
+            ("LLM Model", "llm_model", ""),
+            ("Embed Model", "embed_model", ""),
+            ("Timeout", "llm_timeout", "s"),
+            ("Num Parallel", "ollama_num_parallel", ""),
+        )),
+        ("Qdrant 配置", (
+            ("URL", "qdrant_url", ""),
+            ("Collection", "collection_name", ""),
+            ("Vector Dim", "vector_dim", ""),
+            ("Prefer gRPC", "qdrant_prefer_grpc", ""),
+            ("gRPC Port", "qdrant_grpc_port", ""),
+            ("Timeout", "qdrant_timeout", "s"),
+        )),
+        ("检索参数", (
+            ("Top K", "top_k", ""),
+            ("Similarity Threshold", "similarity_threshold", ""),
+            ("Enable Hybrid Search", "enable_hybrid_search", ""),
+            ("Vector Search Weight", "vector_search_weight", ""),
+            ("Keyword Search Weight", "keyword_search_weight", ""),
+            ("Min Similarity Threshold", "min_similarity_threshold", ""),
+            ("Target Results", "target_results", ""),
+        )),
+        ("分块参数", (
+            ("Chunk Size", "chunk_size", ""),
+            ("Chunk Overlap", "chunk_overlap", ""),
+            ("Respect Sentence Boundary", "respect_sentence_boundary", ""),
+            ("Enable Chinese Splitter", "enable_chinese_splitter", ""),
+        )),
+        ("请求限制", (
+            ("Max Query Length", "max_query_length", ""),
+            ("Batch Size", "batch_size", ""),
+            ("Tool Concurrency Limit", "tool_concurrency_limit", ""),
+        )),
+        ("日志配置", (
+            ("Log Level", "log_level", ""),
+            ("Log File", "log_file", ""),
+            ("Enable Query Logging", "enable_query_logging", ""),
+            ("Enable Ingestion Logging", "enable_ingestion_logging", ""),
+            ("Enable Console Logging", "enable_console_logging", ""),
+        )),
+        ("增强日志配置", (
+            ("Enable LLM Logging", "enable_llm_logging", ""),
+            ("Enable Reflection Logging", "enable_reflection_logging", ""),
+            ("Enable Context Logging", "enable_context_logging", ""),
+            ("LLM Log File", "llm_log_file", ""),
+            ("Reflection Log File", "reflection_log_file", ""),
+            ("Context Log File", "context_log_file", ""),
+            ("Log Prompts", "log_prompts", ""),
+            ("Log Responses", "log_responses", ""),
+            ("Redact Sensitive", "redact_sensitive", " (deprecated)"),
+            ("Redact Prompts", "redact_prompts", ""),
+            ("Redact Responses", "redact_responses", ""),
+            ("Max Log Entry Size", "max_log_entry_size", ""),
+            ("Async Logging", "async_logging", ""),
+            ("Log Buffer Size", "log_buffer_size", ""),
+            ("Enable Log Rotation", "enable_log_rotation", ""),
+            ("Log Rotation Type", "log_rotation_type", ""),
+            ("Log Max Bytes", "log_max_bytes", ""),
+            ("Log Rotation When", "log_rotation_when", ""),
+            ("Log Backup Count", "log_backup_count", ""),
+            ("Log Compress Rotated", "log_compress_rotated", ""),
+        )),
+        ("统一流程日志配置", (
+            ("Enable Flow Logging", "enable_flow_logging", ""),
+            ("Flow Log File", "flow_log_file", ""),
+            ("Flow Detail Level", "flow_detail_level", ""),
+            ("Flow Max Content Length", "flow_max_content_length", ""),
+            ("Flow Async Logging", "flow_async_logging", ""),
+            ("Keep Separate Logs", "keep_separate_logs", ""),
+            ("Flow Rotation Enabled", "flow_rotation_enabled", ""),
+            ("Flow Rotation Type", "flow_rotation_type", ""),
+            ("Flow Max Bytes", "flow_max_bytes", ""),
+            ("Flow Rotation When", "flow_rotation_when", ""),
+            ("Flow Backup Count", "flow_backup_count", ""),
+            ("Flow Compress Rotated", "flow_compress_rotated", ""),
+        )),
+    )
+
     def __init__(self, env_file: str = '.env'):
         """
         初始化配置
@@ -100,405 +443,137 @@ class Settings:
             env_file: .env 文件路径
         """
         self._loader = ConfigLoader()
-        self._validator = ConfigValidator()
+        # 验证器在首次调用 validate() 时才创建
+        self._validator = None
         self._validated = False
 
         # 尝试加载 .env 文件
-        # 如果是相对路径，尝试从多个位置查找
-        env_path = Path(env_file)
-        
-        if not env_path.is_absolute():
-            # 尝试的路径列表
-            search_paths = [
-                env_path,  # 当前目录
-                Path.cwd() / env_file,  # 工作目录
-                Path(__file__).parent.parent.parent / env_file,  # 项目根目录
-            ]
-            
-            for path in search_paths:
-                if path.exists():
-                    env_path = path
-                    break
-        
-        if env_path.exists():
-            self._loader.load_env_file(str(env_path))
+        env_path = _resolve_env_path(env_file)
+        if env_path is not None:
+            self._loader.load_env_file(env_path)
         else:
-            logger.warning(f".env 文件不存在: {env_file}，将使用默认配置")
-
-    # ========================================================================
-    # Ollama 配置属性
-    # ========================================================================
-
-    @property
-    def ollama_host(self) -> str:
-        """Ollama 服务地址"""
-        return self._loader.get_env('OLLAMA_HOST', DEFAULT_OLLAMA_HOST)
-
-    @property
-    def llm_model(self) -> str:
-        """大语言模型名称"""
-        return self._loader.get_env('LLM_MODEL', DEFAULT_LLM_MODEL)
-
-    @property
-    def embed_model(self) -> str:
-        """嵌入模型名称"""
-        return self._loader.get_env('EMBED_MODEL', DEFAULT_EMBED_MODEL)
+            logger.warning(".env 文件不存在: %s，将使用默认配置", env_file)
 
-    @property
-    def llm_timeout(self) -> int:
-        """LLM 请求超时时间（秒）"""
-        return self._loader.get_env_int('LLM_TIMEOUT', DEFAULT_LLM_TIMEOUT)
-
-    @property
-    def ollama_timeout(self) -> int:
-        """Ollama 嵌入请求超时时间（秒）"""
-        return self._loader.get_env_int('OLLAMA_TIMEOUT', DEFAULT_OLLAMA_TIMEOUT)
-
-    @property
-    def ollama_batch_size(self) -> int:
-        """Ollama 批次大小"""
-        return self._loader.get_env_int('OLLAMA_BATCH_SIZE', DEFAULT_OLLAMA_BATCH_SIZE)
-
-    @property
-    def embedding_backend(self) -> str:
-        """嵌入后端类型（ollama 或 lmstudio）"""
-        return self._loader.get_env('EMBEDDING_BACKEND', DEFAULT_EMBEDDING_BACKEND)
-
-    @property
-    def lm_studio_host(self) -> str:
-        """LM Studio 服务地址"""
-        return self._loader.get_env('LM_STUDIO_HOST', DEFAULT_LM_STUDIO_HOST)
-
-    @property
-    def lm_studio_model(self) -> str:
-        """LM Studio 嵌入模型名称"""
-        return self._loader.get_env('LM_STUDIO_MODEL', DEFAULT_LM_STUDIO_MODEL)
-
-    # ========================================================================
-    # Qdrant 配置属性
-    # ========================================================================
-
-    @property
-    def qdrant_url(self) -> str:
-        """Qdrant 向量数据库地址"""
-        return self._loader.get_env('QDRANT_URL', DEFAULT_QDRANT_URL)
-
-    @property
-    def collection_name(self) -> str:
-        """向量集合名称"""
-        return self._loader.get_env('COLLECTION_NAME', DEFAULT_COLLECTION_NAME)
+        # 一次性取出所有相关环境变量，属性首次访问时直接查这个字典
+        self._env_snapshot = self._loader.snapshot(self.ENV_KEYS)
 
-    @property
-    def vector_dim(self) -> int:
-        """向量维度"""
-        return self._loader.get_env_int('VECTOR_DIM', DEFAULT_VECTOR_DIM)
-
-    # ========================================================================
-    # 检索参数属性
-    # ========================================================================
-
-    @property
-    def top_k(self) -> int:
-        """检索返回的最大结果数"""
-        return self._loader.get_env_int('TOP_K', DEFAULT_TOP_K)
-
-    @property
-    def similarity_threshold(self) -> float:
-        """相似度阈值"""
-        return self._loader.get_env_float('SIMILARITY_THRESHOLD', DEFAULT_SIMILARITY_THRESHOLD)
-
-    @property
-    def enable_hybrid_search(self) -> bool:
-        """是否启用混合搜索（向量+关键词）"""
-        return self._loader.get_env_bool('ENABLE_HYBRID_SEARCH', DEFAULT_ENABLE_HYBRID_SEARCH)
-
-    @property
-    def vector_search_weight(self) -> float:
-        """混合搜索中向量搜索的权重"""
-        return self._loader.get_env_float('VECTOR_SEARCH_WEIGHT', DEFAULT_VECTOR_SEARCH_WEIGHT)
-
-    @property
-    def keyword_search_weight(self) -> float:
-        """混合搜索中关键词搜索的权重"""
-        return self._loader.get_env_float('KEYWORD_SEARCH_WEIGHT', DEFAULT_KEYWORD_SEARCH_WEIGHT)
-
-    @property
-    def min_similarity_threshold(self) -> float:
-        """自适应搜索的最小阈值"""
-        return self._loader.get_env_float('MIN_SIMILARITY_THRESHOLD', DEFAULT_MIN_SIMILARITY_THRESHOLD)
-
-    @property
-    def target_results(self) -> int:
-        """自适应搜索的目标结果数"""
-        return self._loader.get_env_int('TARGET_RESULTS', DEFAULT_TARGET_RESULTS)
-
-    # ========================================================================
-    # 分块参数属性
-    # ========================================================================
-
-    @property
-    def chunk_size(self) -> int:
-        """文档分块大小（字符数）"""
-        return self._loader.get_env_int('CHUNK_SIZE', DEFAULT_CHUNK_SIZE)
-
-    @property
-    def chunk_overlap(self) -> int:
-        """分块重叠大小（字符数）"""
-        return self._loader.get_env_int('CHUNK_OVERLAP', DEFAULT_CHUNK_OVERLAP)
-
-    @property
-    def respect_sentence_boundary(self) -> bool:
-        """是否尊重句子边界（避免在句子中间切分）"""
-        return self._loader.get_env_bool('RESPECT_SENTENCE_BOUNDARY', DEFAULT_RESPECT_SENTENCE_BOUNDARY)
-
-    @property
-    def enable_chinese_splitter(self) -> bool:
-        """是否启用中文优化分块"""
-        return self._loader.get_env_bool('ENABLE_CHINESE_SPLITTER', DEFAULT_ENABLE_CHINESE_SPLITTER)
-
-    @property
-    def separators(self) -> List[str]:
-        """文档分隔符列表"""
-        return DEFAULT_SEPARATORS
-
-    # ========================================================================
-    # 请求限制属性
-    # ========================================================================
-
-    @property
-    def max_query_length(self) -> int:
-        """最大查询长度（字符数）"""
-        return self._loader.get_env_int('MAX_QUERY_LENGTH', DEFAULT_MAX_QUERY_LENGTH)
+    def invalidate(self) -> None:
+        """
+        清除已缓存的配置值
 
-    @property
-    def batch_size(self) -> int:
-        """批处理大小"""
-        return self._loader.get_env_int('BATCH_SIZE', DEFAULT_BATCH_SIZE)
+        重建加载器的环境变量快照，下次访问配置属性时重新读取。
+        用于测试或运行期间修改了 os.environ 的场景。
+        """
+        self._loader.invalidate()
+        self._env_snapshot = self._loader.snapshot(self.ENV_KEYS)
+        self._validated = False
+        for name in self._SLOT_LOADERS:
+            try:
+                delattr(self, name)
+            except AttributeError:
+                pass
+
+    def __getattr__(self, name: str) -> Any:
+        """首次读取配置值时计算并写入槽位（仅在槽位为空时调用）"""
+        try:
+            load = self._SLOT_LOADERS[name]
+        except KeyError:
+            raise AttributeError(
+                f"'{type(self).__name__}' object has no attribute '{name}'"
+            ) from None
+        value = load(self)
+        setattr(self, name, value)
+        return value
 
     # ========================================================================
-    # 日志配置属性
+    # 环境变量读取
     # ========================================================================
 
-    @property
-    def log_level(self) -> str:
-        """日志级别（DEBUG, INFO, WARNING, ERROR, CRITICAL）"""
-        return self._loader.get_env('LOG_LEVEL', DEFAULT_LOG_LEVEL)
-
-    @property
-    def log_file(self) -> str:
-        """日志文件路径"""
-        return self._loader.get_env('LOG_FILE', DEFAULT_LOG_FILE)
-
-    @property
-    def enable_query_logging(self) -> bool:
-        """是否启用查询日志"""
-        return self._loader.get_env_bool('ENABLE_QUERY_LOGGING', DEFAULT_ENABLE_QUERY_LOGGING)
-
-    @property
-    def enable_ingestion_logging(self) -> bool:
-        """是否启用摄取日志"""
-        return self._loader.get_env_bool('ENABLE_INGESTION_LOGGING', DEFAULT_ENABLE_INGESTION_LOGGING)
-
-    @property
-    def enable_console_logging(self) -> bool:
-        """是否同时输出到控制台"""
-        return self._loader.get_env_bool('ENABLE_CONSOLE_LOGGING', DEFAULT_ENABLE_CONSOLE_LOGGING)
+    def _get_str(self, key: str, default: str) -> str:
+        """读取字符串配置，未设置时返回默认值"""
+        value = self._env_snapshot.get(key)
+        return default if value is None else value
+
+    def _get_int(self, key: str, default: int, _int=int) -> int:
+        """读取整数配置，未设置或无效时返回默认值"""
+        value = self._env_snapshot.get(key)
+        if not value:
+            return default
+        try:
+            return _int(value)
+        except ValueError:
+            logger.warning("环境变量 %s 的值 '%s' 不是有效的整数，使用默认值: %s", key, value, default)
+            return default
+
+    def _get_float(self, key: str, default: float, _float=float) -> float:
+        """读取浮点数配置，未设置或无效时返回默认值"""
+        value = self._env_snapshot.get(key)
+        if not value:
+            return default
+        try:
+            return _float(value)
+        except ValueError:
+            logger.warning("环境变量 %s 的值 '%s' 不是有效的浮点数，使用默认值: %s", key, value, default)
+            return default
+
+    def _get_bool(self, key: str, default: bool) -> bool:
+        """读取布尔配置，未设置时返回默认值"""
+        value = self._env_snapshot.get(key)
+        if not value:
+            return default
+        return value.lower() in _TRUTHY
 
     # ========================================================================
-    # 增强日志配置属性（Enhanced LLM Logging）
+    # 需要额外处理的配置属性（其余属性由 _PROP_SPECS 生成）
     # ========================================================================
 
-    @property
-    def enable_llm_logging(self) -> bool:
-        """是否启用 LLM 交互日志"""
-        return self._loader.get_env_bool('ENABLE_LLM_LOGGING', DEFAULT_ENABLE_LLM_LOGGING)
-
-    @property
-    def enable_reflection_logging(self) -> bool:
-        """是否启用 Agent 反思日志"""
-        return self._loader.get_env_bool('ENABLE_REFLECTION_LOGGING', DEFAULT_ENABLE_REFLECTION_LOGGING)
-
-    @property
-    def enable_context_logging(self) -> bool:
-        """是否启用对话上下文日志"""
-        return self._loader.get_env_bool('ENABLE_CONTEXT_LOGGING', DEFAULT_ENABLE_CONTEXT_LOGGING)
-
-    @property
-    def llm_log_file(self) -> str:
-        """LLM 交互日志文件路径"""
-        return self._loader.get_env('LLM_LOG_FILE', DEFAULT_LLM_LOG_FILE)
-
-    @property
-    def reflection_log_file(self) -> str:
-        """Agent 反思日志文件路径"""
-        return self._loader.get_env('REFLECTION_LOG_FILE', DEFAULT_REFLECTION_LOG_FILE)
-
-    @property
-    def context_log_file(self) -> str:
-        """对话上下文日志文件路径"""
-        return self._loader.get_env('CONTEXT_LOG_FILE', DEFAULT_CONTEXT_LOG_FILE)
-
-    @property
-    def log_prompts(self) -> bool:
-        """是否记录 LLM 提示词"""
-        return self._loader.get_env_bool('LOG_PROMPTS', DEFAULT_LOG_PROMPTS)
-
-    @property
-    def log_responses(self) -> bool:
-        """是否记录 LLM 响应"""
-        return self._loader.get_env_bool('LOG_RESPONSES', DEFAULT_LOG_RESPONSES)
-
-    @property
-    def redact_sensitive(self) -> bool:
-        """是否对敏感数据进行脱敏处理（已弃用，使用 redact_prompts 和 redact_responses）"""
-        return self._loader.get_env_bool('REDACT_SENSITIVE', DEFAULT_REDACT_SENSITIVE)
-
-    @property
-    def redact_prompts(self) -> bool:
-        """是否对 LLM 提示词进行脱敏处理"""
-        return self._loader.get_env_bool('REDACT_PROMPTS', DEFAULT_REDACT_PROMPTS)
-
-    @property
-    def redact_responses(self) -> bool:
-        """是否对 LLM 响应进行脱敏处理"""
-        return self._loader.get_env_bool('REDACT_RESPONSES', DEFAULT_REDACT_RESPONSES)
-
-    @property
-    def max_log_entry_size(self) -> int:
-        """单条日志条目的最大大小（字节）"""
-        return self._loader.get_env_int('MAX_LOG_ENTRY_SIZE', DEFAULT_MAX_LOG_ENTRY_SIZE)
-
-    @property
-    def async_logging(self) -> bool:
-        """是否启用异步日志写入"""
-        return self._loader.get_env_bool('ASYNC_LOGGING', DEFAULT_ASYNC_LOGGING)
-
-    @property
-    def log_buffer_size(self) -> int:
-        """日志缓冲区大小（条目数）"""
-        return self._loader.get_env_int('LOG_BUFFER_SIZE', DEFAULT_LOG_BUFFER_SIZE)
-
-    @property
-    def enable_log_rotation(self) -> bool:
-        """是否启用日志轮转"""
-        return self._loader.get_env_bool('ENABLE_LOG_ROTATION', DEFAULT_ENABLE_LOG_ROTATION)
-
-    @property
-    def log_rotation_type(self) -> str:
-        """日志轮转方式（size 或 time）"""
-        return self._loader.get_env('LOG_ROTATION_TYPE', DEFAULT_LOG_ROTATION_TYPE)
-
-    @property
-    def log_max_bytes(self) -> int:
-        """基于大小的轮转：单个日志文件的最大大小（字节）"""
-        return self._loader.get_env_int('LOG_MAX_BYTES', DEFAULT_LOG_MAX_BYTES)
-
-    @property
-    def log_rotation_when(self) -> str:
-        """基于时间的轮转：轮转间隔"""
-        return self._loader.get_env('LOG_ROTATION_WHEN', DEFAULT_LOG_ROTATION_WHEN)
-
-    @property
-    def log_backup_count(self) -> int:
-        """保留的轮转日志文件数量"""
-        return self._loader.get_env_int('LOG_BACKUP_COUNT', DEFAULT_LOG_BACKUP_COUNT)
-
-    @property
-    def log_compress_rotated(self) -> bool:
-        """是否自动压缩轮转的日志文件"""
-        return self._loader.get_env_bool('LOG_COMPRESS_ROTATED', DEFAULT_LOG_COMPRESS_ROTATED)
-
-    # ========================================================================
-    # 统一流程日志配置属性（Unified Flow Logging）
-    # ========================================================================
-
-    @property
-    def enable_flow_logging(self) -> bool:
-        """是否启用统一流程日志"""
-        return self._loader.get_env_bool('ENABLE_FLOW_LOGGING', DEFAULT_ENABLE_FLOW_LOGGING)
-
-    @property
-    def flow_log_file(self) -> str:
-        """统一流程日志文件路径"""
-        return self._loader.get_env('FLOW_LOG_FILE', DEFAULT_FLOW_LOG_FILE)
-
-    @property
-    def flow_detail_level(self) -> str:
+    def _load_flow_detail_level(self) -> str:
         """流程日志详细级别（minimal, normal, verbose）"""
-        level = self._loader.get_env('FLOW_DETAIL_LEVEL', DEFAULT_FLOW_DETAIL_LEVEL)
+        level = self._get_str('FLOW_DETAIL_LEVEL', DEFAULT_FLOW_DETAIL_LEVEL)
         # 验证详细级别是否有效
-        valid_levels = ['minimal', 'normal', 'verbose']
-        if level not in valid_levels:
+        if level not in self._VALID_FLOW_DETAIL_LEVELS:
             logger.warning(
-                f"Invalid FLOW_DETAIL_LEVEL '{level}', using default '{DEFAULT_FLOW_DETAIL_LEVEL}'. "
-                f"Valid options: {', '.join(valid_levels)}"
+                "Invalid FLOW_DETAIL_LEVEL '%s', using default '%s'. Valid options: %s",
+                level, DEFAULT_FLOW_DETAIL_LEVEL, self._VALID_FLOW_DETAIL_LEVELS_STR
             )
             return DEFAULT_FLOW_DETAIL_LEVEL
         return level
 
-    @property
-    def flow_max_content_length(self) -> int:
-        """流程日志内容最大长度（字符数）"""
-        return self._loader.get_env_int('FLOW_MAX_CONTENT_LENGTH', DEFAULT_FLOW_MAX_CONTENT_LENGTH)
-
-    @property
-    def flow_async_logging(self) -> bool:
-        """是否对流程日志启用异步写入"""
-        return self._loader.get_env_bool('FLOW_ASYNC_LOGGING', DEFAULT_FLOW_ASYNC_LOGGING)
-
-    @property
-    def keep_separate_logs(self) -> bool:
-        """是否保留独立的日志文件（向后兼容）"""
-        return self._loader.get_env_bool('KEEP_SEPARATE_LOGS', DEFAULT_KEEP_SEPARATE_LOGS)
-
-    @property
-    def flow_rotation_enabled(self) -> bool:
-        """是否启用流程日志轮转"""
-        return self._loader.get_env_bool('FLOW_ROTATION_ENABLED', DEFAULT_FLOW_ROTATION_ENABLED)
-
-    @property
-    def flow_rotation_type(self) -> str:
+    def _load_flow_rotation_type(self) -> str:
         """流程日志轮转方式（size 或 time）"""
-        rotation_type = self._loader.get_env('FLOW_ROTATION_TYPE', DEFAULT_FLOW_ROTATION_TYPE)
+        rotation_type = self._get_str('FLOW_ROTATION_TYPE', DEFAULT_FLOW_ROTATION_TYPE)
         # 验证轮转类型是否有效
-        valid_types = ['size', 'time']
-        if rotation_type not in valid_types:
+        if rotation_type not in self._VALID_FLOW_ROTATION_TYPES:
             logger.warning(
-                f"Invalid FLOW_ROTATION_TYPE '{rotation_type}', using default '{DEFAULT_FLOW_ROTATION_TYPE}'. "
-                f"Valid options: {', '.join(valid_types)}"
+                "Invalid FLOW_ROTATION_TYPE '%s', using default '%s'. Valid options: %s",
+                rotation_type, DEFAULT_FLOW_ROTATION_TYPE, self._VALID_FLOW_ROTATION_TYPES_STR
             )
             return DEFAULT_FLOW_ROTATION_TYPE
         return rotation_type
 
-    @property
-    def flow_max_bytes(self) -> int:
-        """基于大小的轮转：单个流程日志文件的最大大小（字节）"""
-        return self._loader.get_env_int('FLOW_MAX_BYTES', DEFAULT_FLOW_MAX_BYTES)
-
-    @property
-    def flow_rotation_when(self) -> str:
-        """基于时间的轮转：轮转间隔"""
-        return self._loader.get_env('FLOW_ROTATION_WHEN', DEFAULT_FLOW_ROTATION_WHEN)
-
-    @property
-    def flow_backup_count(self) -> int:
-        """保留的流程日志轮转文件数量"""
-        return self._loader.get_env_int('FLOW_BACKUP_COUNT', DEFAULT_FLOW_BACKUP_COUNT)
-
-    @property
-    def flow_compress_rotated(self) -> bool:
-        """是否自动压缩轮转的流程日志文件"""
-        return self._loader.get_env_bool('FLOW_COMPRESS_ROTATED', DEFAULT_FLOW_COMPRESS_ROTATED)
-
     # ========================================================================
     # 验证方法
     # ========================================================================
 
+    @property
+    def _validator_obj(self):
+        """配置验证器，首次使用时才导入并创建"""
+        if self._validator is None:
+            from rag5.config.validator import ConfigValidator
+            self._validator = ConfigValidator()
+        return self._validator
+
+    def _snapshot(self) -> dict:
+        """一次性读取 _FIELDS 中的全部配置，供 validate / print_config / to_dict 共用"""
+        return {name: getattr(self, name) for name in self._FIELDS}
+
     def validate(self) -> None:
         """
         验证所有配置项
 
-        如果配置无效，抛出 ValueError 异常。
+        如果配置无效，抛出 ValueError 异常。配置值只会在 invalidate()
+        后改变，因此验证通过后再次调用直接返回；需要强制重新验证时
+        使用 revalidate()。
 
         异常:
             ValueError: 配置验证失败
@@ -511,88 +586,32 @@ class Settings:
             ... except ValueError as e:
             ...     print(f"配置错误: {e}")
         """
-        # 构建配置字典
-        config = {
-            'ollama_host': self.ollama_host,
-            'llm_model': self.llm_model,
-            'embed_model': self.embed_model,
-            'llm_timeout': self.llm_timeout,
-            'qdrant_url': self.qdrant_url,
-            'collection_name': self.collection_name,
-            'vector_dim': self.vector_dim,
-            'top_k': self.top_k,
-            'similarity_threshold': self.similarity_threshold,
-            'enable_hybrid_search': self.enable_hybrid_search,
-            'vector_search_weight': self.vector_search_weight,
-            'keyword_search_weight': self.keyword_search_weight,
-            'min_similarity_threshold': self.min_similarity_threshold,
-            'target_results': self.target_results,
-            'chunk_size': self.chunk_size,
-            'chunk_overlap': self.chunk_overlap,
-            'respect_sentence_boundary': self.respect_sentence_boundary,
-            'enable_chinese_splitter': self.enable_chinese_splitter,
-            'max_query_length': self.max_query_length,
-            'batch_size': self.batch_size,
-            'log_level': self.log_level,
-            'log_file': self.log_file,
-            'enable_query_logging': self.enable_query_logging,
-            'enable_ingestion_logging': self.enable_ingestion_logging,
-            'enable_console_logging': self.enable_console_logging,
-            'enable_llm_logging': self.enable_llm_logging,
-            'enable_reflection_logging': self.enable_reflection_logging,
-            'enable_context_logging': self.enable_context_logging,
-            'llm_log_file': self.llm_log_file,
-            'reflection_log_file': self.reflection_log_file,
-            'context_log_file': self.context_log_file,
-            'log_prompts': self.log_prompts,
-            'log_responses': self.log_responses,
-            'redact_sensitive': self.redact_sensitive,
-            'redact_prompts': self.redact_prompts,
-            'redact_responses': self.redact_responses,
-            'max_log_entry_size': self.max_log_entry_size,
-            'async_logging': self.async_logging,
-            'log_buffer_size': self.log_buffer_size,
-            'enable_log_rotation': self.enable_log_rotation,
-            'log_rotation_type': self.log_rotation_type,
-            'log_max_bytes': self.log_max_bytes,
-            'log_rotation_when': self.log_rotation_when,
-            'log_backup_count': self.log_backup_count,
-            'log_compress_rotated': self.log_compress_rotated,
-            'enable_flow_logging': self.enable_flow_logging,
-            'flow_log_file': self.flow_log_file,
-            'flow_detail_level': self.flow_detail_level,
-            'flow_max_content_length': self.flow_max_content_length,
-            'flow_async_logging': self.flow_async_logging,
-            'keep_separate_logs': self.keep_separate_logs,
-        }
+        if self._validated:
+            return
+
+        config = self._snapshot()
 
         # 执行验证
-        errors = self._validator.validate_all(config)
+        errors = self._validator_obj.validate_all(config)
 
         if errors:
             error_msg = "配置验证失败:\n" + "\n".join(f"  - {e}" for e in errors)
-            logger.error(error_msg)
-            logger.error("\n请检查您的 .env 文件。示例配置:")
-            logger.error("  OLLAMA_HOST=http://localhost:11434")
-            logger.error("  LLM_MODEL=qwen2.5:7b")
-            logger.error("  EMBED_MODEL=bge-m3")
-            logger.error("  QDRANT_URL=http://localhost:6333")
-            logger.error("  COLLECTION_NAME=knowledge_base")
-            logger.error("  TOP_K=5")
-            logger.error("  SIMILARITY_THRESHOLD=0.3")
-            logger.error("  ENABLE_HYBRID_SEARCH=false")
-            logger.error("  CHUNK_SIZE=500")
-            logger.error("  CHUNK_OVERLAP=50")
-            logger.error("  RESPECT_SENTENCE_BOUNDARY=true")
-            logger.error("  ENABLE_CHINESE_SPLITTER=true")
-            logger.error("  LOG_LEVEL=INFO")
-            logger.error("  LOG_FILE=logs/rag_app.log")
-            logger.error("  ENABLE_QUERY_LOGGING=true")
+            logger.error("%s%s", error_msg, _VALIDATION_HINT)
             raise ValueError(error_msg)
 
         self._validated = True
         logger.info("✓ 配置验证成功")
 
+    def revalidate(self) -> None:
+        """
+        忽略已验证标记，重新验证所有配置项
+
+        异常:
+            ValueError: 配置验证失败
+        """
+        self._validated = False
+        self.validate()
+
     def print_config(self) -> None:
         """
         打印当前配置
@@ -601,155 +620,95 @@ class Settings:
             >>> from rag5.config import settings
             >>> settings.print_config()
         """
-        logger.info("=" * 60)
-        logger.info("当前配置:")
-        logger.info("=" * 60)
-        logger.info("")
-        logger.info("Ollama 配置:")
-        logger.info(f"  - Host: {self.ollama_host}")
-        logger.info(f"  - LLM Model: {self.llm_model}")
-        logger.info(f"  - Embed Model: {self.embed_model}")
-        logger.info(f"  - Timeout: {self.llm_timeout}s")
-        logger.info("")
-        logger.info("Qdrant 配置:")
-        logger.info(f"  - URL: {self.qdrant_url}")
-        logger.info(f"  - Collection: {self.collection_name}")
-        logger.info(f"  - Vector Dim: {self.vector_dim}")
-        logger.info("")
-        logger.info("检索参数:")
-        logger.info(f"  - Top K: {self.top_k}")
-        logger.info(f"  - Similarity Threshold: {self.similarity_threshold}")
-        logger.info(f"  - Enable Hybrid Search: {self.enable_hybrid_search}")
-        logger.info(f"  - Vector Search Weight: {self.vector_search_weight}")
-        logger.info(f"  - Keyword Search Weight: {self.keyword_search_weight}")
-        logger.info(f"  - Min Similarity Threshold: {self.min_similarity_threshold}")
-        logger.info(f"  - Target Results: {self.target_results}")
-        logger.info("")
-        logger.info("分块参数:")
-        logger.info(f"  - Chunk Size: {self.chunk_size}")
-        logger.info(f"  - Chunk Overlap: {self.chunk_overlap}")
-        logger.info(f"  - Respect Sentence Boundary: {self.respect_sentence_boundary}")
-        logger.info(f"  - Enable Chinese Splitter: {self.enable_chinese_splitter}")
-        logger.info("")
-        logger.info("请求限制:")
-        logger.info(f"  - Max Query Length: {self.max_query_length}")
-        logger.info(f"  - Batch Size: {self.batch_size}")
-        logger.info("")
-        logger.info("日志配置:")
-        logger.info(f"  - Log Level: {self.log_level}")
-        logger.info(f"  - Log File: {self.log_file}")
-        logger.info(f"  - Enable Query Logging: {self.enable_query_logging}")
-        logger.info(f"  - Enable Ingestion Logging: {self.enable_ingestion_logging}")
-        logger.info(f"  - Enable Console Logging: {self.enable_console_logging}")
-        logger.info("")
-        logger.info("增强日志配置:")
-        logger.info(f"  - Enable LLM Logging: {self.enable_llm_logging}")
-        logger.info(f"  - Enable Reflection Logging: {self.enable_reflection_logging}")
-        logger.info(f"  - Enable Context Logging: {self.enable_context_logging}")
-        logger.info(f"  - LLM Log File: {self.llm_log_file}")
-        logger.info(f"  - Reflection Log File: {self.reflection_log_file}")
-        logger.info(f"  - Context Log File: {self.context_log_file}")
-        logger.info(f"  - Log Prompts: {self.log_prompts}")
-        logger.info(f"  - Log Responses: {self.log_responses}")
-        logger.info(f"  - Redact Sensitive: {self.redact_sensitive} (deprecated)")
-        logger.info(f"  - Redact Prompts: {self.redact_prompts}")
-        logger.info(f"  - Redact Responses: {self.redact_responses}")
-        logger.info(f"  - Max Log Entry Size: {self.max_log_entry_size}")
-        logger.info(f"  - Async Logging: {self.async_logging}")
-        logger.info(f"  - Log Buffer Size: {self.log_buffer_size}")
-        logger.info(f"  - Enable Log Rotation: {self.enable_log_rotation}")
-        logger.info(f"  - Log Rotation Type: {self.log_rotation_type}")
-        logger.info(f"  - Log Max Bytes: {self.log_max_bytes}")
-        logger.info(f"  - Log Rotation When: {self.log_rotation_when}")
-        logger.info(f"  - Log Backup Count: {self.log_backup_count}")
-        logger.info(f"  - Log Compress Rotated: {self.log_compress_rotated}")
-        logger.info("")
-        logger.info("统一流程日志配置:")
-        logger.info(f"  - Enable Flow Logging: {self.enable_flow_logging}")
-        logger.info(f"  - Flow Log File: {self.flow_log_file}")
-        logger.info(f"  - Flow Detail Level: {self.flow_detail_level}")
-        logger.info(f"  - Flow Max Content Length: {self.flow_max_content_length}")
-        logger.info(f"  - Flow Async Logging: {self.flow_async_logging}")
-        logger.info(f"  - Keep Separate Logs: {self.keep_separate_logs}")
-        logger.info(f"  - Flow Rotation Enabled: {self.flow_rotation_enabled}")
-        logger.info(f"  - Flow Rotation Type: {self.flow_rotation_type}")
-        logger.info(f"  - Flow Max Bytes: {self.flow_max_bytes}")
-        logger.info(f"  - Flow Rotation When: {self.flow_rotation_when}")
-        logger.info(f"  - Flow Backup Count: {self.flow_backup_count}")
-        logger.info(f"  - Flow Compress Rotated: {self.flow_compress_rotated}")
-        logger.info("")
-        logger.info("=" * 60)
-
-    def to_dict(self) -> dict:
+        # INFO 级别被过滤时直接返回，不必读取配置和拼接输出
+        if not logger.isEnabledFor(logging.INFO):
+            return
+
+        config = self._snapshot()
+
+        lines = ["=" * 60, "当前配置:", "=" * 60]
+        for title, items in self._PRINT_SECTIONS:
+            lines.append("")
+            lines.append(f"{title}:")
+            for label, name, suffix in items:
+                lines.append(f"  - {label}: {config[name]}{suffix}")
+        lines.append("")
+        lines.append("=" * 60)
+
+        # 整体输出一次，而不是逐行调用 logger.info
+        logger.info("\n".join(lines))
+
+    def _load_dict_backing(self) -> dict:
+        """to_dict() 返回视图所依托的配置字典，只构建一次"""
+        return self._snapshot()
+
+    def to_dict(self) -> Mapping[str, Any]:
         """
         将配置转换为字典
 
+        返回的是只读视图，多次调用共享同一份底层字典；
+        需要修改时请先复制，例如 dict(settings.to_dict())。
+
         返回:
-            配置字典
+            配置字典（只读）
         """
-        return {
-            'ollama_host': self.ollama_host,
-            'llm_model': self.llm_model,
-            'embed_model': self.embed_model,
-            'llm_timeout': self.llm_timeout,
-            'qdrant_url': self.qdrant_url,
-            'collection_name': self.collection_name,
-            'vector_dim': self.vector_dim,
-            'top_k': self.top_k,
-            'similarity_threshold': self.similarity_threshold,
-            'enable_hybrid_search': self.enable_hybrid_search,
-            'vector_search_weight': self.vector_search_weight,
-            'keyword_search_weight': self.keyword_search_weight,
-            'min_similarity_threshold': self.min_similarity_threshold,
-            'target_results': self.target_results,
-            'chunk_size': self.chunk_size,
-            'chunk_overlap': self.chunk_overlap,
-            'respect_sentence_boundary': self.respect_sentence_boundary,
-            'enable_chinese_splitter': self.enable_chinese_splitter,
-            'max_query_length': self.max_query_length,
-            'batch_size': self.batch_size,
-            'log_level': self.log_level,
-            'log_file': self.log_file,
-            'enable_query_logging': self.enable_query_logging,
-            'enable_ingestion_logging': self.enable_ingestion_logging,
-            'enable_console_logging': self.enable_console_logging,
-            'enable_llm_logging': self.enable_llm_logging,
-            'enable_reflection_logging': self.enable_reflection_logging,
-            'enable_context_logging': self.enable_context_logging,
-            'llm_log_file': self.llm_log_file,
-            'reflection_log_file': self.reflection_log_file,
-            'context_log_file': self.context_log_file,
-            'log_prompts': self.log_prompts,
-            'log_responses': self.log_responses,
-            'redact_sensitive': self.redact_sensitive,
-            'redact_prompts': self.redact_prompts,
-            'redact_responses': self.redact_responses,
-            'max_log_entry_size': self.max_log_entry_size,
-            'async_logging': self.async_logging,
-            'log_buffer_size': self.log_buffer_size,
-            'enable_log_rotation': self.enable_log_rotation,
-            'log_rotation_type': self.log_rotation_type,
-            'log_max_bytes': self.log_max_bytes,
-            'log_rotation_when': self.log_rotation_when,
-            'log_backup_count': self.log_backup_count,
-            'log_compress_rotated': self.log_compress_rotated,
-            'enable_flow_logging': self.enable_flow_logging,
-            'flow_log_file': self.flow_log_file,
-            'flow_detail_level': self.flow_detail_level,
-            'flow_max_content_length': self.flow_max_content_length,
-            'flow_async_logging': self.flow_async_logging,
-            'keep_separate_logs': self.keep_separate_logs,
-            'flow_rotation_enabled': self.flow_rotation_enabled,
-            'flow_rotation_type': self.flow_rotation_type,
-            'flow_max_bytes': self.flow_max_bytes,
-            'flow_rotation_when': self.flow_rotation_when,
-            'flow_backup_count': self.flow_backup_count,
-            'flow_compress_rotated': self.flow_compress_rotated,
-        }
+        return MappingProxyType(self._dict_backing)
+
+
+# ============================================================================
+# 配置值的计算函数
+# ============================================================================
+
+_TYPED_GETTERS = {
+    str: Settings._get_str,
+    int: Settings._get_int,
+    float: Settings._get_float,
+    bool: Settings._get_bool,
+}
+
+
+def _make_config_loader(env_key: str, default, value_type: type):
+    """根据 _PROP_SPECS 中的一项生成配置值的计算函数"""
+    getter = _TYPED_GETTERS[value_type]
+
+    def load(self):
+        return getter(self, env_key, default)
+
+    return load
+
+
+# 槽位名 -> 计算函数，供 Settings.__getattr__ 在槽位为空时调用
+Settings._SLOT_LOADERS = {
+    **{
+        name: _make_config_loader(env_key, default, value_type)
+        for name, (env_key, default, value_type, _) in Settings._PROP_SPECS.items()
+    },
+    'flow_detail_level': Settings._load_flow_detail_level,
+    'flow_rotation_type': Settings._load_flow_rotation_type,
+    '_dict_backing': Settings._load_dict_backing,
+}
 
 
 # ============================================================================
 # 全局配置单例
 # ============================================================================
 
-settings = Settings()
+_settings_lock = threading.Lock()
+
+
+def __getattr__(name):
+    """
+    延迟创建全局配置单例
+
+    settings 在首次访问时才创建，仅导入本模块中其他符号时
+    不会触发 .env 文件的查找和解析。
+    """
+    if name == 'settings':
+        with _settings_lock:
+            value = globals().get('settings')
+            if value is None:
+                value = Settings()
+                # 缓存到模块命名空间，后续访问不再经过 __getattr__
+                globals()['settings'] = value
+        return value
+    raise AttributeError(f"module '{__name__}' has no attribute '{name}'")
@@ -5,11 +5,191 @@
 """
 
 import logging
-from typing import List, Dict, Any, Optional
-from urllib.parse import urlparse
+import operator as _op
+import re
+from collections import deque
+from functools import lru_cache
+from typing import List, Dict, Any, Optional, Deque, Tuple
+
+from pydantic import ConfigDict, Field, TypeAdapter, ValidationError
+from typing_extensions import Annotated, Literal, TypedDict
 
 logger = logging.getLogger(__name__)
 
+# 以 http(s):// 开头，主机部分只含可打印 ASCII 且不含方括号。比 validate_url
+# 更严格：urlparse 会删除制表符和换行、对方括号和部分非 ASCII 字符报错，
+# 这类地址一律交给慢速路径判断
+_Url = Annotated[
+    str, Field(pattern=r'^https?://[^\x00-\x20\x7f-\x{10FFFF}/?#\[\]]+(?:[/?#]|$)')
+]
+# 至少包含一个 isspace() 不视为空白的字符（与 validate_non_empty_string 一致）；
+# 正则的 \s 不含 \x1c-\x1f，需单独排除
+_NonBlankStr = Annotated[str, Field(pattern=r'[^\s\x1c-\x1f]')]
+_PositiveInt = Annotated[int, Field(gt=0)]
+_NonNegativeInt = Annotated[int, Field(ge=0)]
+_UnitFloat = Annotated[float, Field(ge=0.0, le=1.0)]
+
+
+class RAGConfig(TypedDict, total=False):
+    """
+    配置快速校验模型
+
+    由 pydantic-core 一次性完成 validate_all 的全部单字段检查。只接受
+    完全合法且不会产生任何警告的值（严格模式，不做类型转换），
+    因此校验通过即可判定配置有效；不通过时再由 ConfigValidator
+    逐项检查，生成具体的错误和警告信息。
+
+    使用 TypedDict 而非 BaseModel：缺失的键直接跳过，不必填充默认值
+    和构造模型实例。
+    """
+
+    __pydantic_config__ = ConfigDict(strict=True, extra='ignore')
+
+    # Ollama 配置
+    ollama_host: _Url
+    llm_model: _NonBlankStr
+    embed_model: _NonBlankStr
+
+    # Qdrant 配置
+    qdrant_url: _Url
+    collection_name: _NonBlankStr
+
+    # 检索与分块参数
+    top_k: _PositiveInt
+    similarity_threshold: _UnitFloat
+    chunk_size: _PositiveInt
+    chunk_overlap: _NonNegativeInt
+
+    # 其他参数
+    max_query_length: _PositiveInt
+    tool_concurrency_limit: _PositiveInt
+    llm_timeout: _PositiveInt
+    ollama_num_parallel: _PositiveInt
+    vector_dim: _PositiveInt
+    qdrant_grpc_port: Annotated[int, Field(ge=1, le=65535)]
+    qdrant_timeout: _PositiveInt
+
+    # 知识库管理配置
+    kb_database_path: _NonBlankStr
+    file_storage_path: _NonBlankStr
+    max_file_size: _PositiveInt
+    kb_chunk_size: Annotated[int, Field(ge=100, le=2048)]
+    kb_chunk_overlap: Annotated[int, Field(ge=0, le=500)]
+    kb_parser_type: Literal["sentence", "recursive", "semantic"]
+    kb_retrieval_mode: Literal["vector", "fulltext", "hybrid"]
+    kb_top_k: Annotated[int, Field(ge=1, le=100)]
+    kb_similarity_threshold: _UnitFloat
+    kb_vector_weight: _UnitFloat
+    kb_name_min_length: _PositiveInt
+    kb_name_max_length: _PositiveInt
+    kb_file_batch_size: _PositiveInt
+    kb_file_processing_timeout: _PositiveInt
+    supported_file_formats: Annotated[
+        List[Annotated[str, Field(pattern=r'^\.')]], Field(min_length=1)
+    ]
+
+
+_RAG_CONFIG_ADAPTER = TypeAdapter(RAGConfig)
+
+# 需要满足 前者 < 后者 的字段对：(键, 键, 字段名称, 字段名称)
+_ORDERED_PAIRS = (
+    ('chunk_overlap', 'chunk_size', 'CHUNK_OVERLAP', 'CHUNK_SIZE'),
+    ('kb_chunk_overlap', 'kb_chunk_size', 'KB_CHUNK_OVERLAP', 'KB_CHUNK_SIZE'),
+    ('kb_name_min_length', 'kb_name_max_length', 'KB_NAME_MIN_LENGTH', 'KB_NAME_MAX_LENGTH'),
+)
+
+# 允许的解析器类型和检索模式，字符串形式用于错误消息
+_PARSER_TYPES = frozenset(("sentence", "recursive", "semantic"))
+_PARSER_TYPES_STR = "sentence, recursive, semantic"
+_RETRIEVAL_MODES = frozenset(("vector", "fulltext", "hybrid"))
+_RETRIEVAL_MODES_STR = "vector, fulltext, hybrid"
+
+# validate_range 接受的数值类型；按类型精确匹配，bool 不算数字
+_NUMERIC_TYPES = (int, float)
+
+# validate_url 接受的协议前缀
+_HTTP_PREFIXES = ('http://', 'https://')
+
+# 缺少协议前缀的主机名：以 localhost 开头，或首个冒号之前只含字母、数字、
+# 点和连字符且至少有一个字母或数字（如 "localhost:11434"、"qdrant.local:6333"）
+_HOSTNAME_RE = re.compile(r'localhost|(?=[.\-]*[^\W_])(?:[^\W_]|[.\-])*(?::|\Z)')
+
+# 比较操作符 -> (比较函数, 错误消息中的描述)
+_COMPARISON_OPS = {
+    '<': (_op.lt, "小于"),
+    '<=': (_op.le, "小于等于"),
+    '>': (_op.gt, "大于"),
+    '>=': (_op.ge, "大于等于"),
+}
+
+# 区分"键不存在"和"值为 None"
+_MISSING = object()
+
+
+@lru_cache(maxsize=256)
+def _cached_urlparse(url: str):
+    """解析 URL；同一组地址在每次验证和重新加载时反复出现，结果可复用"""
+    # 仅在配置包含 URL 字段时才需要 urllib.parse
+    from urllib.parse import urlparse
+    return urlparse(url)
+
+
+# 参与验证的配置键，其余键不影响验证结果
+_CONFIG_KEYS = tuple(RAGConfig.__annotations__)
+
+
+def _freeze_config(config: Dict[str, Any]) -> Optional[tuple]:
+    """
+    将配置中参与验证的部分转换为可哈希的键
+
+    键中带上值的类型，避免 1 / 1.0 / True 这类相等但验证结果不同的值
+    命中同一缓存项。含不可哈希的值时返回 None。
+    """
+    get = config.get
+    items = []
+    for key in _CONFIG_KEYS:
+        value = get(key, _MISSING)
+        if value is _MISSING:
+            continue
+        value_type = type(value)
+        if value_type is list:
+            value = tuple(value)
+        items.append((key, value_type, value))
+
+    frozen = tuple(items)
+    try:
+        hash(frozen)
+    except TypeError:
+        return None
+    return frozen
+
+
+@lru_cache(maxsize=32)
+def _check_all_cached(frozen: tuple) -> Tuple[tuple, tuple]:
+    """按冻结后的配置缓存逐项检查的结果"""
+    config = {
+        key: list(value) if value_type is list else value
+        for key, value_type, value in frozen
+    }
+    return ConfigValidator()._check_all(config)
+
+
+def _is_valid_config(config: Dict[str, Any]) -> bool:
+    """快速判断配置是否完全合法（无错误、无警告）"""
+    try:
+        _RAG_CONFIG_ADAPTER.validate_python(config)
+    except ValidationError:
+        return False
+
+    get = config.get
+    for low, high, _, _ in _ORDERED_PAIRS:
+        low_val = get(low, _MISSING)
+        high_val = get(high, _MISSING)
+        if low_val is not _MISSING and high_val is not _MISSING and not low_val < high_val:
+            return False
+
+    return True
+
 
 class ConfigValidator:
     """
@@ -23,18 +203,34 @@ class ConfigValidator:
         >>> errors = validator.validate_all(config_dict)
     """
 
+    __slots__ = ('_errors', '_warnings', '_warn_enabled')
+
     def __init__(self):
         """初始化配置验证器"""
-        self._errors: List[str] = []
-        self._warnings: List[str] = []
-
-    def validate_url(self, url: str, field_name: str = "URL") -> bool:
+        # 消息以 (模板, 参数) 形式保存，取用时才格式化：
+        # 只关心返回值真假的调用方不必为消息拼接付出开销
+        self._errors: Deque[Tuple[str, tuple]] = deque()
+        self._warnings: Deque[Tuple[str, tuple]] = deque()
+        # 警告在产生时直接写入日志，WARNING 级别被过滤时省去日志调用
+        self._warn_enabled = logger.isEnabledFor(logging.WARNING)
+
+    def _emit_warning(self, warnings: Deque, template: str, *args: Any) -> None:
+        """记录一条警告并立即写入日志，template 使用 % 格式"""
+        if self._warn_enabled:
+            logger.warning(template, *args)
+        warnings.append((template, args))
+
+    def validate_url(self, url: str, field_name: str = "URL",
+                     errors: Optional[Deque] = None,
+                     warnings: Optional[Deque] = None) -> bool:
         """
         验证 URL 格式
 
         参数:
             url: 要验证的 URL
             field_name: 字段名称，用于错误消息
+            errors: 错误消息容器，默认为验证器自身的错误列表
+            warnings: 警告消息容器，默认为验证器自身的警告列表
 
         返回:
             True 如果 URL 有效，否则 False
@@ -44,38 +240,47 @@ class ConfigValidator:
             >>> validator.validate_url('http://localhost:11434', 'OLLAMA_HOST')
             True
         """
+        if errors is None:
+            errors = self._errors
+        if warnings is None:
+            warnings = self._warnings
+
         if not url:
-            self._errors.append(f"{field_name} 不能为空")
+            errors.append(("%s 不能为空", (field_name,)))
             return False
 
         # 检查是否以 http:// 或 https:// 开头
-        if not url.startswith(('http://', 'https://')):
-            # 检查是否是常见的错误格式
-            if url.startswith('localhost') or url.split(':')[0].replace('.', '').replace('-', '').isalnum():
-                self._warnings.append(f"{field_name} 应该包含协议前缀 (http:// 或 https://): {url}")
+        if not url.startswith(_HTTP_PREFIXES):
+            # 检查是否是常见的错误格式（缺少协议前缀的主机名）
+            if _HOSTNAME_RE.match(url):
+                self._emit_warning(
+                    warnings, "%s 应该包含协议前缀 (http:// 或 https://): %s", field_name, url
+                )
                 return True  # 宽松验证，只是警告
             else:
-                self._errors.append(f"{field_name} 必须是有效的 URL，以 http:// 或 https:// 开头: {url}")
+                errors.append(("%s 必须是有效的 URL，以 http:// 或 https:// 开头: %s", (field_name, url)))
                 return False
 
         # 使用 urlparse 进行更详细的验证
         try:
-            parsed = urlparse(url)
+            parsed = _cached_urlparse(url)
             if not parsed.netloc:
-                self._errors.append(f"{field_name} 缺少主机名: {url}")
+                errors.append(("%s 缺少主机名: %s", (field_name, url)))
                 return False
             return True
         except Exception as e:
-            self._errors.append(f"{field_name} 格式无效: {url} ({e})")
+            errors.append(("%s 格式无效: %s (%s)", (field_name, url, e)))
             return False
 
-    def validate_positive_int(self, value: int, field_name: str = "值") -> bool:
+    def validate_positive_int(self, value: int, field_name: str = "值",
+                              errors: Optional[Deque] = None) -> bool:
         """
         验证正整数
 
         参数:
             value: 要验证的整数
             field_name: 字段名称，用于错误消息
+            errors: 错误消息容器，默认为验证器自身的错误列表
 
         返回:
             True 如果值是正整数，否则 False
@@ -85,39 +290,47 @@ class ConfigValidator:
             >>> validator.validate_positive_int(5, 'TOP_K')
             True
         """
-        if not isinstance(value, int):
-            self._errors.append(f"{field_name} 必须是整数: {value}")
+        if errors is None:
+            errors = self._errors
+
+        if type(value) is not int:
+            errors.append(("%s 必须是整数: %s", (field_name, value)))
             return False
 
         if value <= 0:
-            self._errors.append(f"{field_name} 必须大于 0: {value}")
+            errors.append(("%s 必须大于 0: %s", (field_name, value)))
             return False
 
         return True
 
-    def validate_non_negative_int(self, value: int, field_name: str = "值") -> bool:
+    def validate_non_negative_int(self, value: int, field_name: str = "值",
+                                  errors: Optional[Deque] = None) -> bool:
         """
         验证非负整数
 
         参数:
             value: 要验证的整数
             field_name: 字段名称，用于错误消息
+            errors: 错误消息容器，默认为验证器自身的错误列表
 
         返回:
             True 如果值是非负整数，否则 False
         """
-        if not isinstance(value, int):
-            self._errors.append(f"{field_name} 必须是整数: {value}")
+        if errors is None:
+            errors = self._errors
+
+        if type(value) is not int:
+            errors.append(("%s 必须是整数: %s", (field_name, value)))
             return False
 
         if value < 0:
-            self._errors.append(f"{field_name} 不能为负数: {value}")
+            errors.append(("%s 不能为负数: %s", (field_name, value)))
             return False
 
         return True
 
     def validate_range(self, value: float, min_val: float, max_val: float,
-                      field_name: str = "值") -> bool:
+                      field_name: str = "值", errors: Optional[Deque] = None) -> bool:
         """
         验证值是否在指定范围内
 
@@ -126,6 +339,7 @@ class ConfigValidator:
             min_val: 最小值（包含）
             max_val: 最大值（包含）
             field_name: 字段名称，用于错误消息
+            errors: 错误消息容器，默认为验证器自身的错误列表
 
         返回:
             True 如果值在范围内，否则 False
@@ -135,40 +349,85 @@ class ConfigValidator:
             >>> validator.validate_range(0.7, 0.0, 1.0, 'SIMILARITY_THRESHOLD')
             True
         """
-        if not isinstance(value, (int, float)):
-            self._errors.append(f"{field_name} 必须是数字: {value}")
+        if errors is None:
+            errors = self._errors
+
+        if type(value) not in _NUMERIC_TYPES:
+            errors.append(("%s 必须是数字: %s", (field_name, value)))
             return False
 
         if value < min_val or value > max_val:
-            self._errors.append(f"{field_name} 必须在 {min_val} 到 {max_val} 之间: {value}")
+            errors.append(("%s 必须在 %s 到 %s 之间: %s", (field_name, min_val, max_val, value)))
+            return False
+
+        return True
+
+    def validate_int_range(self, value: int, min_val: int, max_val: int,
+                           field_name: str = "值", errors: Optional[Deque] = None) -> bool:
+        """
+        验证整数是否在指定范围内
+
+        一次完成类型和范围检查，代替 validate_positive_int 加额外范围判断
+
+        参数:
+            value: 要验证的整数
+            min_val: 最小值（包含）
+            max_val: 最大值（包含）
+            field_name: 字段名称，用于错误消息
+            errors: 错误消息容器，默认为验证器自身的错误列表
+
+        返回:
+            True 如果值是整数且在范围内，否则 False
+
+        示例:
+            >>> validator = ConfigValidator()
+            >>> validator.validate_int_range(512, 100, 2048, 'KB_CHUNK_SIZE')
+            True
+        """
+        if errors is None:
+            errors = self._errors
+
+        if type(value) is not int:
+            errors.append(("%s 必须是整数: %s", (field_name, value)))
+            return False
+
+        if not min_val <= value <= max_val:
+            errors.append(("%s 必须在 %s 到 %s 之间: %s", (field_name, min_val, max_val, value)))
             return False
 
         return True
 
-    def validate_non_empty_string(self, value: str, field_name: str = "值") -> bool:
+    def validate_non_empty_string(self, value: str, field_name: str = "值",
+                                  errors: Optional[Deque] = None) -> bool:
         """
         验证非空字符串
 
         参数:
             value: 要验证的字符串
             field_name: 字段名称，用于错误消息
+            errors: 错误消息容器，默认为验证器自身的错误列表
 
         返回:
             True 如果字符串非空，否则 False
         """
-        if not isinstance(value, str):
-            self._errors.append(f"{field_name} 必须是字符串: {value}")
+        if errors is None:
+            errors = self._errors
+
+        if type(value) is not str:
+            errors.append(("%s 必须是字符串: %s", (field_name, value)))
             return False
 
-        if not value.strip():
-            self._errors.append(f"{field_name} 不能为空")
+        # isspace() 不像 strip() 那样复制字符串
+        if not value or value.isspace():
+            errors.append(("%s 不能为空", (field_name,)))
             return False
 
         return True
 
     def validate_comparison(self, value1: Any, value2: Any,
                           field_name1: str, field_name2: str,
-                          operator: str = '<') -> bool:
+                          operator: str = '<',
+                          errors: Optional[Deque] = None) -> bool:
         """
         验证两个值的比较关系
 
@@ -178,36 +437,80 @@ class ConfigValidator:
             field_name1: 第一个字段名称
             field_name2: 第二个字段名称
             operator: 比较操作符 ('<', '<=', '>', '>=')
+            errors: 错误消息容器，默认为验证器自身的错误列表
 
         返回:
             True 如果比较关系成立，否则 False
         """
-        try:
-            if operator == '<':
-                result = value1 < value2
-                op_text = "小于"
-            elif operator == '<=':
-                result = value1 <= value2
-                op_text = "小于等于"
-            elif operator == '>':
-                result = value1 > value2
-                op_text = "大于"
-            elif operator == '>=':
-                result = value1 >= value2
-                op_text = "大于等于"
-            else:
-                self._errors.append(f"不支持的比较操作符: {operator}")
-                return False
+        if errors is None:
+            errors = self._errors
 
-            if not result:
-                self._errors.append(f"{field_name1} ({value1}) 必须{op_text} {field_name2} ({value2})")
+        entry = _COMPARISON_OPS.get(operator)
+        if entry is None:
+            errors.append(("不支持的比较操作符: %s", (operator,)))
+            return False
+        compare, op_text = entry
+
+        try:
+            if not compare(value1, value2):
+                errors.append((
+                    "%s (%s) 必须%s %s (%s)",
+                    (field_name1, value1, op_text, field_name2, value2),
+                ))
                 return False
 
             return True
         except Exception as e:
-            self._errors.append(f"比较 {field_name1} 和 {field_name2} 时出错: {e}")
+            errors.append(("比较 %s 和 %s 时出错: %s", (field_name1, field_name2, e)))
             return False
 
+    # URL 字段：(配置键, 字段名称)，除错误外还可能产生警告
+    _URL_RULES = (
+        ('ollama_host', 'OLLAMA_HOST'),
+        ('qdrant_url', 'QDRANT_URL'),
+    )
+
+    # 单字段验证规则：(配置键, 验证方法, 字段名称)
+    # 按顺序逐条执行，validate_all 只需一个循环完成分派
+    _FIELD_RULES = (
+        # Ollama 配置
+        ('llm_model', validate_non_empty_string, 'LLM_MODEL'),
+        ('embed_model', validate_non_empty_string, 'EMBED_MODEL'),
+        # Qdrant 配置
+        ('collection_name', validate_non_empty_string, 'COLLECTION_NAME'),
+        # 检索参数
+        ('top_k', validate_positive_int, 'TOP_K'),
+        # 分块参数
+        ('chunk_size', validate_positive_int, 'CHUNK_SIZE'),
+        ('chunk_overlap', validate_non_negative_int, 'CHUNK_OVERLAP'),
+        # 其他参数
+        ('max_query_length', validate_positive_int, 'MAX_QUERY_LENGTH'),
+        ('tool_concurrency_limit', validate_positive_int, 'TOOL_CONCURRENCY_LIMIT'),
+        ('llm_timeout', validate_positive_int, 'LLM_TIMEOUT'),
+        ('ollama_num_parallel', validate_positive_int, 'OLLAMA_NUM_PARALLEL'),
+        ('vector_dim', validate_positive_int, 'VECTOR_DIM'),
+        ('qdrant_timeout', validate_positive_int, 'QDRANT_TIMEOUT'),
+        # 知识库管理配置
+        ('kb_database_path', validate_non_empty_string, 'KB_DATABASE_PATH'),
+        ('file_storage_path', validate_non_empty_string, 'FILE_STORAGE_PATH'),
+        ('max_file_size', validate_positive_int, 'MAX_FILE_SIZE'),
+        ('kb_name_min_length', validate_positive_int, 'KB_NAME_MIN_LENGTH'),
+        ('kb_name_max_length', validate_positive_int, 'KB_NAME_MAX_LENGTH'),
+        ('kb_file_batch_size', validate_positive_int, 'KB_FILE_BATCH_SIZE'),
+        ('kb_file_processing_timeout', validate_positive_int, 'KB_FILE_PROCESSING_TIMEOUT'),
+    )
+
+    # 范围验证规则：(配置键, 验证方法, 字段名称, 最小值, 最大值)
+    _RANGE_RULES = (
+        ('similarity_threshold', validate_range, 'SIMILARITY_THRESHOLD', 0.0, 1.0),
+        ('qdrant_grpc_port', validate_int_range, 'QDRANT_GRPC_PORT', 1, 65535),
+        ('kb_chunk_size', validate_int_range, 'KB_CHUNK_SIZE', 100, 2048),
+        ('kb_chunk_overlap', validate_int_range, 'KB_CHUNK_OVERLAP', 0, 500),
+        ('kb_top_k', validate_int_range, 'KB_TOP_K', 1, 100),
+        ('kb_similarity_threshold', validate_range, 'KB_SIMILARITY_THRESHOLD', 0.0, 1.0),
+        ('kb_vector_weight', validate_range, 'KB_VECTOR_WEIGHT', 0.0, 1.0),
+    )
+
     def validate_all(self, config: Dict[str, Any]) -> List[str]:
         """
         验证所有配置项
@@ -218,6 +521,10 @@ class ConfigValidator:
         返回:
             错误消息列表，如果没有错误则返回空列表
 
+        验证过程只写入局部容器，结束时才整体替换 get_errors() /
+        get_warnings() 所读取的结果，因此同一验证器可在多个线程中
+        并发验证不同的配置。
+
         示例:
             >>> validator = ConfigValidator()
             >>> config = {
@@ -229,178 +536,145 @@ class ConfigValidator:
             >>> if errors:
             ...     print("配置错误:", errors)
         """
-        self._errors = []
-        self._warnings = []
-
-        # 验证 Ollama 配置
-        if 'ollama_host' in config:
-            self.validate_url(config['ollama_host'], 'OLLAMA_HOST')
-
-        if 'llm_model' in config:
-            self.validate_non_empty_string(config['llm_model'], 'LLM_MODEL')
-
-        if 'embed_model' in config:
-            self.validate_non_empty_string(config['embed_model'], 'EMBED_MODEL')
-
-        # 验证 Qdrant 配置
-        if 'qdrant_url' in config:
-            self.validate_url(config['qdrant_url'], 'QDRANT_URL')
-
-        if 'collection_name' in config:
-            self.validate_non_empty_string(config['collection_name'], 'COLLECTION_NAME')
-
-        # 验证检索参数
-        if 'top_k' in config:
-            self.validate_positive_int(config['top_k'], 'TOP_K')
+        # 快速路径：合法配置在 pydantic-core 中一次校验通过，直接返回
+        if _is_valid_config(config):
+            self._errors = deque()
+            self._warnings = deque()
+            return []
+
+        # 慢速路径：相同的无效配置（如反复重载、测试）直接复用上次的检查结果。
+        # 警告在检查时即写入日志，因此同一配置的警告只在首次检查时记录一次
+        frozen = _freeze_config(config)
+        if frozen is None:
+            errors, warnings = self._check_all(config)
+        else:
+            errors, warnings = _check_all_cached(frozen)
+
+        self._errors = deque(errors)
+        self._warnings = deque(warnings)
+        return [template % args for template, args in errors]
+
+    def is_valid(self, config: Dict[str, Any]) -> bool:
+        """
+        只判断配置是否完全合法，不生成错误和警告消息
 
-        if 'similarity_threshold' in config:
-            self.validate_range(config['similarity_threshold'], 0.0, 1.0, 'SIMILARITY_THRESHOLD')
+        适合批量任务等需要反复检查配置、只关心结果真假的场景；
+        返回 False 时可再调用 validate_all 获取具体错误。会产生警告的
+        宽松写法（如缺少协议前缀的 URL）在这里视为不合法。
 
-        # 验证分块参数
-        if 'chunk_size' in config:
-            self.validate_positive_int(config['chunk_size'], 'CHUNK_SIZE')
+        参数:
+            config: 配置字典
 
-        if 'chunk_overlap' in config:
-            self.validate_non_negative_int(config['chunk_overlap'], 'CHUNK_OVERLAP')
+        返回:
+            True 如果配置合法且没有警告，否则 False
 
-            # 验证 chunk_overlap < chunk_size
-            if 'chunk_size' in config and 'chunk_overlap' in config:
-                self.validate_comparison(
-                    config['chunk_overlap'],
-                    config['chunk_size'],
-                    'CHUNK_OVERLAP',
-                    'CHUNK_SIZE',
-                    '<'
-                )
+        示例:
+            >>> validator = ConfigValidator()
+            >>> if not validator.is_valid(config):
+            ...     errors = validator.validate_all(config)
+        """
+        return _is_valid_config(config)
 
-        # 验证其他参数
-        if 'max_query_length' in config:
-            self.validate_positive_int(config['max_query_length'], 'MAX_QUERY_LENGTH')
-
-        if 'llm_timeout' in config:
-            self.validate_positive_int(config['llm_timeout'], 'LLM_TIMEOUT')
-
-        if 'vector_dim' in config:
-            self.validate_positive_int(config['vector_dim'], 'VECTOR_DIM')
-
-        # 验证知识库管理配置
-        if 'kb_database_path' in config:
-            self.validate_non_empty_string(config['kb_database_path'], 'KB_DATABASE_PATH')
-
-        if 'file_storage_path' in config:
-            self.validate_non_empty_string(config['file_storage_path'], 'FILE_STORAGE_PATH')
-
-        if 'max_file_size' in config:
-            self.validate_positive_int(config['max_file_size'], 'MAX_FILE_SIZE')
-
-        if 'kb_chunk_size' in config:
-            self.validate_positive_int(config['kb_chunk_size'], 'KB_CHUNK_SIZE')
-            # 验证范围 100-2048
-            if config['kb_chunk_size'] < 100 or config['kb_chunk_size'] > 2048:
-                self._errors.append(f"KB_CHUNK_SIZE 必须在 100 到 2048 之间: {config['kb_chunk_size']}")
-
-        if 'kb_chunk_overlap' in config:
-            self.validate_non_negative_int(config['kb_chunk_overlap'], 'KB_CHUNK_OVERLAP')
-            # 验证范围 0-500
-            if config['kb_chunk_overlap'] > 500:
-                self._errors.append(f"KB_CHUNK_OVERLAP 不能超过 500: {config['kb_chunk_overlap']}")
-            
-            # 验证 kb_chunk_overlap < kb_chunk_size
-            if 'kb_chunk_size' in config and 'kb_chunk_overlap' in config:
-                self.validate_comparison(
-                    config['kb_chunk_overlap'],
-                    config['kb_chunk_size'],
-                    'KB_CHUNK_OVERLAP',
-                    'KB_CHUNK_SIZE',
-                    '<'
-                )
+    def _check_all(self, config: Dict[str, Any]) -> Tuple[tuple, tuple]:
+        """
+        逐项检查配置，生成具体的错误和警告信息
 
-        if 'kb_parser_type' in config:
-            allowed_parser_types = ["sentence", "recursive", "semantic"]
-            if config['kb_parser_type'] not in allowed_parser_types:
-                self._errors.append(
-                    f"KB_PARSER_TYPE 必须是以下之一: {', '.join(allowed_parser_types)}"
-                )
+        返回:
+            (错误, 警告)，均为 (模板, 参数) 元组
+        """
+        errors: Deque[Tuple[str, tuple]] = deque()
+        warnings: Deque[Tuple[str, tuple]] = deque()
 
-        if 'kb_retrieval_mode' in config:
-            allowed_retrieval_modes = ["vector", "fulltext", "hybrid"]
-            if config['kb_retrieval_mode'] not in allowed_retrieval_modes:
-                self._errors.append(
-                    f"KB_RETRIEVAL_MODE 必须是以下之一: {', '.join(allowed_retrieval_modes)}"
-                )
+        # 规则表中的检查由导入时生成的直线代码完成
+        _check_rules(self, config, errors, warnings)
 
-        if 'kb_top_k' in config:
-            self.validate_positive_int(config['kb_top_k'], 'KB_TOP_K')
-            # 验证范围 1-100
-            if config['kb_top_k'] < 1 or config['kb_top_k'] > 100:
-                self._errors.append(f"KB_TOP_K 必须在 1 到 100 之间: {config['kb_top_k']}")
-
-        if 'kb_similarity_threshold' in config:
-            self.validate_range(
-                config['kb_similarity_threshold'], 
-                0.0, 
-                1.0, 
-                'KB_SIMILARITY_THRESHOLD'
-            )
-
-        if 'kb_vector_weight' in config:
-            self.validate_range(
-                config['kb_vector_weight'], 
-                0.0, 
-                1.0, 
-                'KB_VECTOR_WEIGHT'
-            )
-
-        if 'kb_name_min_length' in config:
-            self.validate_positive_int(config['kb_name_min_length'], 'KB_NAME_MIN_LENGTH')
-
-        if 'kb_name_max_length' in config:
-            self.validate_positive_int(config['kb_name_max_length'], 'KB_NAME_MAX_LENGTH')
-            
-            # 验证 kb_name_min_length < kb_name_max_length
-            if 'kb_name_min_length' in config and 'kb_name_max_length' in config:
-                self.validate_comparison(
-                    config['kb_name_min_length'],
-                    config['kb_name_max_length'],
-                    'KB_NAME_MIN_LENGTH',
-                    'KB_NAME_MAX_LENGTH',
-                    '<'
-                )
+        get = config.get
 
-        if 'kb_file_batch_size' in config:
-            self.validate_positive_int(config['kb_file_batch_size'], 'KB_FILE_BATCH_SIZE')
+        # 先排除非字符串值：列表等不可哈希的值无法做集合成员判断
+        value = get('kb_parser_type', _MISSING)
+        if value is not _MISSING and (not isinstance(value, str) or value not in _PARSER_TYPES):
+            errors.append(("KB_PARSER_TYPE 必须是以下之一: %s", (_PARSER_TYPES_STR,)))
 
-        if 'kb_file_processing_timeout' in config:
-            self.validate_positive_int(config['kb_file_processing_timeout'], 'KB_FILE_PROCESSING_TIMEOUT')
+        value = get('kb_retrieval_mode', _MISSING)
+        if value is not _MISSING and (not isinstance(value, str) or value not in _RETRIEVAL_MODES):
+            errors.append(("KB_RETRIEVAL_MODE 必须是以下之一: %s", (_RETRIEVAL_MODES_STR,)))
 
-        if 'supported_file_formats' in config:
-            if not isinstance(config['supported_file_formats'], list):
-                self._errors.append("SUPPORTED_FILE_FORMATS 必须是列表")
-            elif not config['supported_file_formats']:
-                self._errors.append("SUPPORTED_FILE_FORMATS 不能为空列表")
+        formats = get('supported_file_formats', _MISSING)
+        if formats is not _MISSING:
+            if not isinstance(formats, list):
+                errors.append(("SUPPORTED_FILE_FORMATS 必须是列表", ()))
+            elif not formats:
+                errors.append(("SUPPORTED_FILE_FORMATS 不能为空列表", ()))
             else:
-                # 验证每个格式都是字符串且以点开头
-                for fmt in config['supported_file_formats']:
-                    if not isinstance(fmt, str):
-                        self._errors.append(f"文件格式必须是字符串: {fmt}")
-                    elif not fmt.startswith('.'):
-                        self._warnings.append(f"文件格式应该以点开头: {fmt}")
+                # 验证每个格式都是字符串且以点开头，问题格式汇总为一条消息
+                non_str = [fmt for fmt in formats if type(fmt) is not str]
+                if non_str:
+                    errors.append(("文件格式必须是字符串: %s", (non_str,)))
+                no_dot = [fmt for fmt in formats if type(fmt) is str and not fmt.startswith('.')]
+                if no_dot:
+                    self._emit_warning(warnings, "文件格式应该以点开头: %s", no_dot)
 
-        # 记录警告
-        for warning in self._warnings:
-            logger.warning(warning)
+        return tuple(errors), tuple(warnings)
 
-        return self._errors
+    def has_errors(self) -> bool:
+        """是否存在错误，不格式化错误消息"""
+        return bool(self._errors)
 
     def get_errors(self) -> List[str]:
         """获取所有错误消息"""
-        return self._errors
+        return [template % args for template, args in self._errors]
 
     def get_warnings(self) -> List[str]:
         """获取所有警告消息"""
-        return self._warnings
+        return [template % args for template, args in self._warnings]
 
     def clear(self):
         """清除所有错误和警告"""
-        self._errors = []
-        self._warnings = []
+        self._errors.clear()
+        self._warnings.clear()
+
+
+def _build_rule_checker():
+    """
+    根据规则表生成直线执行的检查函数
+
+    配置键、字段名称和范围在导入时即已确定，把 _URL_RULES /
+    _FIELD_RULES / _RANGE_RULES / _ORDERED_PAIRS 展开为逐条的语句，
+    省去逐项解包规则元组和循环分派的开销。
+    """
+    cls = ConfigValidator
+    namespace = {'_MISSING': _MISSING}
+    lines = [
+        "def _check_rules(self, config, errors, warnings):",
+        "    get = config.get",
+    ]
+
+    def emit(key, call):
+        lines.append(f"    value = get({key!r}, _MISSING)")
+        lines.append("    if value is not _MISSING:")
+        lines.append(f"        {call}")
+
+    for key, field_name in cls._URL_RULES:
+        emit(key, f"self.validate_url(value, {field_name!r}, errors, warnings)")
+
+    for key, validate, field_name in cls._FIELD_RULES:
+        namespace[validate.__name__] = validate
+        emit(key, f"{validate.__name__}(self, value, {field_name!r}, errors)")
+
+    for key, validate, field_name, min_val, max_val in cls._RANGE_RULES:
+        namespace[validate.__name__] = validate
+        emit(key, f"{validate.__name__}(self, value, {min_val!r}, {max_val!r}, {field_name!r}, errors)")
+
+    for low, high, low_name, high_name in _ORDERED_PAIRS:
+        lines.append(f"    low = get({low!r}, _MISSING)")
+        lines.append(f"    high = get({high!r}, _MISSING)")
+        lines.append("    if low is not _MISSING and high is not _MISSING:")
+        lines.append(
+            f"        self.validate_comparison(low, high, {low_name!r}, {high_name!r}, '<', errors)"
+        )
+
+    exec(compile("\n".join(lines), "<config-validator-rules>", "exec"), namespace)
+    return namespace['_check_rules']
+
+
+_check_rules = _build_rule_checker()
@@ -2,27 +2,35 @@
 核心模块
 
 导出代理和提示词相关的所有组件。
+
+各组件在首次访问时才导入：代理依赖 langchain / langgraph，导入开销较大，
+仅使用 rag5.core.knowledge_base 等子包时无需付出这部分启动时间。
 """
 
-# 代理组件
-from rag5.core.agent import (
-    SimpleRAGAgent,
-    ask,
-    AgentInitializer,
-    MessageProcessor,
-    ConversationHistory,
-    ErrorHandler,
-    RetryHandler,
-    TimeoutError,
-    retry_with_backoff
-)
-
-# 提示词
-from rag5.core.prompts import (
-    SYSTEM_PROMPT,
-    SEARCH_TOOL_DESCRIPTION,
-    TOOL_DESCRIPTION
-)
+from rag5._lazy import lazy_importer
+
+# 延迟导入表：属性名 -> (模块路径, 模块中的属性名)
+_LAZY = {
+    # 代理组件
+    'SimpleRAGAgent': ('rag5.core.agent.agent', 'SimpleRAGAgent'),
+    'ask': ('rag5.core.agent.agent', 'ask'),
+    'AgentInitializer': ('rag5.core.agent.initializer', 'AgentInitializer'),
+    'MessageProcessor': ('rag5.core.agent.messages', 'MessageProcessor'),
+    'ConversationHistory': ('rag5.core.agent.history', 'ConversationHistory'),
+    'ErrorHandler': ('rag5.core.agent.errors', 'ErrorHandler'),
+    'RetryHandler': ('rag5.core.agent.errors', 'RetryHandler'),
+    'TimeoutError': ('rag5.core.agent.errors', 'TimeoutError'),
+    'retry_with_backoff': ('rag5.core.agent.errors', 'retry_with_backoff'),
+
+    # 提示词
+    'SYSTEM_PROMPT': ('rag5.core.prompts', 'SYSTEM_PROMPT'),
+    'SEARCH_TOOL_DESCRIPTION': ('rag5.core.prompts', 'SEARCH_TOOL_DESCRIPTION'),
+    'TOOL_DESCRIPTION': ('rag5.core.prompts', 'TOOL_DESCRIPTION'),
+}
+
+
+__getattr__, __dir__ = lazy_importer(globals(), _LAZY)
+
 
 __all__ = [
     # 主代理
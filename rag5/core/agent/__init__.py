@@ -2,18 +2,28 @@
 代理子模块
 
 导出代理相关的所有组件。
+
+各组件在首次访问时才导入，避免仅导入某个子模块时加载整个代理依赖链。
 """
 
-from rag5.core.agent.agent import SimpleRAGAgent, ask
-from rag5.core.agent.initializer import AgentInitializer
-from rag5.core.agent.messages import MessageProcessor
-from rag5.core.agent.history import ConversationHistory
-from rag5.core.agent.errors import (
-    ErrorHandler,
-    RetryHandler,
-    TimeoutError,
-    retry_with_backoff
-)
+from rag5._lazy import lazy_importer
+
+# 延迟导入表：属性名 -> (模块路径, 模块中的属性名)
+_LAZY = {
+    'SimpleRAGAgent': ('rag5.core.agent.agent', 'SimpleRAGAgent'),
+    'ask': ('rag5.core.agent.agent', 'ask'),
+    'AgentInitializer': ('rag5.core.agent.initializer', 'AgentInitializer'),
+    'MessageProcessor': ('rag5.core.agent.messages', 'MessageProcessor'),
+    'ConversationHistory': ('rag5.core.agent.history', 'ConversationHistory'),
+    'ErrorHandler': ('rag5.core.agent.errors', 'ErrorHandler'),
+    'RetryHandler': ('rag5.core.agent.errors', 'RetryHandler'),
+    'TimeoutError': ('rag5.core.agent.errors', 'TimeoutError'),
+    'retry_with_backoff': ('rag5.core.agent.errors', 'retry_with_backoff'),
+}
+
+
+__getattr__, __dir__ = lazy_importer(globals(), _LAZY)
+
 
 __all__ = [
     # 主代理
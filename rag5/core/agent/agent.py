@@ -5,15 +5,22 @@ RAG 代理模块
 """
 
 import logging
+import random
+import re
+import threading
+import time
+import traceback
 from datetime import datetime
-from typing import List, Dict, Optional
+from functools import lru_cache
+from typing import List, Dict, Optional, Tuple
 
+import httpx
 from langchain_core.messages import HumanMessage, SystemMessage
 
 from rag5.core.agent.initializer import AgentInitializer
 from rag5.core.agent.messages import MessageProcessor
 from rag5.core.agent.errors import ErrorHandler, TimeoutError
-from rag5.core.prompts import SYSTEM_PROMPT
+from rag5.core.prompts import SYSTEM_PROMPT, KNOWLEDGEBASE_TOOL_PROMPT
 from rag5.config.settings import settings
 from rag5.utils.reflection_logger import AgentReflectionLogger
 from rag5.utils.context_logger import ConversationContextLogger
@@ -22,6 +29,95 @@ from rag5.utils.id_generator import generate_correlation_id
 
 logger = logging.getLogger(__name__)
 
+# 系统提示词中日期的占位符，格式化结果缓存后每次查询只需替换这一处
+_DATETIME_PLACEHOLDER = "{{DT}}"
+
+
+@lru_cache(maxsize=32)
+def _build_system_message(kb_id: Optional[str]) -> SystemMessage:
+    """
+    构建（并缓存）不含当前时间的系统消息
+
+    缓存的消息作为模板使用，调用方不应修改它。
+
+    参数:
+        kb_id: 可选的知识库 ID
+
+    返回:
+        内容以日期占位符代替当前时间的系统消息
+    """
+    # 如果提供了 kb_id，添加到工具提示中
+    kb_instruction = ""
+    if kb_id:
+        kb_instruction = f"\n\n重要提示：当使用 search_knowledge_base 工具时，必须传入 kb_id 参数值为 '{kb_id}'。这将确保只在指定的知识库中搜索。"
+
+    return SystemMessage(content=SYSTEM_PROMPT.format(
+        knowledgebase_tool_prompt=KNOWLEDGEBASE_TOOL_PROMPT + kb_instruction,
+        current_datetime=_DATETIME_PLACEHOLDER,
+        chat_history=""
+    ))
+
+
+# 意图检测用的预编译正则：每类关键词一次 C 层扫描，代替逐词的子串查找
+# 问候语（在小写化的查询上匹配）
+_GREETING_RE = re.compile("你好|您好|嗨|hi|hello|早上好|晚上好")
+# 疑问词（单个交替模式，一次扫描；对应的推理说明见 _QWORD_REASONS）
+_QWORD_RE = re.compile("谁|什么|哪|何时|为什么|如何|怎么|多少")
+# 大写字母（含全角），视为可能的实体名称（英文人名、公司名、缩写等）。
+# 中文没有大小写，若需识别中文姓名应另建专门的模式，而不是依赖大小写
+_UPPER_RE = re.compile("[A-ZＡ-Ｚ]")
+
+# 可重试的瞬时错误（超时、连接失败）；其他异常重试也不会成功，直接交给外层处理
+_RETRYABLE = (
+    TimeoutError,
+    ConnectionError,
+    httpx.TimeoutException,
+    httpx.NetworkError,
+)
+
+# 重试退避：基础延迟（秒）按 2 的幂增长，再加上随机抖动
+_RETRY_BASE_DELAY = 0.1
+_RETRY_JITTER = 0.05
+
+
+def _retry_delay(attempt: int) -> float:
+    """计算第 attempt 次（从 0 开始）失败后的重试等待时间（秒）"""
+    return _RETRY_BASE_DELAY * (2 ** attempt) + random.random() * _RETRY_JITTER
+
+
+# 整条查询只是问候语（可带结尾标点），在小写化、去除首尾空白的查询上完整匹配
+_GREETING_EXACT_RE = re.compile(
+    r"(?:你好|您好|嗨|hi|hello|早上好|晚上好)[\s!！。.~～,，]*"
+)
+
+# 问候语的预设回复，按查询语言选择
+_GREETING_REPLIES = (
+    "你好！有什么可以帮你的？",
+    "你好！请问有什么问题需要我解答？",
+    "你好！很高兴为你服务，请问需要了解什么？",
+)
+_GREETING_REPLIES_EN = (
+    "Hello! How can I help you?",
+    "Hi! What would you like to know?",
+)
+
+# 意图检测的推理说明
+_REASON_FACT_QWORD = "查询包含疑问词，可能需要从知识库检索事实信息"
+_REASON_SPECIFIC_INFO = "查询内容表明需要具体信息，建议使用知识库搜索"
+_REASON_CONVERSATIONAL = "查询是简单对话或问候，可以直接由 LLM 回答"
+
+# 疑问词 -> 推理说明；指向事实信息的疑问词优先（"为什么" 包含 "什么"，同样归入此类）
+_QWORD_REASONS = {
+    "谁": _REASON_FACT_QWORD,
+    "什么": _REASON_FACT_QWORD,
+    "哪": _REASON_FACT_QWORD,
+    "为什么": _REASON_FACT_QWORD,
+    "何时": _REASON_SPECIFIC_INFO,
+    "如何": _REASON_SPECIFIC_INFO,
+    "怎么": _REASON_SPECIFIC_INFO,
+    "多少": _REASON_SPECIFIC_INFO,
+}
+
 
 class SimpleRAGAgent:
     """
@@ -113,7 +209,7 @@ class SimpleRAGAgent:
             self._agent_executor = self._initializer.create_agent()
             logger.info("✓ SimpleRAGAgent 初始化成功")
         except Exception as e:
-            logger.error(f"初始化 SimpleRAGAgent 失败: {e}")
+            logger.error("初始化 SimpleRAGAgent 失败: %s", e)
             raise
 
     def chat(
@@ -150,56 +246,71 @@ class SimpleRAGAgent:
             return "请输入有效的问题。"
 
         try:
-            logger.info(f"处理查询: {query[:100]}...")
+            logger.info("处理查询: %.100s...", query)
             
             # 记录查询开始（统一流程日志）
+            # 本次查询的流程日志先缓存在内存中，查询结束时一次性写出
             if self._flow_logger:
+                self._flow_logger.begin_query()
                 self._flow_logger.log_query_start(query)
             
+            # 开场的纯问候语直接返回预设回复，不调用 LLM
+            if not chat_history and _GREETING_EXACT_RE.fullmatch(
+                query.strip().lower()
+            ):
+                answer = random.choice(
+                    _GREETING_REPLIES_EN if query.isascii() else _GREETING_REPLIES
+                )
+                if self._flow_logger:
+                    self._flow_logger.log_query_analysis(
+                        detected_intent="greeting",
+                        requires_tools=False,
+                        reasoning="查询是问候语，直接返回预设回复（跳过 LLM 调用）",
+                        confidence=1.0
+                    )
+                    self._flow_logger.log_query_complete(
+                        final_answer=answer,
+                        total_duration_seconds=self._flow_logger.get_elapsed_time(),
+                        status="success"
+                    )
+                logger.debug("问候语快速路径，跳过 LLM 调用")
+                return answer
+            
             # 生成关联 ID 用于跟踪此查询的所有操作
             correlation_id = generate_correlation_id("query")
 
             # 准备当前时间用于上下文
             current_time = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
 
-            # 准备消息
-            messages = []
-
-            # 添加带当前时间的系统消息
-            from rag5.core.prompts import KNOWLEDGEBASE_TOOL_PROMPT
-            
-            # 如果提供了 kb_id，添加到工具提示中
-            kb_instruction = ""
-            if kb_id:
-                kb_instruction = f"\n\n重要提示：当使用 search_knowledge_base 工具时，必须传入 kb_id 参数值为 '{kb_id}'。这将确保只在指定的知识库中搜索。"
-            
-            system_prompt = SYSTEM_PROMPT.format(
-                knowledgebase_tool_prompt=KNOWLEDGEBASE_TOOL_PROMPT + kb_instruction,
-                current_datetime=current_time,
-                chat_history=""
+            # 带当前时间的系统消息：按 kb_id 缓存的模板只替换日期，
+            # 复制模板消息而不是重新构造，跳过消息模型的字段校验
+            system_template = _build_system_message(kb_id)
+            system_prompt = system_template.content.replace(
+                _DATETIME_PLACEHOLDER, current_time
             )
-            messages.append(SystemMessage(content=system_prompt))
+            system_message = system_template.copy(update={"content": system_prompt})
 
-            # 添加聊天历史（如果提供）
+            # 转换聊天历史（如果提供）
+            history_messages = []
             history_message_count = 0
+            history_content_length = 0
             if chat_history:
-                history_messages = self._message_processor.dict_to_langchain(
-                    chat_history
+                history_messages, history_content_length = (
+                    self._message_processor.dict_to_langchain_with_length(
+                        chat_history
+                    )
                 )
-                messages.extend(history_messages)
                 history_message_count = len(chat_history)
 
-            # 添加当前查询
-            messages.append(HumanMessage(content=query))
+            # 准备消息：系统消息、聊天历史、当前查询
+            messages = [system_message, *history_messages, HumanMessage(content=query)]
             
             # 记录上下文大小（如果启用上下文日志）
             if self._context_logger:
-                # 计算总内容长度
-                total_content_length = len(system_prompt) + len(query)
-                if chat_history:
-                    total_content_length += sum(
-                        len(msg.get("content", "")) for msg in chat_history
-                    )
+                # 计算总内容长度（历史消息长度已在转换时累加）
+                total_content_length = (
+                    len(system_prompt) + len(query) + history_content_length
+                )
                 
                 # 估计 token 数量（粗略估计：2 个字符 ≈ 1 个 token）
                 estimated_tokens = total_content_length // 2
@@ -213,12 +324,13 @@ class SimpleRAGAgent:
                     correlation_id=correlation_id
                 )
 
-            logger.debug(f"为代理准备了 {len(messages)} 条消息（包括 {history_message_count} 条历史消息）")
+            logger.debug(
+                "为代理准备了 %d 条消息（包括 %d 条历史消息）",
+                len(messages), history_message_count
+            )
             
             # 简单的意图检测：检查查询是否可能需要工具
-            requires_tools = self._analyze_query_intent(query)
-            detected_intent = "factual_lookup" if requires_tools else "conversational"
-            reasoning = self._get_intent_reasoning(query, requires_tools)
+            requires_tools, detected_intent, reasoning = self._analyze_intent(query)
             
             # 记录查询分析（如果启用反思日志）
             if self._reflection_logger:
@@ -265,11 +377,14 @@ class SimpleRAGAgent:
                         )
                     
                     # 记录代理执行开始时间（用于工具执行计时）
-                    import time
                     agent_start_time = time.time()
                     
-                    # 准备配置，包括 kb_id（如果提供）
-                    config = {"recursion_limit": 10}
+                    # 准备配置，包括 kb_id（如果提供）；
+                    # max_concurrency 限制 ToolNode 并发执行的工具调用数
+                    config = {
+                        "recursion_limit": 10,
+                        "max_concurrency": settings.tool_concurrency_limit
+                    }
                     if kb_id:
                         config["configurable"] = {"kb_id": kb_id}
                     
@@ -277,31 +392,30 @@ class SimpleRAGAgent:
                         {"messages": messages},
                         config=config
                     )
+                    agent_duration = time.time() - agent_start_time
+
+                    # 提取答案
+                    answer = self._message_processor.extract_ai_response(result)
                     
-                    # 记录工具执行（统一流程日志）
-                    # 从结果中提取工具调用信息
-                    if self._flow_logger and "messages" in result:
-                        self._log_tool_executions_from_result(
+                    # 单次遍历结果消息：统计工具消息数量（即使用的来源数量），
+                    # 并记录工具执行（统一流程日志）
+                    sources_used = 0
+                    if self._flow_logger or self._reflection_logger:
+                        sources_used = self._log_tool_executions_from_result(
                             result,
                             agent_start_time
                         )
                     
-                    # 记录 LLM 调用（统一流程日志）
+                    # 记录 LLM 调用（统一流程日志），复用已提取的答案
                     if self._flow_logger:
-                        agent_duration = time.time() - agent_start_time
                         self._log_llm_calls_from_result(
-                            result,
                             messages,
-                            agent_duration
+                            agent_duration,
+                            answer
                         )
-
-                    # 提取答案
-                    answer = self._message_processor.extract_ai_response(result)
                     
                     # 记录合成决策（如果启用反思日志）
                     if self._reflection_logger:
-                        # 估计使用的来源数量（基于答案中是否提到检索到的信息）
-                        sources_used = self._estimate_sources_used(result)
                         has_sufficient_info = len(answer) > 50  # 简单启发式
                         
                         self._reflection_logger.log_synthesis_decision(
@@ -320,16 +434,17 @@ class SimpleRAGAgent:
                             status="success"
                         )
 
-                    logger.info(f"生成答案，长度: {len(answer)}")
+                    logger.info("生成答案，长度: %d", len(answer))
                     return answer
 
                 except TimeoutError as e:
                     last_error = e
                     if attempt < max_retries - 1:
                         logger.warning(
-                            f"请求超时，正在重试... "
-                            f"(尝试 {attempt + 1}/{max_retries})"
+                            "请求超时，正在重试... (尝试 %d/%d)",
+                            attempt + 1, max_retries
                         )
+                        time.sleep(_retry_delay(attempt))
                         continue
                     else:
                         logger.error("所有重试后请求超时")
@@ -338,13 +453,15 @@ class SimpleRAGAgent:
                             "LLM 请求"
                         )
 
-                except Exception as e:
+                except _RETRYABLE as e:
+                    # 只重试瞬时错误；其他异常直接由外层处理，不再浪费一次 LLM 调用
                     last_error = e
                     if attempt < max_retries - 1:
                         logger.warning(
-                            f"请求失败: {e}，正在重试... "
-                            f"(尝试 {attempt + 1}/{max_retries})"
+                            "请求失败: %s，正在重试... (尝试 %d/%d)",
+                            e, attempt + 1, max_retries
                         )
+                        time.sleep(_retry_delay(attempt))
                         continue
                     else:
                         # 最后一次尝试失败，抛出异常
@@ -357,56 +474,51 @@ class SimpleRAGAgent:
             return "抱歉，我无法生成回答。"
 
         except ConnectionError as e:
-            logger.error(f"连接错误: {e}")
+            logger.error("连接错误: %s", e)
             # 记录错误（统一流程日志）
             if self._flow_logger:
-                import traceback
-                self._flow_logger.log_error(
-                    error_type="ConnectionError",
-                    error_message=str(e),
-                    stack_trace=traceback.format_exc()
-                )
-                self._flow_logger.log_query_complete(
-                    final_answer="",
-                    total_duration_seconds=self._flow_logger.get_elapsed_time(),
-                    status="error"
-                )
+                self._log_query_error("ConnectionError", e)
             return self._error_handler.handle_connection_error(e, "Ollama/Qdrant")
 
         except ValueError as e:
-            logger.error(f"配置错误: {e}")
+            logger.error("配置错误: %s", e)
             # 记录错误（统一流程日志）
             if self._flow_logger:
-                import traceback
-                self._flow_logger.log_error(
-                    error_type="ValueError",
-                    error_message=str(e),
-                    stack_trace=traceback.format_exc()
-                )
-                self._flow_logger.log_query_complete(
-                    final_answer="",
-                    total_duration_seconds=self._flow_logger.get_elapsed_time(),
-                    status="error"
-                )
+                self._log_query_error("ValueError", e)
             return self._error_handler.handle_validation_error(e, "配置")
 
         except Exception as e:
-            logger.error(f"处理查询时出错: {e}", exc_info=True)
+            logger.error("处理查询时出错: %s", e, exc_info=True)
             # 记录错误（统一流程日志）
             if self._flow_logger:
-                import traceback
-                self._flow_logger.log_error(
-                    error_type=type(e).__name__,
-                    error_message=str(e),
-                    stack_trace=traceback.format_exc()
-                )
-                self._flow_logger.log_query_complete(
-                    final_answer="",
-                    total_duration_seconds=self._flow_logger.get_elapsed_time(),
-                    status="error"
-                )
+                self._log_query_error(type(e).__name__, e)
             return self._error_handler.handle_general_error(e, "处理您的问题")
 
+        finally:
+            if self._flow_logger:
+                self._flow_logger.end_query()
+
+    def _log_query_error(self, error_type: str, error: Exception) -> None:
+        """
+        记录查询失败（统一流程日志），须在 except 块内调用
+
+        堆栈只在流程日志实际输出时才格式化（minimal 级别不输出堆栈）。
+
+        参数:
+            error_type: 错误类型名称
+            error: 异常对象
+        """
+        self._flow_logger.log_error(
+            error_type=error_type,
+            error_message=str(error),
+            stack_trace=traceback.format_exc
+        )
+        self._flow_logger.log_query_complete(
+            final_answer="",
+            total_duration_seconds=self._flow_logger.get_elapsed_time(),
+            status="error"
+        )
+
     @property
     def initializer(self) -> AgentInitializer:
         """获取代理初始化器"""
@@ -437,168 +549,151 @@ class SimpleRAGAgent:
         """获取统一流程日志记录器"""
         return self._flow_logger
     
-    def _analyze_query_intent(self, query: str) -> bool:
+    def _analyze_intent(self, query: str) -> Tuple[bool, str, str]:
         """
-        分析查询意图，判断是否需要工具
-        
+        分析查询意图，判断是否需要工具，并给出意图类型和推理说明
+
         参数:
             query: 用户查询
-        
+
         返回:
-            是否需要使用工具
+            (是否需要使用工具, 意图类型, 推理说明)
         """
         # 简单的启发式规则：
+        # - 问候语直接由 LLM 回答
         # - 包含疑问词（谁、什么、哪里、何时、为什么、如何）
-        # - 包含具体实体名称（中文人名、公司名等）
-        # - 查询较长（可能需要详细信息）
-        
-        question_words = ["谁", "什么", "哪", "何时", "为什么", "如何", "怎么", "多少"]
-        has_question_word = any(word in query for word in question_words)
-        
-        # 检查是否包含可能的实体（简单检测：包含中文姓名模式）
-        has_potential_entity = any(char.isupper() or len(query) > 10 for char in query)
-        
-        # 简单的问候语检测
-        greetings = ["你好", "您好", "嗨", "hi", "hello", "早上好", "晚上好"]
-        is_greeting = any(greeting in query.lower() for greeting in greetings)
-        
-        if is_greeting:
-            return False
-        
-        return has_question_word or has_potential_entity
-    
-    def _get_intent_reasoning(self, query: str, requires_tools: bool) -> str:
-        """
-        获取意图检测的推理说明
-        
-        参数:
-            query: 用户查询
-            requires_tools: 是否需要工具
-        
-        返回:
-            推理说明
-        """
-        if requires_tools:
-            if any(word in query for word in ["谁", "什么", "哪"]):
-                return "查询包含疑问词，可能需要从知识库检索事实信息"
-            else:
-                return "查询内容表明需要具体信息，建议使用知识库搜索"
-        else:
-            return "查询是简单对话或问候，可以直接由 LLM 回答"
-    
-    def _estimate_sources_used(self, result: Dict) -> int:
+        # - 包含具体实体名称（大写字母）或查询较长（可能需要详细信息）
+        if _GREETING_RE.search(query.lower()):
+            return False, "conversational", _REASON_CONVERSATIONAL
+
+        # 一次扫描所有疑问词，遇到指向事实信息的疑问词即可确定推理说明
+        reasoning = None
+        for match in _QWORD_RE.finditer(query):
+            reasoning = _QWORD_REASONS[match.group()]
+            if reasoning is _REASON_FACT_QWORD:
+                break
+
+        if reasoning is None and (len(query) > 10 or _UPPER_RE.search(query)):
+            reasoning = _REASON_SPECIFIC_INFO
+
+        if reasoning is None:
+            return False, "conversational", _REASON_CONVERSATIONAL
+
+        return True, "factual_lookup", reasoning
+
+    def _log_tool_executions_from_result(
+        self,
+        result: Dict,
+        start_time: float
+    ) -> int:
         """
-        估计使用的来源数量
-        
+        单次遍历代理执行结果：统计工具消息数量，并记录工具执行信息
+
+        工具执行仅在启用统一流程日志时记录；工具消息数量用于估计使用的来源数量。
+
         参数:
             result: 代理执行结果
-        
+            start_time: 代理执行开始时间
+
         返回:
-            估计的来源数量
+            工具消息的数量
         """
-        # 检查结果中是否有工具调用的迹象
-        if "messages" in result:
-            messages = result["messages"]
-            # 计算工具消息的数量
-            tool_messages = [
-                msg for msg in messages 
-                if hasattr(msg, "type") and "tool" in str(msg.type).lower()
-            ]
-            return len(tool_messages)
-        
-        return 0
-    
-    def _log_tool_executions_from_result(
+        tool_message_count = 0
+        # 尚未找到对应工具响应消息的工具调用（按出现顺序）
+        pending_calls = []
+
+        for msg in result.get("messages", []):
+            # 检查是否是 AI 消息且包含工具调用
+            if hasattr(msg, "tool_calls") and msg.tool_calls:
+                if self._flow_logger:
+                    pending_calls.extend(msg.tool_calls)
+                continue
+
+            if hasattr(msg, "type") and "tool" in str(msg.type).lower():
+                tool_message_count += 1
+                if pending_calls:
+                    # 之前的工具调用都以其后的第一条工具消息作为响应
+                    tool_output = str(msg.content) if hasattr(msg, "content") else ""
+                    # 检查是否有错误
+                    tool_status = (
+                        "error"
+                        if hasattr(msg, "status") and msg.status == "error"
+                        else "success"
+                    )
+                    self._log_tool_calls(pending_calls, tool_output, tool_status, start_time)
+                    pending_calls = []
+
+        # 没有工具响应消息的工具调用
+        if pending_calls:
+            self._log_tool_calls(pending_calls, "", "success", start_time)
+
+        return tool_message_count
+
+    def _log_tool_calls(
         self,
-        result: Dict,
+        tool_calls: List[Dict],
+        tool_output: str,
+        tool_status: str,
         start_time: float
     ) -> None:
         """
-        从代理执行结果中提取并记录工具执行信息
-        
+        记录一组共享同一工具响应的工具调用（统一流程日志）
+
         参数:
-            result: 代理执行结果
+            tool_calls: 工具调用列表
+            tool_output: 工具输出
+            tool_status: 工具执行状态
             start_time: 代理执行开始时间
         """
-        if not self._flow_logger:
-            return
-        
         try:
-            import time
-            messages = result.get("messages", [])
-            
-            # 查找工具调用和工具消息对
-            for i, msg in enumerate(messages):
-                # 检查是否是 AI 消息且包含工具调用
-                if hasattr(msg, "tool_calls") and msg.tool_calls:
-                    for tool_call in msg.tool_calls:
-                        tool_name = tool_call.get("name", "unknown_tool")
-                        tool_input = str(tool_call.get("args", {}))
-                        
-                        # 查找对应的工具响应消息
-                        tool_output = ""
-                        tool_status = "success"
-                        for j in range(i + 1, len(messages)):
-                            next_msg = messages[j]
-                            if hasattr(next_msg, "type") and "tool" in str(next_msg.type).lower():
-                                if hasattr(next_msg, "content"):
-                                    tool_output = str(next_msg.content)
-                                # 检查是否有错误
-                                if hasattr(next_msg, "status") and next_msg.status == "error":
-                                    tool_status = "error"
-                                break
-                        
-                        # 估计工具执行时间（使用总时间的一部分）
-                        duration = time.time() - start_time
-                        
-                        # 记录工具执行
-                        self._flow_logger.log_tool_execution(
-                            tool_name=tool_name,
-                            tool_input=tool_input,
-                            tool_output=tool_output,
-                            duration_seconds=duration,
-                            status=tool_status
-                        )
+            for tool_call in tool_calls:
+                # 估计工具执行时间（使用总时间的一部分）
+                duration = time.time() - start_time
+
+                # 记录工具执行
+                self._flow_logger.log_tool_execution(
+                    tool_name=tool_call.get("name", "unknown_tool"),
+                    tool_input=str(tool_call.get("args", {})),
+                    tool_output=tool_output,
+                    duration_seconds=duration,
+                    status=tool_status
+                )
         except Exception as e:
-            logger.warning(f"从结果中记录工具执行失败: {e}", exc_info=True)
+            logger.warning("从结果中记录工具执行失败: %s", e, exc_info=True)
     
     def _log_llm_calls_from_result(
         self,
-        result: Dict,
         input_messages: List,
-        duration: float
+        duration: float,
+        ai_response: str
     ) -> None:
         """
-        从代理执行结果中提取并记录 LLM 调用信息
+        记录 LLM 调用信息
         
         参数:
-            result: 代理执行结果
             input_messages: 输入消息列表
             duration: 总执行时间
+            ai_response: 已从代理执行结果中提取的最终 AI 响应
         """
         if not self._flow_logger:
             return
         
         try:
-            messages = result.get("messages", [])
-            
-            # 构建提示词（从输入消息）
+            # 收集提示词各部分（从输入消息）并累计长度；
+            # 完整提示词只在流程日志需要输出时才拼接
             prompt_parts = []
+            prompt_length = 0
             for msg in input_messages:
                 if hasattr(msg, "content"):
-                    prompt_parts.append(str(msg.content))
-            prompt = "\n".join(prompt_parts)
-            
-            # 提取最终的 AI 响应
-            response = ""
-            for msg in reversed(messages):
-                if hasattr(msg, "type") and "ai" in str(msg.type).lower():
-                    if hasattr(msg, "content"):
-                        response = str(msg.content)
-                    break
+                    content = str(msg.content)
+                    prompt_parts.append(content)
+                    prompt_length += len(content)
+            # 计入各部分之间的换行符
+            prompt_length += max(len(prompt_parts) - 1, 0)
+            response = ai_response
             
             # 估计 token 使用量（粗略估计：2 个字符 ≈ 1 个 token）
-            prompt_tokens = len(prompt) // 2
+            prompt_tokens = prompt_length // 2
             response_tokens = len(response) // 2
             token_usage = {
                 "prompt_tokens": prompt_tokens,
@@ -609,14 +704,14 @@ class SimpleRAGAgent:
             # 记录 LLM 调用
             self._flow_logger.log_llm_call(
                 model=settings.llm_model,
-                prompt=prompt,
+                prompt=lambda: "\n".join(prompt_parts),
                 response=response,
                 duration_seconds=duration,
                 token_usage=token_usage,
                 status="success"
             )
         except Exception as e:
-            logger.warning(f"从结果中记录 LLM 调用失败: {e}", exc_info=True)
+            logger.warning("从结果中记录 LLM 调用失败: %s", e, exc_info=True)
 
     def shutdown(self, timeout: float = 5.0) -> None:
         """
@@ -631,7 +726,7 @@ class SimpleRAGAgent:
         try:
             self._initializer.shutdown(timeout=timeout)
         except Exception as e:
-            logger.error(f"关闭初始化器时出错: {e}")
+            logger.error("关闭初始化器时出错: %s", e)
         
         # 刷新反思日志记录器
         if self._reflection_logger:
@@ -639,7 +734,7 @@ class SimpleRAGAgent:
                 self._reflection_logger.shutdown(timeout=timeout)
                 logger.debug("✓ 反思日志记录器已关闭")
             except Exception as e:
-                logger.error(f"关闭反思日志记录器时出错: {e}")
+                logger.error("关闭反思日志记录器时出错: %s", e)
         
         # 刷新上下文日志记录器
         if self._context_logger:
@@ -647,7 +742,7 @@ class SimpleRAGAgent:
                 self._context_logger.shutdown(timeout=timeout)
                 logger.debug("✓ 上下文日志记录器已关闭")
             except Exception as e:
-                logger.error(f"关闭上下文日志记录器时出错: {e}")
+                logger.error("关闭上下文日志记录器时出错: %s", e)
         
         # 刷新流程日志记录器
         if self._flow_logger:
@@ -655,7 +750,7 @@ class SimpleRAGAgent:
                 self._flow_logger.flush()
                 logger.debug("✓ 流程日志记录器已关闭")
             except Exception as e:
-                logger.error(f"关闭流程日志记录器时出错: {e}")
+                logger.error("关闭流程日志记录器时出错: %s", e)
         
         logger.info("✓ SimpleRAGAgent 已关闭")
     
@@ -666,18 +761,24 @@ class SimpleRAGAgent:
 
 # 全局代理实例（延迟初始化）
 _agent: Optional[SimpleRAGAgent] = None
+_agent_lock = threading.Lock()
 
 
 def _get_agent() -> SimpleRAGAgent:
     """
     获取或创建全局代理实例（延迟初始化）
 
+    使用双重检查锁：并发的首次调用只会创建一个实例，
+    实例创建后的调用不再获取锁。
+
     返回:
         全局 SimpleRAGAgent 实例
     """
     global _agent
     if _agent is None:
-        _agent = SimpleRAGAgent()
+        with _agent_lock:
+            if _agent is None:
+                _agent = SimpleRAGAgent()
     return _agent
 
 
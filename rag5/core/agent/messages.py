@@ -4,7 +4,7 @@
 处理消息格式转换，包括字典格式和 LangChain 消息格式之间的相互转换。
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from langchain_core.messages import (
     BaseMessage,
     HumanMessage,
@@ -57,14 +57,40 @@ class MessageProcessor:
             >>> print(type(lc_msgs[0]))
             <class 'langchain_core.messages.human.HumanMessage'>
         """
+        return self.dict_to_langchain_with_length(messages)[0]
+
+    def dict_to_langchain_with_length(
+        self,
+        messages: List[Dict[str, str]]
+    ) -> Tuple[List[BaseMessage], int]:
+        """
+        将字典格式的消息转换为 LangChain 消息格式，并返回内容总长度
+
+        内容总长度在转换的同一次遍历中累加，调用方无需再遍历一次消息列表。
+
+        Args:
+            messages: 字典格式的消息列表，格式同 dict_to_langchain
+
+        Returns:
+            (LangChain 消息对象列表, 所有消息内容的总字符数)
+
+        Example:
+            >>> processor = MessageProcessor()
+            >>> lc_msgs, total_chars = processor.dict_to_langchain_with_length(
+            ...     [{"role": "user", "content": "你好"}]
+            ... )
+            >>> print(total_chars)
+            2
+        """
         langchain_messages = []
         
-        # Calculate total content length for logging
-        total_content_length = sum(len(msg.get("content", "")) for msg in messages)
+        # Total content length for logging, accumulated during conversion
+        total_content_length = 0
 
         for msg in messages:
             role = msg.get("role", "").lower()
             content = msg.get("content", "")
+            total_content_length += len(content)
 
             if role == "user":
                 langchain_messages.append(HumanMessage(content=content))
@@ -90,7 +116,7 @@ class MessageProcessor:
                 total_tokens=estimated_tokens
             )
 
-        return langchain_messages
+        return langchain_messages, total_content_length
 
     def langchain_to_dict(self, messages: List[BaseMessage]) -> List[Dict[str, str]]:
         """
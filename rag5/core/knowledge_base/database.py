@@ -22,6 +22,16 @@ from rag5.core.knowledge_base.models import (
 
 logger = logging.getLogger(__name__)
 
+# 早期创建的知识库在检索配置中没有这些字段，其向量集合按以下方式存储，
+# 读取时补齐，避免套用新知识库的默认值
+_LEGACY_RETRIEVAL_DEFAULTS = {
+    "quantization": "none",
+    "vector_datatype": "float32",
+    # Qdrant 集合默认的 ef_construct；搜索时沿用集合默认的 ef
+    "hnsw_ef_construct": 100,
+    "hnsw_ef_search": None,
+}
+
 
 class KnowledgeBaseDatabase:
     """知识库数据库操作类"""
@@ -618,7 +628,9 @@ class KnowledgeBaseDatabase:
             description=row["description"] or "",
             embedding_model=row["embedding_model"],
             chunk_config=ChunkConfig.model_validate_json(row["chunk_config"]),
-            retrieval_config=RetrievalConfig.model_validate_json(row["retrieval_config"]),
+            retrieval_config=RetrievalConfig(
+                **{**_LEGACY_RETRIEVAL_DEFAULTS, **json.loads(row["retrieval_config"])}
+            ),
             created_at=datetime.fromisoformat(row["created_at"]),
             updated_at=datetime.fromisoformat(row["updated_at"]),
             document_count=stats["document_count"],
@@ -4,6 +4,7 @@
 核心服务类，协调数据库、向量存储和缓存层，提供完整的知识库管理功能。
 """
 
+import asyncio
 import hashlib
 import logging
 import os
@@ -22,7 +23,11 @@ from rag5.core.knowledge_base.models import (
 )
 from rag5.core.knowledge_base.database import KnowledgeBaseDatabase
 from rag5.core.knowledge_base.provider import KnowledgeBaseProvider
-from rag5.core.knowledge_base.vector_manager import VectorStoreManager
+from rag5.core.knowledge_base.vector_manager import (
+    VectorStoreManager,
+    cosine_scores,
+    top_k_indices
+)
 
 logger = logging.getLogger(__name__)
 
@@ -57,6 +62,15 @@ class FileValidationError(KnowledgeBaseError):
     pass
 
 
+# 创建向量集合时即已确定的检索配置字段，修改后需要重建集合
+_COLLECTION_LEVEL_FIELDS = (
+    "quantization",
+    "vector_datatype",
+    "hnsw_m",
+    "hnsw_ef_construct",
+)
+
+
 class KnowledgeBaseManager:
     """
     知识库管理器
@@ -112,6 +126,9 @@ class KnowledgeBaseManager:
     # 默认文件大小限制（100MB）
     DEFAULT_MAX_FILE_SIZE = 100 * 1024 * 1024
     
+    # 启用重排序时，向量检索召回 top_k 的倍数作为候选
+    RERANK_OVERSAMPLING = 2
+    
     def __init__(
         self,
         db_path: str,
@@ -130,7 +147,10 @@ class KnowledgeBaseManager:
             embedding_dimension: 默认向量维度
             max_file_size: 最大文件大小（字节）
         """
-        self.db = KnowledgeBaseDatabase(db_path)
+        # 数据库在首次访问时才创建（见 db 属性），
+        # 与 QdrantManager 首次使用时才连接的行为保持一致
+        self.db_path = db_path
+        self._db: Optional[KnowledgeBaseDatabase] = None
         self.vector_manager = VectorStoreManager(qdrant_manager)
         self.provider = KnowledgeBaseProvider()
         self.embedding_dimension = embedding_dimension
@@ -142,6 +162,13 @@ class KnowledgeBaseManager:
         
         logger.info(f"知识库管理器初始化完成 (db: {db_path}, storage: {file_storage_path})")
     
+    @property
+    def db(self) -> KnowledgeBaseDatabase:
+        """SQLite 数据库（首次访问时创建并初始化表结构）"""
+        if self._db is None:
+            self._db = KnowledgeBaseDatabase(self.db_path)
+        return self._db
+    
     async def initialize(self) -> int:
         """
         初始化管理器，从数据库加载知识库到缓存
@@ -204,6 +231,12 @@ class KnowledgeBaseManager:
             ...     chunk_config=ChunkConfig(chunk_size=1024)
             ... )
             >>> print(f"创建知识库: {kb.id}")
+            >>>
+            >>> # 相互独立的知识库可以并发创建
+            >>> en_kb, zh_kb = await asyncio.gather(
+            ...     manager.create_knowledge_base(name="docs_en", embedding_model="bge-m3"),
+            ...     manager.create_knowledge_base(name="docs_zh", embedding_model="bge-m3")
+            ... )
         """
         try:
             logger.info(f"开始创建知识库: {name}")
@@ -256,7 +289,11 @@ class KnowledgeBaseManager:
                 vector_dim = embedding_dimension or self.embedding_dimension
                 await self.vector_manager.create_collection(
                     kb_id=kb.id,
-                    embedding_dimension=vector_dim
+                    embedding_dimension=vector_dim,
+                    quantization=kb.retrieval_config.quantization,
+                    vector_datatype=kb.retrieval_config.vector_datatype,
+                    hnsw_m=kb.retrieval_config.hnsw_m,
+                    hnsw_ef_construct=kb.retrieval_config.hnsw_ef_construct
                 )
                 logger.debug(f"向量集合创建成功: {kb.id}")
             except Exception as e:
@@ -379,7 +416,9 @@ class KnowledgeBaseManager:
         - description: 描述
         - embedding_model: 嵌入模型（警告：需要重新嵌入）
         - chunk_config: 分块配置
-        - retrieval_config: 检索配置
+        - retrieval_config: 检索配置（只更新显式设置的字段，其余保持不变；
+          quantization、vector_datatype、hnsw_m、hnsw_ef_construct
+          在创建集合时确定，不能修改）
         
         参数:
             kb_id: 知识库 ID
@@ -438,7 +477,28 @@ class KnowledgeBaseManager:
                         f"变更为 '{new_model}'。现有文档需要重新嵌入。"
                     )
             
-            # 4. 更新数据库
+            # 4. 合并检索配置：只覆盖显式设置的字段，未设置的字段保持现有值
+            if "retrieval_config" in updates:
+                new_config = updates["retrieval_config"]
+                if isinstance(new_config, RetrievalConfig):
+                    new_config = new_config.model_dump(exclude_unset=True)
+                retrieval_config = RetrievalConfig(
+                    **{**existing_kb.retrieval_config.model_dump(), **new_config}
+                )
+                
+                changed = [
+                    field for field in _COLLECTION_LEVEL_FIELDS
+                    if getattr(retrieval_config, field)
+                    != getattr(existing_kb.retrieval_config, field)
+                ]
+                if changed:
+                    raise KnowledgeBaseValidationError(
+                        f"知识库 {kb_id} 的 {', '.join(changed)} 在创建向量集合时已确定，"
+                        f"不能修改，请新建知识库"
+                    )
+                updates["retrieval_config"] = retrieval_config
+            
+            # 5. 更新数据库
             updated_kb = self.db.update_kb(kb_id, **updates)
             
             if not updated_kb:
@@ -446,14 +506,18 @@ class KnowledgeBaseManager:
             
             logger.debug(f"数据库更新成功: {kb_id}")
             
-            # 5. 更新缓存
+            # 6. 更新缓存
             self.provider.update(updated_kb)
             logger.debug(f"缓存更新成功: {kb_id}")
             
             logger.info(f"✓ 知识库更新成功: {kb_id}")
             return updated_kb
             
-        except (KnowledgeBaseNotFoundError, KnowledgeBaseAlreadyExistsError):
+        except (
+            KnowledgeBaseNotFoundError,
+            KnowledgeBaseAlreadyExistsError,
+            KnowledgeBaseValidationError
+        ):
             raise
         except Exception as e:
             logger.error(f"更新知识库失败: {e}", exc_info=True)
@@ -483,6 +547,11 @@ class KnowledgeBaseManager:
             >>> success = await manager.delete_knowledge_base("kb_123")
             >>> if success:
             ...     print("知识库已删除")
+            >>>
+            >>> # 多个知识库可以并发删除
+            >>> await asyncio.gather(
+            ...     *[manager.delete_knowledge_base(kb.id) for kb in kbs]
+            ... )
         """
         try:
             logger.info(f"删除知识库: {kb_id}")
@@ -889,7 +958,7 @@ class KnowledgeBaseManager:
             # 4. 从文件系统中删除文件
             if file_path.exists():
                 try:
-                    file_path.unlink()
+                    await asyncio.to_thread(file_path.unlink)
                     logger.debug(f"文件已从存储中删除: {file_path}")
                 except Exception as e:
                     logger.warning(f"删除存储文件失败（继续删除）: {e}")
@@ -1107,7 +1176,8 @@ class KnowledgeBaseManager:
                 embeddings_manager = OllamaEmbeddingsManager(
                     model=kb.embedding_model,
                     base_url=settings.ollama_host,
-                    batch_size=settings.ollama_batch_size
+                    batch_size=settings.ollama_batch_size,
+                    num_parallel=settings.ollama_num_parallel
                 )
                 logger.debug(f"使用 Ollama 嵌入模型: {kb.embedding_model}")
                 
@@ -1115,14 +1185,9 @@ class KnowledgeBaseManager:
                 texts = [chunk.page_content for chunk in chunks]
 
                 # 批量生成嵌入
-                # 使用 asyncio.to_thread 在线程池中运行同步的 HTTP 请求
-                # 这可以避免在异步上下文中阻塞事件循环
-                import asyncio
+                # 使用异步 HTTP 客户端并发发送批次，不阻塞事件循环
                 logger.debug(f"生成 {len(texts)} 个嵌入向量...")
-                embeddings = await asyncio.to_thread(
-                    embeddings_manager.embed_documents,
-                    texts
-                )
+                embeddings = await embeddings_manager.aembed_documents(texts)
                 
                 if len(embeddings) != len(chunks):
                     raise KnowledgeBaseError(
@@ -1226,6 +1291,54 @@ class KnowledgeBaseManager:
             
             raise KnowledgeBaseError(f"处理文件失败: {e}")
     
+    async def upload_and_process_files(
+        self,
+        kb_id: str,
+        file_paths: List[str]
+    ) -> List[FileEntity]:
+        """
+        上传并处理多个文件
+        
+        每个文件的"上传 → 处理"作为独立流水线并发执行，
+        一个文件的嵌入与存储可以与另一个文件的上传重叠。
+        
+        参数:
+            kb_id: 知识库 ID
+            file_paths: 文件路径列表
+        
+        返回:
+            处理成功的文件实体列表（保持输入顺序，失败的文件会被跳过并记录日志）
+        
+        示例:
+            >>> files = await manager.upload_and_process_files(
+            ...     "kb_123",
+            ...     ["docs/intro_en.md", "docs/intro_zh.md"]
+            ... )
+            >>> print(f"处理了 {len(files)} 个文件")
+        """
+        async def upload_and_process(file_path: str) -> FileEntity:
+            file_entity = await self.upload_file(kb_id=kb_id, file_path=file_path)
+            return await self.process_file(file_entity.id)
+        
+        logger.info(f"并发上传并处理 {len(file_paths)} 个文件到知识库 {kb_id}")
+        
+        results = await asyncio.gather(
+            *(upload_and_process(file_path) for file_path in file_paths),
+            return_exceptions=True
+        )
+        
+        processed_files = []
+        for file_path, result in zip(file_paths, results):
+            if isinstance(result, BaseException):
+                logger.error(f"上传或处理文件失败: {file_path}: {result}")
+            else:
+                processed_files.append(result)
+        
+        logger.info(
+            f"✓ 完成 {len(processed_files)}/{len(file_paths)} 个文件的上传与处理"
+        )
+        return processed_files
+    
     def _calculate_md5(self, file_path: Path) -> str:
         """
         计算文件的 MD5 哈希值
@@ -1238,10 +1351,16 @@ class KnowledgeBaseManager:
         """
         md5_hash = hashlib.md5()
         
-        with open(file_path, "rb") as f:
-            # 分块读取以处理大文件
-            for chunk in iter(lambda: f.read(8192), b""):
-                md5_hash.update(chunk)
+        # 分块读取以处理大文件；复用同一个缓冲区，避免每次读取都分配新的 bytes
+        buffer = bytearray(1024 * 1024)
+        view = memoryview(buffer)
+        
+        with open(file_path, "rb", buffering=0) as f:
+            while True:
+                size = f.readinto(buffer)
+                if not size:
+                    break
+                md5_hash.update(view[:size])
         
         return md5_hash.hexdigest()
     
@@ -1261,7 +1380,7 @@ class KnowledgeBaseManager:
         return {
             "cached_kbs": cache_stats["total_kbs"],
             "embedding_dimension": self.embedding_dimension,
-            "db_path": self.db.db_path,
+            "db_path": self.db_path,
             "file_storage_path": str(self.file_storage_path),
             "max_file_size": self.max_file_size
         }
@@ -1377,12 +1496,21 @@ class KnowledgeBaseManager:
             # 5. 搜索向量存储
             logger.debug("[2/3] 搜索向量存储...")
             
+            rerank_enabled = bool(
+                retrieval_config.enable_rerank and retrieval_config.rerank_model
+            )
+            # 启用重排序时多召回一些候选，重排后再截断为 top_k
+            search_top_k = (
+                final_top_k * self.RERANK_OVERSAMPLING if rerank_enabled else final_top_k
+            )
+            
             try:
                 search_results = await self.vector_manager.search(
                     kb_id=kb_id,
                     query_vector=query_vector,
-                    top_k=final_top_k,
-                    score_threshold=final_threshold
+                    top_k=search_top_k,
+                    score_threshold=final_threshold,
+                    hnsw_ef=retrieval_config.hnsw_ef_search
                 )
                 
                 logger.debug(f"✓ 搜索完成，找到 {len(search_results)} 个结果")
@@ -1395,39 +1523,24 @@ class KnowledgeBaseManager:
             # 6. 格式化结果
             logger.debug("[3/3] 格式化结果...")
             
-            formatted_results = []
-            for result in search_results:
-                payload = result.get("payload", {})
-                
-                formatted_result = {
-                    "id": result.get("id"),
-                    "score": result.get("score"),
-                    "text": payload.get("text", ""),
-                    "file_id": payload.get("file_id", ""),
-                    "source": payload.get("source", ""),
-                    "chunk_index": payload.get("chunk_index", 0),
-                    "kb_id": payload.get("kb_id", kb_id),
-                    "metadata": {
-                        k: v for k, v in payload.items()
-                        if k not in ["text", "file_id", "source", "chunk_index", "kb_id"]
-                    }
-                }
-                
-                formatted_results.append(formatted_result)
+            formatted_results = [
+                self._format_search_result(result, kb_id)
+                for result in search_results
+            ]
             
             # 7. 应用重排序（如果启用）
-            if retrieval_config.enable_rerank and retrieval_config.rerank_model:
-                logger.debug("重排序已启用，但当前未实现重排序功能")
-                logger.warning(
-                    f"知识库 {kb_id} 启用了重排序 (模型: {retrieval_config.rerank_model})，"
-                    "但重排序功能尚未实现，将跳过此步骤"
-                )
-                # TODO: 实现重排序功能
-                # formatted_results = self._apply_reranking(
-                #     query=query,
-                #     results=formatted_results,
-                #     rerank_model=retrieval_config.rerank_model
-                # )
+            if rerank_enabled and formatted_results:
+                try:
+                    formatted_results = await self._apply_reranking(
+                        query=query,
+                        results=formatted_results,
+                        rerank_model=retrieval_config.rerank_model,
+                        top_k=final_top_k
+                    )
+                except Exception as e:
+                    # 重排序失败时退回向量检索的结果
+                    logger.warning(f"重排序失败，使用向量检索结果: {e}")
+                    formatted_results = formatted_results[:final_top_k]
             
             # 8. 记录结果统计
             if formatted_results:
@@ -1449,6 +1562,216 @@ class KnowledgeBaseManager:
             logger.error(f"查询知识库时发生未预期的错误: {e}", exc_info=True)
             raise KnowledgeBaseError(f"查询知识库失败: {e}")
     
+    async def query_knowledge_base_batch(
+        self,
+        kb_id: str,
+        queries: List[str],
+        top_k: Optional[int] = None,
+        similarity_threshold: Optional[float] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        批量查询知识库中的文档
+        
+        多个相互独立的查询共用一次嵌入请求和一次 Qdrant 批量搜索，
+        结果格式与 query_knowledge_base 相同。
+        
+        参数:
+            kb_id: 知识库 ID
+            queries: 查询文本列表
+            top_k: 每个查询返回的结果数量（可选，使用知识库配置）
+            similarity_threshold: 相似度阈值（可选，使用知识库配置）
+        
+        返回:
+            搜索结果列表，与 queries 一一对应
+        
+        异常:
+            KnowledgeBaseNotFoundError: 知识库不存在
+            ValueError: 查询列表为空或包含空查询
+            KnowledgeBaseError: 查询失败
+        
+        示例:
+            >>> all_results = await manager.query_knowledge_base_batch(
+            ...     kb_id="kb_123",
+            ...     queries=["什么是人工智能？", "什么是机器学习？"],
+            ...     top_k=2
+            ... )
+            >>> for query_results in all_results:
+            ...     print(len(query_results))
+        """
+        try:
+            logger.info(f"批量查询知识库 {kb_id}: {len(queries)} 个查询")
+            
+            # 1. 验证查询文本
+            if not queries:
+                raise ValueError("查询列表不能为空")
+            
+            queries = [query.strip() if query else "" for query in queries]
+            if not all(queries):
+                raise ValueError("查询文本不能为空")
+            
+            # 2. 获取知识库配置
+            kb = self.db.get_kb(kb_id)
+            if not kb:
+                raise KnowledgeBaseNotFoundError(f"知识库不存在: {kb_id}")
+            
+            retrieval_config = kb.retrieval_config
+            final_top_k = top_k if top_k is not None else retrieval_config.top_k
+            final_threshold = (
+                similarity_threshold 
+                if similarity_threshold is not None 
+                else retrieval_config.similarity_threshold
+            )
+            
+            # 3. 一次请求生成所有查询向量
+            logger.debug("[1/3] 批量生成查询向量...")
+            
+            try:
+                from rag5.tools.embeddings import OllamaEmbeddingsManager
+                from rag5.config import settings
+                
+                embeddings_manager = OllamaEmbeddingsManager(
+                    model=kb.embedding_model,
+                    base_url=settings.ollama_host,
+                    batch_size=len(queries)
+                )
+                query_vectors = await embeddings_manager.aembed_documents(queries)
+                
+            except Exception as e:
+                error_msg = f"生成查询向量失败: {e}"
+                logger.error(error_msg, exc_info=True)
+                raise KnowledgeBaseError(error_msg)
+            
+            # 4. 一次请求执行所有向量搜索
+            logger.debug("[2/3] 批量搜索向量存储...")
+            
+            try:
+                batch_results = await self.vector_manager.search_batch(
+                    kb_id=kb_id,
+                    query_vectors=query_vectors,
+                    top_k=final_top_k,
+                    score_threshold=final_threshold,
+                    hnsw_ef=retrieval_config.hnsw_ef_search
+                )
+            except Exception as e:
+                error_msg = f"向量搜索失败: {e}"
+                logger.error(error_msg, exc_info=True)
+                raise KnowledgeBaseError(error_msg)
+            
+            # 5. 格式化结果
+            logger.debug("[3/3] 格式化结果...")
+            
+            if retrieval_config.enable_rerank and retrieval_config.rerank_model:
+                logger.warning(
+                    f"知识库 {kb_id} 启用了重排序 (模型: {retrieval_config.rerank_model})，"
+                    "但批量查询暂不支持重排序，将跳过此步骤"
+                )
+            
+            all_results = [
+                [self._format_search_result(result, kb_id) for result in search_results]
+                for search_results in batch_results
+            ]
+            
+            logger.info(
+                f"✓ 批量查询完成，共返回 "
+                f"{sum(len(results) for results in all_results)} 个结果"
+            )
+            
+            return all_results
+            
+        except (KnowledgeBaseNotFoundError, ValueError):
+            raise
+        except KnowledgeBaseError:
+            raise
+        except Exception as e:
+            logger.error(f"批量查询知识库时发生未预期的错误: {e}", exc_info=True)
+            raise KnowledgeBaseError(f"批量查询知识库失败: {e}")
+    
+    async def _apply_reranking(
+        self,
+        query: str,
+        results: List[Dict[str, Any]],
+        rerank_model: str,
+        top_k: int
+    ) -> List[Dict[str, Any]]:
+        """
+        使用重排序模型对候选结果重新打分
+        
+        查询与所有非空候选文本通过一次嵌入请求完成向量化，
+        再按余弦相似度重新排序并截断为 top_k。空文本候选不参与重排序。
+        
+        参数:
+            query: 查询文本
+            results: 格式化后的候选结果
+            rerank_model: 用于重排序的嵌入模型
+            top_k: 返回结果数量
+        
+        返回:
+            重排序后的结果列表，每个结果增加 rerank_score 字段
+        """
+        from rag5.tools.embeddings import OllamaEmbeddingsManager
+        from rag5.config import settings
+        
+        # 嵌入接口会丢弃空白文本，这里先剔除空文本候选，再按下标映射回原结果
+        candidate_indices = [
+            i for i, result in enumerate(results)
+            if result["text"] and result["text"].strip()
+        ]
+        if not candidate_indices:
+            return results[:top_k]
+        
+        texts = [query] + [results[i]["text"] for i in candidate_indices]
+        
+        embeddings_manager = OllamaEmbeddingsManager(
+            model=rerank_model,
+            base_url=settings.ollama_host,
+            batch_size=len(texts)
+        )
+        vectors = await embeddings_manager.aembed_documents(texts)
+        
+        if len(vectors) != len(texts):
+            raise KnowledgeBaseError(
+                f"重排序向量数量 ({len(vectors)}) 与文本数量 ({len(texts)}) 不匹配"
+            )
+        
+        scores = cosine_scores(vectors[0], vectors[1:])
+        
+        reranked = []
+        for index in top_k_indices(scores, top_k):
+            result = results[candidate_indices[index]]
+            result["rerank_score"] = float(scores[index])
+            reranked.append(result)
+        
+        logger.debug(f"重排序完成 (模型: {rerank_model})，候选数: {len(results)}")
+        return reranked
+    
+    @staticmethod
+    def _format_search_result(result: Dict[str, Any], kb_id: str) -> Dict[str, Any]:
+        """
+        将向量搜索结果转换为查询结果格式
+        
+        参数:
+            result: 向量存储返回的结果（id, score, payload）
+            kb_id: 知识库 ID
+        
+        返回:
+            格式化后的结果字典
+        """
+        payload = result.get("payload", {})
+        
+        return {
+            "id": result.get("id"),
+            "score": result.get("score"),
+            "text": payload.get("text", ""),
+            "file_id": payload.get("file_id", ""),
+            "source": payload.get("source", ""),
+            "chunk_index": payload.get("chunk_index", 0),
+            "kb_id": payload.get("kb_id", kb_id),
+            "metadata": {
+                k: v for k, v in payload.items()
+                if k not in ["text", "file_id", "source", "chunk_index", "kb_id"]
+            }
+        }
+    
     def __repr__(self) -> str:
         """返回管理器的字符串表示"""
         stats = self.get_statistics()
@@ -10,6 +10,14 @@ from enum import Enum
 from typing import Optional, Dict, Any
 from pydantic import BaseModel, Field, field_validator
 
+from rag5.config.defaults import (
+    DEFAULT_KB_QUANTIZATION,
+    DEFAULT_KB_VECTOR_DATATYPE,
+    DEFAULT_KB_HNSW_M,
+    DEFAULT_KB_HNSW_EF_CONSTRUCT,
+    DEFAULT_KB_HNSW_EF_SEARCH,
+)
+
 
 class ChunkConfig(BaseModel):
     """文档分块配置"""
@@ -51,6 +59,12 @@ class RetrievalConfig(BaseModel):
     vector_weight: float = Field(default=0.5, ge=0.0, le=1.0)
     enable_rerank: bool = Field(default=False)
     rerank_model: str = Field(default="")
+    quantization: str = Field(default=DEFAULT_KB_QUANTIZATION)
+    vector_datatype: str = Field(default=DEFAULT_KB_VECTOR_DATATYPE)
+    hnsw_m: int = Field(default=DEFAULT_KB_HNSW_M, ge=4, le=128)
+    hnsw_ef_construct: int = Field(default=DEFAULT_KB_HNSW_EF_CONSTRUCT, ge=4, le=1000)
+    # None 表示搜索时使用集合的默认 ef
+    hnsw_ef_search: Optional[int] = Field(default=DEFAULT_KB_HNSW_EF_SEARCH, ge=1, le=1000)
     
     @field_validator("retrieval_mode")
     @classmethod
@@ -62,6 +76,28 @@ class RetrievalConfig(BaseModel):
                 f"retrieval_mode 必须是以下之一: {', '.join(allowed_modes)}"
             )
         return v
+    
+    @field_validator("quantization")
+    @classmethod
+    def validate_quantization(cls, v: str) -> str:
+        """验证向量量化方式"""
+        allowed_types = ["none", "int8", "binary"]
+        if v not in allowed_types:
+            raise ValueError(
+                f"quantization 必须是以下之一: {', '.join(allowed_types)}"
+            )
+        return v
+    
+    @field_validator("vector_datatype")
+    @classmethod
+    def validate_vector_datatype(cls, v: str) -> str:
+        """验证向量存储类型"""
+        allowed_types = ["float32", "float16"]
+        if v not in allowed_types:
+            raise ValueError(
+                f"vector_datatype 必须是以下之一: {', '.join(allowed_types)}"
+            )
+        return v
 
 
 class KnowledgeBase(BaseModel):
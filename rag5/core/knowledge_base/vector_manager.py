@@ -4,23 +4,165 @@
 管理知识库的向量集合，提供集合创建、删除、数据插入和搜索功能。
 """
 
+import asyncio
 import logging
 import uuid
 from typing import List, Dict, Any, Optional
 
+import numpy as np
 from qdrant_client.models import (
+    Datatype,
     Distance,
-    PointStruct,
     Filter,
     FieldCondition,
-    MatchValue
+    MatchValue,
+    QuantizationConfig,
+    ScalarQuantization,
+    ScalarQuantizationConfig,
+    ScalarType,
+    BinaryQuantization,
+    BinaryQuantizationConfig,
+    SearchParams,
+    QuantizationSearchParams,
+    HnswConfigDiff
 )
 
+from rag5.config.defaults import (
+    DEFAULT_KB_QUANTIZATION,
+    DEFAULT_KB_VECTOR_DATATYPE,
+    DEFAULT_KB_HNSW_M,
+    DEFAULT_KB_HNSW_EF_CONSTRUCT,
+)
 from rag5.tools.vectordb.qdrant_client import QdrantManager
 
 logger = logging.getLogger(__name__)
 
 
+def build_quantization_config(quantization: str) -> Optional[QuantizationConfig]:
+    """
+    根据量化方式名称构建 Qdrant 量化配置
+
+    量化后的向量常驻内存用于候选扫描，原始向量保留用于重打分。
+
+    参数:
+        quantization: 量化方式（"none", "int8", "binary"）
+
+    返回:
+        Qdrant 量化配置，"none" 时返回 None
+
+    异常:
+        ValueError: 不支持的量化方式
+
+    示例:
+        >>> config = build_quantization_config("int8")
+    """
+    if quantization == "none":
+        return None
+    if quantization == "int8":
+        return ScalarQuantization(
+            scalar=ScalarQuantizationConfig(
+                type=ScalarType.INT8,
+                quantile=0.99,
+                always_ram=True
+            )
+        )
+    if quantization == "binary":
+        return BinaryQuantization(
+            binary=BinaryQuantizationConfig(always_ram=True)
+        )
+    raise ValueError(f"不支持的量化方式: {quantization}")
+
+
+def build_vector_datatype(vector_datatype: str) -> Datatype:
+    """
+    根据存储类型名称获取 Qdrant 向量数据类型
+
+    float16 相比 float32 向量占用的内存和磁盘减半，检索精度损失可以忽略。
+
+    参数:
+        vector_datatype: 向量存储类型（"float32", "float16"）
+
+    返回:
+        Qdrant 向量数据类型
+
+    异常:
+        ValueError: 不支持的存储类型
+
+    示例:
+        >>> datatype = build_vector_datatype("float16")
+    """
+    if vector_datatype == "float32":
+        return Datatype.FLOAT32
+    if vector_datatype == "float16":
+        return Datatype.FLOAT16
+    raise ValueError(f"不支持的向量存储类型: {vector_datatype}")
+
+
+def cosine_scores(query_vector: List[float], candidate_vectors: List[List[float]]) -> np.ndarray:
+    """
+    计算查询向量与一组候选向量的余弦相似度
+
+    候选向量打包为一个 (N, D) 矩阵，通过一次矩阵-向量乘法完成打分。
+
+    参数:
+        query_vector: 查询向量
+        candidate_vectors: 候选向量列表
+
+    返回:
+        长度为 N 的相似度数组（零向量的相似度为 0）
+
+    示例:
+        >>> scores = cosine_scores([1.0, 0.0], [[1.0, 0.0], [0.0, 1.0]])
+    """
+    query = np.asarray(query_vector, dtype=np.float32)
+    matrix = np.asarray(candidate_vectors, dtype=np.float32)
+
+    norms = np.linalg.norm(matrix, axis=1) * np.linalg.norm(query)
+    dots = matrix @ query
+    return np.divide(dots, norms, out=np.zeros_like(dots), where=norms > 0)
+
+
+def top_k_indices(scores: np.ndarray, top_k: int) -> np.ndarray:
+    """
+    返回分数最高的 top_k 个下标（按分数降序）
+
+    使用 argpartition 先选出 top_k 个候选，只对这部分排序。
+
+    参数:
+        scores: 分数数组
+        top_k: 返回数量
+
+    返回:
+        下标数组
+    """
+    if top_k >= len(scores):
+        return np.argsort(-scores, kind="stable")
+    candidates = np.argpartition(-scores, top_k - 1)[:top_k]
+    return candidates[np.argsort(-scores[candidates], kind="stable")]
+
+
+def build_search_params(hnsw_ef: Optional[int] = None) -> SearchParams:
+    """
+    构建查询时的搜索参数
+
+    量化参数：先用量化向量扫描 2 倍候选，再用原始向量重打分；
+    对未量化的集合，Qdrant 会忽略该参数。
+
+    参数:
+        hnsw_ef: HNSW 搜索时的候选列表大小（可选，默认使用集合配置）
+
+    返回:
+        Qdrant 搜索参数
+
+    示例:
+        >>> params = build_search_params(hnsw_ef=64)
+    """
+    return SearchParams(
+        hnsw_ef=hnsw_ef,
+        quantization=QuantizationSearchParams(rescore=True, oversampling=2.0)
+    )
+
+
 class VectorStoreManager:
     """
     向量存储管理器
@@ -66,33 +208,59 @@ class VectorStoreManager:
         self,
         kb_id: str,
         embedding_dimension: int,
-        distance: Distance = Distance.COSINE
+        distance: Distance = Distance.COSINE,
+        quantization: str = DEFAULT_KB_QUANTIZATION,
+        vector_datatype: str = DEFAULT_KB_VECTOR_DATATYPE,
+        hnsw_m: int = DEFAULT_KB_HNSW_M,
+        hnsw_ef_construct: int = DEFAULT_KB_HNSW_EF_CONSTRUCT
     ) -> None:
         """
         为知识库创建向量集合
         
         集合名称使用知识库 ID，确保每个知识库有独立的向量空间。
+        启用量化时，量化向量常驻内存，原始向量存放在磁盘上仅用于重打分。
         
         参数:
             kb_id: 知识库 ID（用作集合名称）
             embedding_dimension: 向量维度
             distance: 距离度量方式（默认为余弦距离）
+            quantization: 向量量化方式（"none", "int8", "binary"）
+            vector_datatype: 向量存储类型（"float32", "float16"）
+            hnsw_m: HNSW 图中每个节点的连接数
+            hnsw_ef_construct: HNSW 构建索引时的候选列表大小
         
         异常:
             Exception: 集合创建失败
         
         示例:
             >>> await manager.create_collection("kb_abc123", 1024)
+            >>> await manager.create_collection("kb_def456", 1024, quantization="none")
         """
         try:
             logger.info(f"为知识库 {kb_id} 创建向量集合")
-            logger.debug(f"集合参数 - 维度: {embedding_dimension}, 距离: {distance}")
+            logger.debug(
+                f"集合参数 - 维度: {embedding_dimension}, 距离: {distance}, "
+                f"量化: {quantization}, 存储类型: {vector_datatype}, "
+                f"HNSW m: {hnsw_m}, ef_construct: {hnsw_ef_construct}"
+            )
             
+            quantization_config = build_quantization_config(quantization)
+
             # 使用 QdrantManager 的 ensure_collection 方法
-            self.qdrant_manager.ensure_collection(
+            # 在线程池中执行同步的 Qdrant 请求，使多个知识库可以并发创建
+            await asyncio.to_thread(
+                self.qdrant_manager.ensure_collection,
                 collection_name=kb_id,
                 vector_dim=embedding_dimension,
-                distance=distance
+                distance=distance,
+                quantization_config=quantization_config,
+                on_disk=quantization_config is not None,
+                datatype=build_vector_datatype(vector_datatype),
+                hnsw_config=HnswConfigDiff(
+                    m=hnsw_m,
+                    ef_construct=hnsw_ef_construct,
+                    on_disk=False
+                )
             )
             
             # 更新缓存
@@ -124,8 +292,11 @@ class VectorStoreManager:
                 logger.warning(f"集合 {kb_id} 不存在，无需删除")
                 return True
             
-            # 删除集合
-            success = self.qdrant_manager.delete_collection(kb_id)
+            # 删除集合（在线程池中执行，多个知识库可以并发删除）
+            success = await asyncio.to_thread(
+                self.qdrant_manager.delete_collection,
+                kb_id
+            )
             
             # 清除缓存
             self.collection_cache.pop(kb_id, None)
@@ -214,9 +385,10 @@ class VectorStoreManager:
             if not await self.collection_exists(kb_id):
                 raise ValueError(f"知识库 {kb_id} 的向量集合不存在")
             
-            # 构建 PointStruct 列表
-            points = []
-            for chunk, embedding in zip(chunks, embeddings):
+            # 构建 ID 与 payload 列表，向量打包为一个矩阵整体上传
+            ids = []
+            payloads = []
+            for chunk in chunks:
                 # 确保每个块都有唯一 ID
                 chunk_id = chunk.get("id")
                 if not chunk_id:
@@ -249,22 +421,22 @@ class VectorStoreManager:
                     if key not in payload and key != "id":
                         payload[key] = value
 
-                points.append(
-                    PointStruct(
-                        id=str(point_id),  # 转换为字符串形式的 UUID
-                        vector=embedding,
-                        payload=payload
-                    )
-                )
+                ids.append(str(point_id))  # 转换为字符串形式的 UUID
+                payloads.append(payload)
+            
+            vectors = np.asarray(embeddings, dtype=np.float32)
             
-            # 批量上传
-            self.qdrant_manager.upsert(
+            # 批量上传（在线程池中执行，避免阻塞事件循环）
+            await asyncio.to_thread(
+                self.qdrant_manager.upload_points,
                 collection_name=kb_id,
-                points=points
+                vectors=vectors,
+                payloads=payloads,
+                ids=ids
             )
             
-            logger.info(f"✓ 成功插入 {len(points)} 个文档块到知识库 {kb_id}")
-            return len(points)
+            logger.info(f"✓ 成功插入 {len(ids)} 个文档块到知识库 {kb_id}")
+            return len(ids)
         except Exception as e:
             logger.error(f"插入文档块失败: {e}", exc_info=True)
             raise
@@ -319,7 +491,8 @@ class VectorStoreManager:
         query_vector: List[float],
         top_k: int = 5,
         score_threshold: Optional[float] = None,
-        query_filter: Optional[Filter] = None
+        query_filter: Optional[Filter] = None,
+        hnsw_ef: Optional[int] = None
     ) -> List[Dict[str, Any]]:
         """
         在知识库中搜索相似文档块
@@ -330,6 +503,7 @@ class VectorStoreManager:
             top_k: 返回结果数量
             score_threshold: 相似度阈值（可选）
             query_filter: 额外的查询过滤器（可选）
+            hnsw_ef: HNSW 搜索时的候选列表大小（可选）
         
         返回:
             搜索结果列表，每个结果包含 id, score, payload
@@ -362,7 +536,8 @@ class VectorStoreManager:
                 query_vector=query_vector,
                 limit=top_k,
                 score_threshold=score_threshold,
-                query_filter=query_filter
+                query_filter=query_filter,
+                search_params=build_search_params(hnsw_ef)
             )
             
             # 转换结果格式
@@ -389,6 +564,77 @@ class VectorStoreManager:
             logger.error(f"搜索失败: {e}", exc_info=True)
             raise
     
+    async def search_batch(
+        self,
+        kb_id: str,
+        query_vectors: List[List[float]],
+        top_k: int = 5,
+        score_threshold: Optional[float] = None,
+        query_filter: Optional[Filter] = None,
+        hnsw_ef: Optional[int] = None
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        在知识库中批量搜索相似文档块
+        
+        多个相互独立的查询通过一次 Qdrant 批量请求完成。
+        
+        参数:
+            kb_id: 知识库 ID
+            query_vectors: 查询向量列表
+            top_k: 每个查询返回的结果数量
+            score_threshold: 相似度阈值（可选）
+            query_filter: 额外的查询过滤器（可选）
+            hnsw_ef: HNSW 搜索时的候选列表大小（可选）
+        
+        返回:
+            搜索结果列表，与 query_vectors 一一对应，
+            每个元素是包含 id, score, payload 的结果列表
+        
+        异常:
+            ValueError: 集合不存在
+            Exception: 搜索失败
+        
+        示例:
+            >>> batch_results = await manager.search_batch(
+            ...     "kb_abc123",
+            ...     query_vectors=[vector_a, vector_b],
+            ...     top_k=5
+            ... )
+        """
+        try:
+            logger.info(f"在知识库 {kb_id} 中批量搜索 {len(query_vectors)} 个查询")
+            logger.debug(f"搜索参数 - top_k: {top_k}, threshold: {score_threshold}")
+            
+            # 检查集合是否存在
+            if not await self.collection_exists(kb_id):
+                raise ValueError(f"知识库 {kb_id} 的向量集合不存在")
+            
+            # 执行批量搜索
+            batch_points = self.qdrant_manager.search_batch(
+                collection_name=kb_id,
+                query_vectors=query_vectors,
+                limit=top_k,
+                score_threshold=score_threshold,
+                query_filter=query_filter,
+                search_params=build_search_params(hnsw_ef)
+            )
+            
+            # 转换结果格式
+            return [
+                [
+                    {
+                        "id": point.id,
+                        "score": point.score,
+                        "payload": point.payload
+                    }
+                    for point in scored_points
+                ]
+                for scored_points in batch_points
+            ]
+        except Exception as e:
+            logger.error(f"批量搜索失败: {e}", exc_info=True)
+            raise
+    
     def get_collection_stats(self, kb_id: str) -> Optional[Dict[str, Any]]:
         """
         获取知识库向量集合的统计信息
@@ -38,6 +38,15 @@ class ChineseTextSplitter:
     # 次要分隔符（用于长句子的进一步分割）
     SECONDARY_SEPARATORS = ['，', '、', '：', '"', '"', ''', ''']
 
+    # 预编译的分隔符模式与边界字符集（类加载时构建一次，分割时不再重复编译）
+    _SENTENCE_PATTERN = re.compile(
+        '([' + ''.join(re.escape(sep) for sep in SENTENCE_SEPARATORS) + '])'
+    )
+    _SECONDARY_PATTERN = re.compile(
+        '([' + ''.join(re.escape(sep) for sep in SECONDARY_SEPARATORS) + '])'
+    )
+    _BOUNDARY_CHARS = frozenset(SENTENCE_SEPARATORS + SECONDARY_SEPARATORS + [' ', '\t'])
+
     def __init__(
         self,
         chunk_size: int = 500,
@@ -174,11 +183,8 @@ class ChineseTextSplitter:
         Returns:
             句子列表
         """
-        # 构建正则表达式模式，匹配句子分隔符
-        pattern = '([' + ''.join(re.escape(sep) for sep in self.SENTENCE_SEPARATORS) + '])'
-        
         # 分割并保留分隔符
-        parts = re.split(pattern, text)
+        parts = self._SENTENCE_PATTERN.split(text)
         
         # 重新组合句子和分隔符
         sentences = []
@@ -207,8 +213,7 @@ class ChineseTextSplitter:
             分割后的文本块列表
         """
         # 首先尝试使用次要分隔符
-        pattern = '([' + ''.join(re.escape(sep) for sep in self.SECONDARY_SEPARATORS) + '])'
-        parts = re.split(pattern, sentence)
+        parts = self._SECONDARY_PATTERN.split(sentence)
         
         chunks = []
         current_chunk = ""
@@ -295,13 +300,11 @@ class ChineseTextSplitter:
         search_start = max(start, end - 50)
         search_text = text[search_start:end]
         
-        # 查找所有可能的分隔符
-        all_separators = self.SENTENCE_SEPARATORS + self.SECONDARY_SEPARATORS + [' ', '\t']
-        
         # 从后向前查找最近的分隔符
+        boundary_chars = self._BOUNDARY_CHARS
         best_pos = -1
         for i in range(len(search_text) - 1, -1, -1):
-            if search_text[i] in all_separators:
+            if search_text[i] in boundary_chars:
                 best_pos = search_start + i + 1
                 break
         
@@ -333,10 +336,10 @@ class ChineseTextSplitter:
         overlap_text = text[overlap_start:]
         
         # 尝试找到一个好的起始点（句子或词语边界）
-        all_separators = self.SENTENCE_SEPARATORS + self.SECONDARY_SEPARATORS + [' ', '\t']
+        boundary_chars = self._BOUNDARY_CHARS
         
         for i in range(len(overlap_text)):
-            if overlap_text[i] in all_separators:
+            if overlap_text[i] in boundary_chars:
                 return overlap_text[i+1:]
         
         return overlap_text
@@ -7,7 +7,7 @@
 import uuid
 import logging
 import time
-from typing import List
+from typing import List, Optional
 from langchain_core.documents import Document
 from qdrant_client.models import PointStruct
 
@@ -19,7 +19,8 @@ class BatchVectorizer:
     批量向量化器
 
     将文档块批量转换为向量表示，并创建Qdrant Point对象。
-    支持批量处理和错误重试。
+    每个批次通过一次 embed_documents 请求完成向量化，批次失败时
+    退回到逐块向量化并重试。
 
     Args:
         embeddings: 嵌入模型实例（如OllamaEmbeddings）
@@ -87,38 +88,48 @@ class BatchVectorizer:
         points = []
         failed_indices = []
 
-        for i, chunk in enumerate(chunks, 1):
-            try:
-                # 生成向量（带重试）
-                vector = self._embed_with_retry(chunk.page_content, i)
+        for start in range(0, len(chunks), self.batch_size):
+            batch = chunks[start:start + self.batch_size]
+
+            # 整批向量化，一次请求处理 batch_size 个块
+            vectors = self._embed_batch([chunk.page_content for chunk in batch])
+
+            for offset, chunk in enumerate(batch):
+                i = start + offset + 1
+                try:
+                    if vectors is not None:
+                        vector = vectors[offset]
+                    else:
+                        # 批次失败时逐块生成向量（带重试）
+                        vector = self._embed_with_retry(chunk.page_content, i)
+
+                    if vector is None:
+                        logger.warning(f"块 {i}/{len(chunks)} 向量化失败，跳过")
+                        failed_indices.append(i)
+                        continue
+
+                    # 创建Point对象
+                    point = PointStruct(
+                        id=str(uuid.uuid4()),
+                        vector=vector,
+                        payload={
+                            "text": chunk.page_content,
+                            "source": chunk.metadata.get("source", "unknown"),
+                            "metadata": chunk.metadata
+                        }
+                    )
 
-                if vector is None:
-                    logger.warning(f"块 {i}/{len(chunks)} 向量化失败，跳过")
+                    points.append(point)
+
+                except Exception as e:
+                    logger.warning(f"处理块 {i}/{len(chunks)} 时出错: {e}")
                     failed_indices.append(i)
                     continue
 
-                # 创建Point对象
-                point = PointStruct(
-                    id=str(uuid.uuid4()),
-                    vector=vector,
-                    payload={
-                        "text": chunk.page_content,
-                        "source": chunk.metadata.get("source", "unknown"),
-                        "metadata": chunk.metadata
-                    }
-                )
-
-                points.append(point)
-
-                # 定期输出进度
-                if i % self.batch_size == 0 or i == len(chunks):
-                    progress = (i / len(chunks)) * 100
-                    logger.info(f"  进度: {i}/{len(chunks)} ({progress:.1f}%)")
-
-            except Exception as e:
-                logger.warning(f"处理块 {i}/{len(chunks)} 时出错: {e}")
-                failed_indices.append(i)
-                continue
+            # 每个批次输出一次进度
+            done = start + len(batch)
+            progress = (done / len(chunks)) * 100
+            logger.info(f"  进度: {done}/{len(chunks)} ({progress:.1f}%)")
 
         success_rate = (len(points) / len(chunks)) * 100 if chunks else 0
 
@@ -129,6 +140,32 @@ class BatchVectorizer:
 
         return points
 
+    def _embed_batch(self, texts: List[str]) -> Optional[List[List[float]]]:
+        """
+        通过一次 embed_documents 调用生成整批向量
+
+        Args:
+            texts: 要向量化的文本列表
+
+        Returns:
+            与 texts 一一对应的向量列表，失败或数量不匹配时返回None
+        """
+        try:
+            vectors = self.embeddings.embed_documents(texts)
+        except Exception as e:
+            logger.debug(f"批量向量化失败，退回逐块处理: {e}")
+            return None
+
+        if len(vectors) != len(texts):
+            # 嵌入后端可能过滤掉空文本，此时无法按位置对应
+            logger.debug(
+                f"批量向量数量 ({len(vectors)}) 与文本数量 ({len(texts)}) 不匹配，"
+                f"退回逐块处理"
+            )
+            return None
+
+        return vectors
+
     def _embed_with_retry(self, text: str, index: int) -> List[float]:
         """
         带重试的向量生成
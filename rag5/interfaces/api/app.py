@@ -39,7 +39,12 @@ async def lifespan(app: FastAPI):
         data_dir.mkdir(parents=True, exist_ok=True)
 
         # 初始化 Qdrant 管理器
-        qdrant_manager = QdrantManager(url=settings.qdrant_url)
+        qdrant_manager = QdrantManager(
+            url=settings.qdrant_url,
+            prefer_grpc=settings.qdrant_prefer_grpc,
+            grpc_port=settings.qdrant_grpc_port,
+            timeout=settings.qdrant_timeout
+        )
         logger.info(f"Qdrant 管理器已连接到: {settings.qdrant_url}")
 
         # 初始化知识库管理器
@@ -12,6 +12,13 @@ from fastapi import APIRouter, HTTPException, UploadFile, File, Form, Query, sta
 from pydantic import BaseModel, Field, field_validator
 
 from rag5.config import settings
+from rag5.config.defaults import (
+    DEFAULT_KB_QUANTIZATION,
+    DEFAULT_KB_VECTOR_DATATYPE,
+    DEFAULT_KB_HNSW_M,
+    DEFAULT_KB_HNSW_EF_CONSTRUCT,
+    DEFAULT_KB_HNSW_EF_SEARCH,
+)
 from rag5.core.knowledge_base import (
     KnowledgeBaseManager,
     KnowledgeBase,
@@ -95,6 +102,12 @@ class RetrievalConfigRequest(BaseModel):
     vector_weight: float = Field(default=0.5, ge=0.0, le=1.0)
     enable_rerank: bool = Field(default=False)
     rerank_model: str = Field(default="")
+    quantization: str = Field(default=DEFAULT_KB_QUANTIZATION)
+    vector_datatype: str = Field(default=DEFAULT_KB_VECTOR_DATATYPE)
+    hnsw_m: int = Field(default=DEFAULT_KB_HNSW_M, ge=4, le=128)
+    hnsw_ef_construct: int = Field(default=DEFAULT_KB_HNSW_EF_CONSTRUCT, ge=4, le=1000)
+    # None 表示搜索时使用集合的默认 ef
+    hnsw_ef_search: Optional[int] = Field(default=DEFAULT_KB_HNSW_EF_SEARCH, ge=1, le=1000)
 
 
 class CreateKBRequest(BaseModel):
@@ -611,7 +624,8 @@ async def update_knowledge_base(kb_id: str, request: UpdateKBRequest) -> KBRespo
         if request.chunk_config is not None:
             updates["chunk_config"] = ChunkConfig(**request.chunk_config.model_dump())
         if request.retrieval_config is not None:
-            updates["retrieval_config"] = RetrievalConfig(**request.retrieval_config.model_dump())
+            # 只传递请求中显式设置的字段，由管理器合并到现有配置上
+            updates["retrieval_config"] = request.retrieval_config.model_dump(exclude_unset=True)
         
         if not updates:
             raise HTTPException(
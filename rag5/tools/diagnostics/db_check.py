@@ -7,13 +7,8 @@
 import argparse
 import logging
 import sys
-from pathlib import Path
 from typing import Optional
 
-# 添加项目根目录到 Python 路径
-project_root = Path(__file__).parent.parent.parent.parent
-sys.path.insert(0, str(project_root))
-
 from rag5.config import settings
 from rag5.tools.vectordb import QdrantManager
 from rag5.tools.embeddings import OllamaEmbeddingsManager
@@ -5,14 +5,81 @@ Ollama 嵌入模型管理模块
 参考 LM Studio 实现，提供简洁可靠的嵌入服务。
 """
 
+import asyncio
+import hashlib
 import logging
+import threading
 import requests
-from typing import List
+import httpx
+from collections import OrderedDict
+from typing import Dict, List, Optional, Tuple
 import time
 
+from rag5.config.defaults import DEFAULT_EMBEDDING_CACHE_SIZE
+
 logger = logging.getLogger(__name__)
 
 
+class _QueryEmbeddingCache:
+    """
+    查询向量 LRU 缓存
+
+    键为 (base_url, model, 文本摘要)，模型变化时自然不会命中旧向量。
+    使用 blake2b 摘要代替原文作为键，限制长查询占用的内存。
+    嵌入请求可能在线程池中执行，因此所有操作都加锁。
+    """
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Tuple[str, str, bytes], List[float]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @staticmethod
+    def make_key(base_url: str, model: str, text: str) -> Tuple[str, str, bytes]:
+        digest = hashlib.blake2b(text.encode("utf-8"), digest_size=16).digest()
+        return (base_url, model, digest)
+
+    def get(self, key: Tuple[str, str, bytes]) -> Optional[List[float]]:
+        with self._lock:
+            vector = self._data.get(key)
+            if vector is None:
+                self.misses += 1
+                return None
+            self._data.move_to_end(key)
+            self.hits += 1
+            return list(vector)
+
+    def put(self, key: Tuple[str, str, bytes], vector: List[float]) -> None:
+        if self.maxsize <= 0:
+            return
+        with self._lock:
+            self._data[key] = list(vector)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+            self.hits = 0
+            self.misses = 0
+
+    def info(self) -> Dict[str, int]:
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "maxsize": self.maxsize,
+                "currsize": len(self._data),
+            }
+
+
+# 进程内共享的查询向量缓存（管理器通常按请求创建，缓存需跨实例复用）
+_query_cache = _QueryEmbeddingCache(DEFAULT_EMBEDDING_CACHE_SIZE)
+
+
 class OllamaEmbeddingsManager:
     """Ollama 嵌入模型管理器"""
 
@@ -20,7 +87,8 @@ class OllamaEmbeddingsManager:
         self,
         model: str = "bge-m3",
         base_url: str = "http://localhost:11434",
-        batch_size: int = 10
+        batch_size: int = 10,
+        num_parallel: int = 1
     ):
         """
         初始化 Ollama 嵌入管理器
@@ -29,11 +97,13 @@ class OllamaEmbeddingsManager:
             model: Ollama 中加载的模型名称
             base_url: Ollama API 地址
             batch_size: 批次大小
+            num_parallel: 异步嵌入时同时发送的最大批次数
         """
         self.model = model
         # 标准化 base_url - 移除尾部斜杠
         self.base_url = base_url.rstrip('/')
         self.batch_size = batch_size
+        self.num_parallel = max(1, num_parallel)
         self.embeddings_url = f"{self.base_url}/api/embed"
 
         logger.info(f"初始化 Ollama 嵌入管理器: model={model}, embeddings_url={self.embeddings_url}")
@@ -121,6 +191,12 @@ class OllamaEmbeddingsManager:
         返回:
             向量（浮点数列表）
         """
+        cache_key = _query_cache.make_key(self.base_url, self.model, text)
+        cached = _query_cache.get(cache_key)
+        if cached is not None:
+            logger.debug("查询向量缓存命中")
+            return cached
+
         start_time = time.time()
 
         try:
@@ -143,6 +219,7 @@ class OllamaEmbeddingsManager:
                     raise ValueError("Ollama 返回空嵌入列表")
 
                 vector = embeddings[0]
+                _query_cache.put(cache_key, vector)
 
                 elapsed = time.time() - start_time
                 logger.debug(
@@ -216,46 +293,13 @@ class OllamaEmbeddingsManager:
                     timeout=120
                 )
 
-                logger.debug(f"收到响应，状态码: {response.status_code}")
-
-                if response.status_code == 200:
-                    try:
-                        result = response.json()
-                        logger.debug(f"Ollama 响应键: {list(result.keys())}")
-                    except Exception as json_err:
-                        logger.error(f"JSON 解析失败: {json_err}")
-                        logger.error(f"响应内容: {response.text[:500]}")
-                        raise RuntimeError(f"无法解析 Ollama 响应: {json_err}")
-
-                    # 检查响应格式 - Ollama 使用 "embeddings" 而不是 "data"
-                    if 'embeddings' not in result:
-                        logger.error(f"响应缺少 'embeddings' 字段。完整响应: {result}")
-                        raise RuntimeError(f"Ollama 响应格式错误: 缺少 'embeddings' 字段")
-
-                    batch_vectors = result['embeddings']
-
-                    if len(batch_vectors) != len(batch):
-                        raise ValueError(
-                            f"返回向量数量 ({len(batch_vectors)}) 与文档数量 ({len(batch)}) 不匹配"
-                        )
-
-                    vectors.extend(batch_vectors)
+                vectors.extend(self._parse_batch_response(response, batch, batch_index))
 
-                    batch_time = time.time() - batch_start
-                    logger.debug(
-                        f"批次 {batch_index} 完成，耗时: {batch_time:.3f}秒，"
-                        f"速度: {len(batch)/batch_time:.1f} 文档/秒"
-                    )
-                else:
-                    error_msg = f"批次 {batch_index} 失败: HTTP {response.status_code}"
-                    try:
-                        error_detail = response.json()
-                        error_msg += f", 详情: {error_detail}"
-                    except:
-                        error_msg += f", 响应: {response.text[:200]}"
-
-                    logger.error(error_msg)
-                    raise RuntimeError(error_msg)
+                batch_time = time.time() - batch_start
+                logger.debug(
+                    f"批次 {batch_index} 完成，耗时: {batch_time:.3f}秒，"
+                    f"速度: {len(batch)/batch_time:.1f} 文档/秒"
+                )
 
             except requests.exceptions.RequestException as req_err:
                 logger.error(f"批次 {batch_index} 网络请求失败: {req_err}")
@@ -272,6 +316,162 @@ class OllamaEmbeddingsManager:
 
         return vectors
 
+    async def aembed_query(self, text: str) -> List[float]:
+        """
+        异步将查询文本转换为向量
+
+        参数:
+            text: 查询文本
+
+        返回:
+            向量（浮点数列表）
+        """
+        cache_key = _query_cache.make_key(self.base_url, self.model, text)
+        cached = _query_cache.get(cache_key)
+        if cached is not None:
+            logger.debug("查询向量缓存命中")
+            return cached
+
+        vectors = await self.aembed_documents([text])
+        _query_cache.put(cache_key, vectors[0])
+        return vectors[0]
+
+    @staticmethod
+    def cache_info() -> Dict[str, int]:
+        """
+        获取查询向量缓存的统计信息
+
+        返回:
+            包含 hits, misses, maxsize, currsize 的字典
+        """
+        return _query_cache.info()
+
+    @staticmethod
+    def clear_cache() -> None:
+        """清空查询向量缓存"""
+        _query_cache.clear()
+
+    async def aembed_documents(
+        self,
+        texts: List[str],
+        num_parallel: Optional[int] = None
+    ) -> List[List[float]]:
+        """
+        异步将多个文档文本转换为向量
+
+        按 batch_size 拆分批次，并通过 asyncio.gather 并发发送，
+        同时在途的批次数不超过 num_parallel。
+
+        参数:
+            texts: 文档文本列表
+            num_parallel: 最大并发批次数（可选，默认使用实例配置）
+
+        返回:
+            向量列表，顺序与输入一致
+        """
+        if not texts:
+            raise ValueError("文档文本列表不能为空")
+
+        # 过滤空文本
+        valid_texts = [t for t in texts if t and t.strip()]
+        if not valid_texts:
+            raise ValueError("所有文档文本都为空")
+
+        batches = [
+            valid_texts[i:i + self.batch_size]
+            for i in range(0, len(valid_texts), self.batch_size)
+        ]
+        semaphore = asyncio.Semaphore(num_parallel or self.num_parallel)
+
+        logger.info(
+            f"使用 Ollama 异步嵌入 {len(valid_texts)} 个文档，"
+            f"批次大小: {self.batch_size}, 批次数量: {len(batches)}, "
+            f"并发数: {num_parallel or self.num_parallel}"
+        )
+
+        start_time = time.time()
+
+        async with httpx.AsyncClient(timeout=120) as client:
+
+            async def embed_batch(batch_index: int, batch: List[str]) -> List[List[float]]:
+                async with semaphore:
+                    try:
+                        response = await client.post(
+                            self.embeddings_url,
+                            json={"model": self.model, "input": batch}
+                        )
+                    except httpx.HTTPError as req_err:
+                        logger.error(f"批次 {batch_index} 网络请求失败: {req_err}")
+                        raise
+                return self._parse_batch_response(response, batch, batch_index)
+
+            results = await asyncio.gather(
+                *(embed_batch(index, batch) for index, batch in enumerate(batches, start=1))
+            )
+
+        vectors = [vector for batch_vectors in results for vector in batch_vectors]
+
+        total_time = time.time() - start_time
+        logger.info(
+            f"✓ Ollama 异步嵌入完成，生成 {len(vectors)} 个向量，"
+            f"总耗时: {total_time:.2f}秒"
+        )
+
+        return vectors
+
+    def _parse_batch_response(self, response, batch: List[str], batch_index: int) -> List[List[float]]:
+        """
+        解析批量嵌入请求的响应
+
+        同时兼容 requests 与 httpx 的响应对象。
+
+        参数:
+            response: HTTP 响应
+            batch: 本批次的文本列表
+            batch_index: 批次序号（用于日志）
+
+        返回:
+            本批次的向量列表
+
+        异常:
+            RuntimeError: 响应状态码或格式错误
+            ValueError: 返回向量数量与文本数量不匹配
+        """
+        logger.debug(f"收到响应，状态码: {response.status_code}")
+
+        if response.status_code != 200:
+            error_msg = f"批次 {batch_index} 失败: HTTP {response.status_code}"
+            try:
+                error_detail = response.json()
+                error_msg += f", 详情: {error_detail}"
+            except:
+                error_msg += f", 响应: {response.text[:200]}"
+
+            logger.error(error_msg)
+            raise RuntimeError(error_msg)
+
+        try:
+            result = response.json()
+            logger.debug(f"Ollama 响应键: {list(result.keys())}")
+        except Exception as json_err:
+            logger.error(f"JSON 解析失败: {json_err}")
+            logger.error(f"响应内容: {response.text[:500]}")
+            raise RuntimeError(f"无法解析 Ollama 响应: {json_err}")
+
+        # 检查响应格式 - Ollama 使用 "embeddings" 而不是 "data"
+        if 'embeddings' not in result:
+            logger.error(f"响应缺少 'embeddings' 字段。完整响应: {result}")
+            raise RuntimeError(f"Ollama 响应格式错误: 缺少 'embeddings' 字段")
+
+        batch_vectors = result['embeddings']
+
+        if len(batch_vectors) != len(batch):
+            raise ValueError(
+                f"返回向量数量 ({len(batch_vectors)}) 与文档数量 ({len(batch)}) 不匹配"
+            )
+
+        return batch_vectors
+
     def __repr__(self) -> str:
         """返回管理器的字符串表示"""
         return f"<OllamaEmbeddingsManager(model='{self.model}', base_url='{self.base_url}')>"
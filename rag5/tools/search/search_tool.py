@@ -52,7 +52,12 @@ def _get_qdrant_manager() -> QdrantManager:
     """
     global _qdrant_manager
     if _qdrant_manager is None:
-        _qdrant_manager = QdrantManager(url=settings.qdrant_url)
+        _qdrant_manager = QdrantManager(
+            url=settings.qdrant_url,
+            prefer_grpc=settings.qdrant_prefer_grpc,
+            grpc_port=settings.qdrant_grpc_port,
+            timeout=settings.qdrant_timeout
+        )
         # 确保集合存在
         _qdrant_manager.ensure_collection(
             collection_name=settings.collection_name,
@@ -87,19 +92,15 @@ def _get_kb_manager():
     if _kb_manager is None:
         try:
             from rag5.core.knowledge_base import KnowledgeBaseManager
-            from rag5.tools.vectordb import QdrantManager
-            from pathlib import Path
             
             # 初始化知识库管理器
             db_path = settings.kb_database_path if hasattr(settings, 'kb_database_path') else "data/knowledge_bases.db"
             file_storage_path = settings.kb_file_storage_path if hasattr(settings, 'kb_file_storage_path') else "docs"
             
-            # 创建 Qdrant 管理器
-            qdrant_manager = QdrantManager(url=settings.qdrant_url)
-
+            # 复用全局 Qdrant 管理器，共享同一个客户端连接
             _kb_manager = KnowledgeBaseManager(
                 db_path=db_path,
-                qdrant_manager=qdrant_manager,
+                qdrant_manager=_get_qdrant_manager(),
                 file_storage_path=file_storage_path
             )
             
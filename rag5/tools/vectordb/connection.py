@@ -22,6 +22,9 @@ class ConnectionManager:
 
     属性:
         url: Qdrant 服务地址
+        prefer_grpc: 是否优先使用 gRPC 协议
+        grpc_port: gRPC 端口
+        timeout: 请求超时时间（秒）
         client: Qdrant 客户端实例
 
     示例:
@@ -33,16 +36,28 @@ class ConnectionManager:
         >>> client = manager.get_client()
     """
 
-    def __init__(self, url: str):
+    def __init__(
+        self,
+        url: str,
+        prefer_grpc: bool = False,
+        grpc_port: int = 6334,
+        timeout: Optional[int] = None
+    ):
         """
         初始化连接管理器
 
         参数:
             url: Qdrant 服务地址
+            prefer_grpc: 是否优先使用 gRPC 协议（默认为 False）
+            grpc_port: gRPC 端口（默认为 6334）
+            timeout: 请求超时时间（秒，默认使用客户端默认值）
         """
         self.url = url
+        self.prefer_grpc = prefer_grpc
+        self.grpc_port = grpc_port
+        self.timeout = timeout
         self._client: Optional[QdrantClient] = None
-        logger.debug(f"初始化连接管理器: {url}")
+        logger.debug(f"初始化连接管理器: {url} (gRPC: {prefer_grpc})")
 
     @retry_with_backoff(max_retries=3, initial_delay=1.0)
     def connect(self) -> QdrantClient:
@@ -61,7 +76,13 @@ class ConnectionManager:
         """
         try:
             logger.info(f"正在连接到 Qdrant: {self.url}")
-            self._client = QdrantClient(url=self.url)
+            # 客户端在管理器生命周期内复用，底层连接保持 keep-alive
+            self._client = QdrantClient(
+                url=self.url,
+                prefer_grpc=self.prefer_grpc,
+                grpc_port=self.grpc_port,
+                timeout=self.timeout
+            )
 
             # 测试连接
             self._client.get_collections()
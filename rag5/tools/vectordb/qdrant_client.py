@@ -10,6 +10,11 @@ from qdrant_client import QdrantClient
 from qdrant_client.models import (
     Distance,
     VectorParams,
+    Datatype,
+    HnswConfigDiff,
+    QuantizationConfig,
+    SearchParams,
+    QueryRequest,
     PointStruct,
     ScoredPoint,
     Filter,
@@ -32,7 +37,7 @@ class QdrantManager:
 
     属性:
         url: Qdrant 服务地址
-        connection_manager: 连接管理器
+        connection_manager: 连接管理器（同一实例的所有操作共享一个客户端）
 
     示例:
         >>> from rag5.tools.vectordb import QdrantManager
@@ -42,15 +47,29 @@ class QdrantManager:
         >>> results = manager.search("my_collection", query_vector, limit=5)
     """
 
-    def __init__(self, url: str):
+    def __init__(
+        self,
+        url: str,
+        prefer_grpc: bool = False,
+        grpc_port: int = 6334,
+        timeout: Optional[int] = None
+    ):
         """
         初始化 Qdrant 管理器
 
         参数:
             url: Qdrant 服务地址
+            prefer_grpc: 是否优先使用 gRPC 协议（默认为 False）
+            grpc_port: gRPC 端口（默认为 6334）
+            timeout: 请求超时时间（秒，默认使用客户端默认值）
         """
         self.url = url
-        self.connection_manager = ConnectionManager(url)
+        self.connection_manager = ConnectionManager(
+            url,
+            prefer_grpc=prefer_grpc,
+            grpc_port=grpc_port,
+            timeout=timeout
+        )
         logger.debug(f"初始化 Qdrant 管理器: {url}")
 
     @property
@@ -63,7 +82,11 @@ class QdrantManager:
         self,
         collection_name: str,
         vector_dim: int,
-        distance: Distance = Distance.COSINE
+        distance: Distance = Distance.COSINE,
+        quantization_config: Optional[QuantizationConfig] = None,
+        on_disk: bool = False,
+        datatype: Optional[Datatype] = None,
+        hnsw_config: Optional[HnswConfigDiff] = None
     ) -> None:
         """
         确保集合存在
@@ -74,6 +97,10 @@ class QdrantManager:
             collection_name: 集合名称
             vector_dim: 向量维度
             distance: 距离度量方式（默认为余弦距离）
+            quantization_config: 向量量化配置（可选，默认不量化）
+            on_disk: 是否将原始向量存放在磁盘上（默认 False）
+            datatype: 向量存储类型（可选，默认由 Qdrant 使用 float32）
+            hnsw_config: HNSW 索引配置（可选，默认使用 Qdrant 默认值）
 
         示例:
             >>> manager = QdrantManager("http://localhost:6333")
@@ -89,8 +116,12 @@ class QdrantManager:
                     collection_name=collection_name,
                     vectors_config=VectorParams(
                         size=vector_dim,
-                        distance=distance
-                    )
+                        distance=distance,
+                        on_disk=on_disk,
+                        datatype=datatype
+                    ),
+                    quantization_config=quantization_config,
+                    hnsw_config=hnsw_config
                 )
                 logger.info(f"✓ 集合 '{collection_name}' 创建成功")
             else:
@@ -155,7 +186,8 @@ class QdrantManager:
         query_vector: List[float],
         limit: int = 5,
         score_threshold: Optional[float] = None,
-        query_filter: Optional[Filter] = None
+        query_filter: Optional[Filter] = None,
+        search_params: Optional[SearchParams] = None
     ) -> List[ScoredPoint]:
         """
         向量搜索
@@ -166,6 +198,7 @@ class QdrantManager:
             limit: 返回结果数量
             score_threshold: 相似度阈值（可选）
             query_filter: 查询过滤器（可选）
+            search_params: 搜索参数，如量化重打分设置（可选）
 
         返回:
             搜索结果列表
@@ -196,7 +229,8 @@ class QdrantManager:
                 query=query_vector,
                 limit=limit,
                 score_threshold=score_threshold,
-                query_filter=query_filter
+                query_filter=query_filter,
+                search_params=search_params
             ).points
             
             search_time = time.time() - start_time
@@ -225,6 +259,75 @@ class QdrantManager:
             logger.error(f"搜索时出错: {e}", exc_info=True)
             raise
 
+    @retry_with_backoff(max_retries=3, initial_delay=1.0)
+    def search_batch(
+        self,
+        collection_name: str,
+        query_vectors: List[List[float]],
+        limit: int = 5,
+        score_threshold: Optional[float] = None,
+        query_filter: Optional[Filter] = None,
+        search_params: Optional[SearchParams] = None
+    ) -> List[List[ScoredPoint]]:
+        """
+        批量向量搜索
+
+        通过一次 query_batch_points 请求执行多个相互独立的查询。
+
+        参数:
+            collection_name: 集合名称
+            query_vectors: 查询向量列表
+            limit: 每个查询返回的结果数量
+            score_threshold: 相似度阈值（可选）
+            query_filter: 查询过滤器（可选，应用于所有查询）
+            search_params: 搜索参数，如量化重打分设置（可选）
+
+        返回:
+            搜索结果列表，与 query_vectors 一一对应
+
+        示例:
+            >>> manager = QdrantManager("http://localhost:6333")
+            >>> batch_results = manager.search_batch(
+            ...     "knowledge_base",
+            ...     query_vectors=[vector_a, vector_b],
+            ...     limit=5
+            ... )
+        """
+        try:
+            import time
+            start_time = time.time()
+
+            logger.debug(
+                f"批量搜索集合 '{collection_name}'，查询数: {len(query_vectors)}"
+            )
+
+            requests = [
+                QueryRequest(
+                    query=query_vector,
+                    limit=limit,
+                    score_threshold=score_threshold,
+                    filter=query_filter,
+                    params=search_params,
+                    with_payload=True
+                )
+                for query_vector in query_vectors
+            ]
+
+            responses = self.client.query_batch_points(
+                collection_name=collection_name,
+                requests=requests
+            )
+
+            search_time = time.time() - start_time
+            logger.info(
+                f"批量搜索完成，{len(query_vectors)} 个查询 (耗时: {search_time:.3f}秒)"
+            )
+
+            return [response.points for response in responses]
+        except Exception as e:
+            logger.error(f"批量搜索时出错: {e}", exc_info=True)
+            raise
+
     @retry_with_backoff(max_retries=3, initial_delay=1.0)
     def upsert(
         self,
@@ -283,6 +386,63 @@ class QdrantManager:
             logger.error(f"上传向量点时出错: {e}", exc_info=True)
             raise
 
+    def upload_points(
+        self,
+        collection_name: str,
+        vectors: Any,
+        payloads: List[Dict[str, Any]],
+        ids: List[str],
+        batch_size: int = 256,
+        parallel: int = 1,
+        wait: bool = True
+    ) -> None:
+        """
+        批量上传向量
+
+        使用 upload_collection 直接上传向量矩阵与 payload，无需为每个点
+        构建 PointStruct，由客户端负责分批和失败重试。
+
+        参数:
+            collection_name: 集合名称
+            vectors: 向量矩阵（numpy 数组或向量列表）
+            payloads: payload 列表，与 vectors 一一对应
+            ids: 点 ID 列表，与 vectors 一一对应
+            batch_size: 每个请求上传的点数（默认 256）
+            parallel: 并行上传的进程数（默认 1）
+            wait: 是否等待写入完成（默认 True）
+
+        示例:
+            >>> import numpy as np
+            >>> manager = QdrantManager("http://localhost:6333")
+            >>> manager.upload_points(
+            ...     "knowledge_base",
+            ...     vectors=np.zeros((2, 1024), dtype=np.float32),
+            ...     payloads=[{"text": "a"}, {"text": "b"}],
+            ...     ids=[str(uuid.uuid4()), str(uuid.uuid4())]
+            ... )
+        """
+        try:
+            import time
+            start_time = time.time()
+
+            logger.debug(f"批量上传 {len(ids)} 个点到集合 '{collection_name}'")
+
+            self.client.upload_collection(
+                collection_name=collection_name,
+                vectors=vectors,
+                payload=payloads,
+                ids=ids,
+                batch_size=batch_size,
+                parallel=parallel,
+                wait=wait
+            )
+
+            upload_time = time.time() - start_time
+            logger.info(f"✓ 成功上传 {len(ids)} 个点 (耗时: {upload_time:.3f}秒)")
+        except Exception as e:
+            logger.error(f"批量上传向量时出错: {e}", exc_info=True)
+            raise
+
     def delete_collection(self, collection_name: str) -> bool:
         """
         删除集合
@@ -6,7 +6,7 @@ processing flow of each user query in a single, chronologically ordered format.
 """
 
 from datetime import datetime
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, Callable, Union
 
 
 class FlowFormatter:
@@ -309,7 +309,7 @@ class FlowFormatter:
     def format_llm_call(
         self,
         model: str,
-        prompt: str,
+        prompt: Union[str, Callable[[], str]],
         response: str,
         duration_seconds: float,
         elapsed_time: float,
@@ -321,7 +321,8 @@ class FlowFormatter:
         
         Args:
             model: Model name
-            prompt: Prompt sent to LLM
+            prompt: Prompt sent to LLM, or a callable that builds it; the
+                callable is only invoked when the prompt is rendered
             response: Response from LLM
             duration_seconds: Call duration
             elapsed_time: Time elapsed since query start
@@ -368,6 +369,8 @@ class FlowFormatter:
             )
         
         # Add prompt and response
+        if callable(prompt):
+            prompt = prompt()
         prompt_truncated = self.truncate_content(prompt)
         response_truncated = self.truncate_content(response)
         
@@ -387,7 +390,7 @@ class FlowFormatter:
         self,
         error_type: str,
         error_message: str,
-        stack_trace: Optional[str],
+        stack_trace: Optional[Union[str, Callable[[], str]]],
         elapsed_time: float
     ) -> str:
         """
@@ -396,7 +399,8 @@ class FlowFormatter:
         Args:
             error_type: Type of error
             error_message: Error message
-            stack_trace: Optional stack trace
+            stack_trace: Optional stack trace, or a callable that builds it;
+                the callable is only invoked when the stack trace is rendered
             elapsed_time: Time elapsed since query start
             
         Returns:
@@ -421,6 +425,8 @@ class FlowFormatter:
         ]
         
         # Add stack trace if available
+        if callable(stack_trace):
+            stack_trace = stack_trace()
         if stack_trace:
             lines.extend([
                 "",
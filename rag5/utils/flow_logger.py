@@ -6,11 +6,12 @@ capture all events in a query processing flow in chronological order.
 """
 
 import logging
+import threading
 import time
 import traceback
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Optional, Dict, Callable, Union
 
 from rag5.utils.flow_formatter import FlowFormatter
 from rag5.utils.async_writer import AsyncLogWriter, register_async_writer
@@ -62,6 +63,13 @@ class FlowLogger:
         ...     final_answer="The capital of France is Paris.",
         ...     total_duration_seconds=2.5
         ... )
+        >>> 
+        >>> # Batch all events of one query into a single write
+        >>> logger.begin_query()
+        >>> try:
+        ...     logger.log_query_start("What is the capital of France?")
+        ... finally:
+        ...     logger.end_query()
     """
     
     def __init__(
@@ -94,6 +102,10 @@ class FlowLogger:
         # Track query start time for elapsed time calculation
         self._start_time: Optional[float] = None
         
+        # Entries buffered between begin_query() and end_query(), kept per
+        # thread so concurrent queries sharing this logger don't mix buffers
+        self._local = threading.local()
+        
         # Initialize formatter
         self.formatter = FlowFormatter(
             detail_level=detail_level,
@@ -157,6 +169,12 @@ class FlowLogger:
         if not self.enabled:
             return
         
+        # Inside begin_query()/end_query(): defer the write until the query ends
+        pending = getattr(self._local, "pending", None)
+        if pending is not None:
+            pending.append(log_entry)
+            return
+        
         try:
             if self._async_writer:
                 # Use async writer for non-blocking writes
@@ -174,6 +192,28 @@ class FlowLogger:
                 exc_info=True
             )
     
+    def begin_query(self) -> None:
+        """
+        Start buffering log entries for the current query.
+        
+        Entries logged until end_query() are kept in memory and written
+        together as a single write. The buffer is per thread, so queries
+        running concurrently on the same logger keep separate buffers.
+        """
+        if self.enabled:
+            self._local.pending = []
+    
+    def end_query(self) -> None:
+        """
+        Write all entries buffered since begin_query() in one write.
+        
+        Safe to call without a matching begin_query().
+        """
+        pending = getattr(self._local, "pending", None)
+        self._local.pending = None
+        if pending:
+            self._write_log("\n".join(pending))
+    
     def log_query_start(
         self,
         query: str,
@@ -314,7 +354,7 @@ class FlowLogger:
     def log_llm_call(
         self,
         model: str,
-        prompt: str,
+        prompt: Union[str, Callable[[], str]],
         response: str,
         duration_seconds: float,
         token_usage: Optional[Dict[str, int]] = None,
@@ -325,7 +365,8 @@ class FlowLogger:
         
         Args:
             model: Model name
-            prompt: Prompt sent to LLM
+            prompt: Prompt sent to LLM, or a callable that builds it only
+                when the entry's detail level shows the prompt
             response: Response from LLM
             duration_seconds: Call duration
             token_usage: Token usage statistics
@@ -355,7 +396,7 @@ class FlowLogger:
         self,
         error_type: str,
         error_message: str,
-        stack_trace: Optional[str] = None
+        stack_trace: Optional[Union[str, Callable[[], str]]] = None
     ) -> None:
         """
         Log an error event.
@@ -363,7 +404,9 @@ class FlowLogger:
         Args:
             error_type: Type of error
             error_message: Error message
-            stack_trace: Optional stack trace
+            stack_trace: Optional stack trace, or a callable that builds it
+                only when the entry's detail level shows it (e.g.
+                traceback.format_exc, passed from inside the except block)
         """
         if not self.enabled:
             return
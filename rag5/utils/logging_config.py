@@ -4,8 +4,11 @@
 提供统一的日志配置和管理功能。
 """
 
+import atexit
 import logging
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 from datetime import datetime
 from typing import Optional
@@ -16,6 +19,8 @@ class RAGLogger:
     RAG系统日志管理器
     
     提供统一的日志配置，支持多种日志级别、文件输出和控制台输出。
+    根日志记录器只挂一个 QueueHandler，控制台和文件的实际写入由后台
+    QueueListener 线程完成，请求线程记录日志时不会阻塞在 I/O 上。
     
     示例:
         >>> from rag5.utils.logging_config import RAGLogger
@@ -35,6 +40,8 @@ class RAGLogger:
     _initialized = False
     _log_file: Optional[str] = None
     _log_level: str = "INFO"
+    _listener: Optional[QueueListener] = None
+    _atexit_registered = False
     
     @staticmethod
     def setup_logging(
@@ -87,15 +94,19 @@ class RAGLogger:
         root_logger = logging.getLogger()
         root_logger.setLevel(getattr(logging, RAGLogger._log_level))
         
-        # 清除现有的处理器
+        # 清除现有的处理器（并停止上一次配置的后台监听线程）
+        RAGLogger._stop_listener()
         root_logger.handlers.clear()
         
+        # 实际输出的处理器，由后台监听线程调用
+        handlers = []
+        
         # 添加控制台处理器
         if enable_console:
             console_handler = logging.StreamHandler(sys.stdout)
             console_handler.setLevel(getattr(logging, RAGLogger._log_level))
             console_handler.setFormatter(formatter)
-            root_logger.addHandler(console_handler)
+            handlers.append(console_handler)
         
         # 添加文件处理器
         if log_file:
@@ -110,7 +121,21 @@ class RAGLogger:
             )
             file_handler.setLevel(getattr(logging, RAGLogger._log_level))
             file_handler.setFormatter(formatter)
-            root_logger.addHandler(file_handler)
+            handlers.append(file_handler)
+        
+        # 请求线程只把日志记录放入队列，由单个监听线程写入各处理器
+        if handlers:
+            log_queue = queue.SimpleQueue()
+            root_logger.addHandler(QueueHandler(log_queue))
+            RAGLogger._listener = QueueListener(
+                log_queue, *handlers, respect_handler_level=True
+            )
+            RAGLogger._listener.start()
+            
+            # 进程退出时停止监听线程，确保队列中的日志全部写出
+            if not RAGLogger._atexit_registered:
+                atexit.register(RAGLogger._stop_listener)
+                RAGLogger._atexit_registered = True
         
         RAGLogger._initialized = True
         
@@ -173,6 +198,11 @@ class RAGLogger:
         for handler in root_logger.handlers:
             handler.setLevel(getattr(logging, RAGLogger._log_level))
         
+        # 后台监听线程持有的实际输出处理器
+        if RAGLogger._listener is not None:
+            for handler in RAGLogger._listener.handlers:
+                handler.setLevel(getattr(logging, RAGLogger._log_level))
+        
         logger = RAGLogger.get_logger("RAGLogger")
         logger.info(f"日志级别已更新为: {RAGLogger._log_level}")
     
@@ -215,11 +245,24 @@ class RAGLogger:
             >>> RAGLogger.reset()
             >>> RAGLogger.setup_logging(log_level="DEBUG")
         """
+        RAGLogger._stop_listener()
         root_logger = logging.getLogger()
         root_logger.handlers.clear()
         RAGLogger._initialized = False
         RAGLogger._log_file = None
         RAGLogger._log_level = "INFO"
+    
+    @staticmethod
+    def _stop_listener() -> None:
+        """停止后台日志监听线程，写出队列中剩余的日志并关闭处理器"""
+        listener = RAGLogger._listener
+        if listener is None:
+            return
+        
+        RAGLogger._listener = None
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
 
 
 def setup_default_logging() -> None:
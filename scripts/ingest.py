@@ -15,11 +15,6 @@ from pathlib import Path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from rag5.config import settings
-from rag5.tools.embeddings import OllamaEmbeddingsManager
-from rag5.tools.vectordb import QdrantManager
-from rag5.ingestion.splitters import RecursiveSplitter
-from rag5.ingestion.vectorizers import BatchVectorizer, VectorUploader
-from rag5.ingestion.pipeline import IngestionPipeline
 
 
 def setup_logging(verbose: bool = False):
@@ -171,6 +166,14 @@ def main():
 
         logger.info("初始化组件...")
 
+        # 延迟导入重量级模块（qdrant_client、langchain 等），
+        # 使 --help / --print-config / --validate-only 无需付出这部分启动开销
+        from rag5.tools.embeddings import OllamaEmbeddingsManager
+        from rag5.tools.vectordb import QdrantManager
+        from rag5.ingestion.splitters import RecursiveSplitter
+        from rag5.ingestion.vectorizers import BatchVectorizer, VectorUploader
+        from rag5.ingestion.pipeline import IngestionPipeline
+
         # 初始化嵌入管理器
         logger.info(f"  - 嵌入模型: {settings.embed_model}")
         embeddings_manager = OllamaEmbeddingsManager(
@@ -186,7 +189,12 @@ def main():
 
         # 初始化 Qdrant 管理器
         logger.info(f"  - Qdrant: {settings.qdrant_url}")
-        qdrant_manager = QdrantManager(url=settings.qdrant_url)
+        qdrant_manager = QdrantManager(
+            url=settings.qdrant_url,
+            prefer_grpc=settings.qdrant_prefer_grpc,
+            grpc_port=settings.qdrant_grpc_port,
+            timeout=settings.qdrant_timeout
+        )
 
         # 测试连接
         if not qdrant_manager.test_connection():
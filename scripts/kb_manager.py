@@ -19,6 +19,7 @@ project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from rag5.config import settings
+from rag5.config.defaults import DEFAULT_KB_QUANTIZATION, DEFAULT_KB_VECTOR_DATATYPE
 from rag5.core.knowledge_base import (
     KnowledgeBaseManager,
     ChunkConfig,
@@ -56,7 +57,12 @@ def get_manager() -> KnowledgeBaseManager:
     Path(db_path).parent.mkdir(parents=True, exist_ok=True)
     
     # 初始化 Qdrant 管理器
-    qdrant_manager = QdrantManager(url=settings.qdrant_url)
+    qdrant_manager = QdrantManager(
+        url=settings.qdrant_url,
+        prefer_grpc=settings.qdrant_prefer_grpc,
+        grpc_port=settings.qdrant_grpc_port,
+        timeout=settings.qdrant_timeout
+    )
     
     # 创建知识库管理器
     manager = KnowledgeBaseManager(
@@ -90,11 +96,14 @@ async def cmd_create(args):
         
         # 解析检索配置
         retrieval_config = None
-        if any([args.top_k, args.similarity_threshold, args.retrieval_mode]):
+        if any([args.top_k, args.similarity_threshold, args.retrieval_mode,
+                args.quantization, args.vector_datatype]):
             retrieval_config = RetrievalConfig(
                 top_k=args.top_k or 5,
                 similarity_threshold=args.similarity_threshold or 0.3,
-                retrieval_mode=args.retrieval_mode or "hybrid"
+                retrieval_mode=args.retrieval_mode or "hybrid",
+                quantization=args.quantization or DEFAULT_KB_QUANTIZATION,
+                vector_datatype=args.vector_datatype or DEFAULT_KB_VECTOR_DATATYPE
             )
         
         # 创建知识库
@@ -222,6 +231,13 @@ async def cmd_get(args):
         print(f"  相似度阈值: {kb.retrieval_config.similarity_threshold}")
         print(f"  向量权重: {kb.retrieval_config.vector_weight}")
         print(f"  启用重排序: {kb.retrieval_config.enable_rerank}")
+        print(f"  向量量化: {kb.retrieval_config.quantization}")
+        print(f"  向量存储类型: {kb.retrieval_config.vector_datatype}")
+        print(
+            f"  HNSW: m={kb.retrieval_config.hnsw_m}, "
+            f"ef_construct={kb.retrieval_config.hnsw_ef_construct}, "
+            f"ef_search={kb.retrieval_config.hnsw_ef_search}"
+        )
         print(f"\n统计信息:")
         print(f"  文档数: {kb.document_count}")
         print(f"  总大小: {kb.total_size:,} 字节")
@@ -356,7 +372,9 @@ async def cmd_delete(args):
             print(f"  总大小: {kb.total_size:,} 字节")
             print("\n此操作不可撤销!")
             
-            confirm = input("\n确认删除? (yes/no): ").strip().lower()
+            # 在线程中读取标准输入，避免阻塞事件循环
+            confirm = await asyncio.to_thread(input, "\n确认删除? (yes/no): ")
+            confirm = confirm.strip().lower()
             if confirm != "yes":
                 print("已取消删除")
                 return 0
@@ -530,7 +548,9 @@ async def cmd_delete_file(args):
             print(f"\n警告: 即将删除文件 (ID: {args.file_id})")
             print("\n此操作不可撤销!")
             
-            confirm = input("\n确认删除? (yes/no): ").strip().lower()
+            # 在线程中读取标准输入，避免阻塞事件循环
+            confirm = await asyncio.to_thread(input, "\n确认删除? (yes/no): ")
+            confirm = confirm.strip().lower()
             if confirm != "yes":
                 print("已取消删除")
                 return 0
@@ -573,23 +593,26 @@ async def cmd_query(args):
             print("\n未找到匹配结果")
             return 0
         
-        print(f"\n查询结果 (共 {len(results)} 个):")
-        print("=" * 80)
+        # 先拼接全部输出再一次性写入，避免每行一次 print
+        lines = [f"\n查询结果 (共 {len(results)} 个):", "=" * 80]
         
         for i, result in enumerate(results, 1):
-            print(f"\n结果 {i}:")
-            print(f"  分数: {result['score']:.4f}")
-            print(f"  来源: {result['source']}")
-            print(f"  文件 ID: {result['file_id']}")
-            print(f"  块索引: {result['chunk_index']}")
-            
             # 显示文本内容
             text = result['text']
             if len(text) > 200 and not args.full:
                 text = text[:200] + "..."
-            print(f"  内容: {text}")
             
-            print("-" * 80)
+            lines.append(
+                f"\n结果 {i}:\n"
+                f"  分数: {result['score']:.4f}\n"
+                f"  来源: {result['source']}\n"
+                f"  文件 ID: {result['file_id']}\n"
+                f"  块索引: {result['chunk_index']}\n"
+                f"  内容: {text}\n"
+                + "-" * 80
+            )
+        
+        sys.stdout.write("\n".join(lines) + "\n")
         
         if args.json:
             print(f"\nJSON 输出:")
@@ -728,6 +751,18 @@ def main():
         choices=['vector', 'fulltext', 'hybrid'],
         help='检索模式（默认: hybrid）'
     )
+    parser_create.add_argument(
+        '--quantization',
+        type=str,
+        choices=['none', 'int8', 'binary'],
+        help=f'向量量化方式（默认: {DEFAULT_KB_QUANTIZATION}）'
+    )
+    parser_create.add_argument(
+        '--vector-datatype',
+        type=str,
+        choices=['float32', 'float16'],
+        help=f'向量存储类型（默认: {DEFAULT_KB_VECTOR_DATATYPE}）'
+    )
     parser_create.set_defaults(func=cmd_create)
     
     # ========== list 命令 ==========
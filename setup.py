@@ -27,7 +27,8 @@ else:
         "langchain-community>=0.0.10",
         "langchain-ollama>=0.1.0",
         "langgraph>=0.0.20",
-        "qdrant-client>=1.7.0",
+        "qdrant-client>=1.10.0",
+        "numpy>=1.21.0",
         "fastapi>=0.109.0",
         "uvicorn>=0.27.0",
         "streamlit>=1.30.0",
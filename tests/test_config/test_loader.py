@@ -0,0 +1,112 @@
+"""
+ConfigLoader .env 解析测试
+"""
+
+import logging
+import os
+
+import pytest
+
+from rag5.config import loader as loader_module
+from rag5.config.loader import ConfigLoader
+
+
+@pytest.fixture(autouse=True)
+def fresh_parse_cache(monkeypatch):
+    """每个测试使用独立的 .env 解析缓存"""
+    monkeypatch.setattr(ConfigLoader, "_parsed_files", {})
+
+
+def _write_env(path, content, mtime_ns=None):
+    path.write_text(content, encoding="utf-8")
+    if mtime_ns is not None:
+        os.utime(path, ns=(mtime_ns, mtime_ns))
+    return str(path)
+
+
+class _FailingRegex:
+    """解析缓存命中时不应再调用正则"""
+
+    def finditer(self, data):
+        raise AssertionError(".env 文件被重复解析")
+
+
+def test_unchanged_file_reuses_parsed_result(tmp_path, monkeypatch):
+    env_file = _write_env(tmp_path / ".env", "RAG5_TEST_A=1\n")
+    assert ConfigLoader().load_env_file(env_file) == {"RAG5_TEST_A": "1"}
+
+    monkeypatch.setattr(loader_module, "_ENV_LINE_RE", _FailingRegex())
+    loader = ConfigLoader()
+    assert loader.load_env_file(env_file) == {"RAG5_TEST_A": "1"}
+    assert loader.get_env("RAG5_TEST_A") == "1"
+
+
+def test_rewritten_file_is_parsed_again(tmp_path):
+    env_path = tmp_path / ".env"
+    env_file = _write_env(env_path, "RAG5_TEST_A=1\n", mtime_ns=1_000_000_000)
+    ConfigLoader().load_env_file(env_file)
+
+    # 大小相同但 mtime 改变，同样视为已修改
+    _write_env(env_path, "RAG5_TEST_A=2\n", mtime_ns=2_000_000_000)
+    assert ConfigLoader().load_env_file(env_file) == {"RAG5_TEST_A": "2"}
+
+    _write_env(env_path, "RAG5_TEST_A=33\n", mtime_ns=2_000_000_000)
+    assert ConfigLoader().load_env_file(env_file) == {"RAG5_TEST_A": "33"}
+
+
+def test_inline_comments_and_quoted_hash(tmp_path):
+    env_file = _write_env(
+        tmp_path / ".env",
+        "# 注释行\n"
+        "\n"
+        "PLAIN=val #comment\n"
+        "NO_SPACE=val#kept\n"
+        "DOUBLE=\"val #kept\"\n"
+        "SINGLE='val #kept'\n"
+        "  INDENTED =  spaced  \n",
+    )
+
+    assert ConfigLoader().load_env_file(env_file) == {
+        "PLAIN": "val",
+        "NO_SPACE": "val#kept",
+        "DOUBLE": "val #kept",
+        "SINGLE": "val #kept",
+        "INDENTED": "spaced",
+    }
+
+
+def test_values_reach_os_environ_only_when_propagated(tmp_path, monkeypatch):
+    # 先 setenv 再 delenv，测试结束时由 monkeypatch 恢复为未设置
+    monkeypatch.setenv("RAG5_TEST_PROPAGATE", "")
+    monkeypatch.delenv("RAG5_TEST_PROPAGATE")
+    env_file = _write_env(tmp_path / ".env", "RAG5_TEST_PROPAGATE=yes\n")
+
+    loader = ConfigLoader()
+    loader.load_env_file(env_file)
+    assert loader.get_env("RAG5_TEST_PROPAGATE") == "yes"
+    assert "RAG5_TEST_PROPAGATE" not in os.environ
+
+    ConfigLoader().load_env_file(env_file, propagate_to_os_environ=True)
+    assert os.environ["RAG5_TEST_PROPAGATE"] == "yes"
+
+
+def test_malformed_lines_report_line_numbers(tmp_path, caplog):
+    env_file = _write_env(
+        tmp_path / ".env",
+        "A=1\n"
+        "# comment\n"
+        "broken line\n"
+        "B=2\n"
+        "\n"
+        "also_broken\n",
+    )
+
+    with caplog.at_level(logging.WARNING, logger=loader_module.__name__):
+        env_vars = ConfigLoader().load_env_file(env_file)
+
+    assert env_vars == {"A": "1", "B": "2"}
+    warnings = [record.getMessage() for record in caplog.records]
+    assert warnings == [
+        ".env 文件第 3 行格式错误: broken line",
+        ".env 文件第 6 行格式错误: also_broken",
+    ]
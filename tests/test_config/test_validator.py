@@ -0,0 +1,53 @@
+"""
+ConfigValidator 快速路径一致性测试
+
+快速路径（pydantic 严格校验）只能接受逐项检查 _check_all 判定为
+无错误、无警告的配置。
+"""
+
+import random
+
+import pytest
+
+from rag5.config.validator import ConfigValidator, _CONFIG_KEYS, _is_valid_config
+
+# 逐项检查与快速路径容易分歧的取值
+_EDGE_VALUES = [
+    None, True, 0, 1, -1, 2 ** 31, 0.0, 0.5, 1.0, 1.5, float('nan'),
+    '', ' ', '\t', '\x1c', '\x1f', '\x85', '\xa0', '　', 'a', ' a ',
+    'http://', 'http://\t', 'http://\n', 'http://\r', 'http:///x', 'http://?',
+    'http://[', 'http://]', 'http://a]', 'http://[::1]:6333', 'http://é',
+    'http://＃', 'localhost:11434', 'https://localhost:6333/x',
+    'sentence', 'hybrid', ['.txt'], [], ['txt'], [1],
+]
+
+_URL_CHARS = 'ab:/?#[]@.%1 \t\n\r\x00\x1c\x7fé＃／'
+
+
+def _assert_fast_path_agrees(config):
+    if _is_valid_config(config):
+        assert ConfigValidator()._check_all(config) == ((), ())
+
+
+@pytest.mark.parametrize('key', _CONFIG_KEYS)
+def test_fast_path_accepts_only_clean_values(key):
+    for value in _EDGE_VALUES:
+        _assert_fast_path_agrees({key: value})
+
+
+def test_fast_path_accepts_only_clean_urls():
+    rng = random.Random(0)
+    for _ in range(20000):
+        url = rng.choice(('http://', 'https://')) + ''.join(
+            rng.choice(_URL_CHARS) for _ in range(rng.randint(0, 6))
+        )
+        _assert_fast_path_agrees({'ollama_host': url, 'qdrant_url': url})
+
+
+@pytest.mark.parametrize('config', [
+    {'ollama_host': 'http://\t'},
+    {'ollama_host': 'http://\n'},
+    {'llm_model': '\x1c'},
+])
+def test_rejects_values_blank_after_normalization(config):
+    assert ConfigValidator().validate_all(config)
@@ -0,0 +1,104 @@
+"""
+SimpleRAGAgent.chat 测试
+
+使用桩执行器代替 LLM 代理，验证问候语快速路径和重试策略。
+"""
+
+import pytest
+from langchain_core.messages import AIMessage
+
+from rag5.core.agent import agent as agent_module
+from rag5.core.agent.agent import SimpleRAGAgent, _GREETING_REPLIES
+from rag5.core.agent.errors import ErrorHandler
+from rag5.core.agent.messages import MessageProcessor
+
+
+class StubExecutor:
+    """按顺序返回结果或抛出异常的代理执行器桩"""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = 0
+
+    def invoke(self, inputs, config=None):
+        self.calls += 1
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, BaseException):
+            raise outcome
+        return outcome
+
+
+def _answer(text):
+    return {"messages": [AIMessage(content=text)]}
+
+
+@pytest.fixture
+def make_agent(monkeypatch):
+    """构造不连接 Ollama、不写日志的代理，重试不等待"""
+    monkeypatch.setattr(agent_module, "_retry_delay", lambda attempt: 0)
+
+    def _make(executor):
+        agent = SimpleRAGAgent.__new__(SimpleRAGAgent)
+        agent._error_handler = ErrorHandler()
+        agent._reflection_logger = None
+        agent._context_logger = None
+        agent._flow_logger = None
+        agent._message_processor = MessageProcessor()
+        agent._agent_executor = executor
+        return agent
+
+    return _make
+
+
+def test_greeting_skips_invoke(make_agent):
+    executor = StubExecutor()
+    agent = make_agent(executor)
+
+    answer = agent.chat("你好！")
+
+    assert answer in _GREETING_REPLIES
+    assert executor.calls == 0
+
+
+def test_greeting_with_history_invokes_agent(make_agent):
+    executor = StubExecutor(_answer("我们刚才在聊项目进度。"))
+    agent = make_agent(executor)
+    history = [
+        {"role": "user", "content": "公司有哪些项目？"},
+        {"role": "assistant", "content": "有Alpha、Beta两个项目"},
+    ]
+
+    answer = agent.chat("你好", chat_history=history)
+
+    assert answer == "我们刚才在聊项目进度。"
+    assert executor.calls == 1
+
+
+def test_value_error_is_not_retried(make_agent):
+    error = ValueError("bad config")
+    executor = StubExecutor(error, _answer("不应返回"))
+    agent = make_agent(executor)
+
+    answer = agent.chat("项目进度如何？")
+
+    assert executor.calls == 1
+    assert answer == ErrorHandler.handle_validation_error(error, "配置")
+
+
+def test_connection_error_is_retried_then_handled(make_agent):
+    error = ConnectionError("Connection refused")
+    executor = StubExecutor(ConnectionError("first"), error)
+    agent = make_agent(executor)
+
+    answer = agent.chat("项目进度如何？")
+
+    assert executor.calls == 2
+    assert answer == ErrorHandler.handle_connection_error(error, "Ollama/Qdrant")
+
+
+def test_connection_error_recovers_on_retry(make_agent):
+    executor = StubExecutor(ConnectionError("first"), _answer("进度正常。"))
+    agent = make_agent(executor)
+
+    assert agent.chat("项目进度如何？") == "进度正常。"
+    assert executor.calls == 2